@@ -7,6 +7,11 @@ from datetime import datetime
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("AgentBase")
 
+
+def resolve_persona(task_data: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """작업 데이터의 persona를 우선 사용하고, 없으면 컨텍스트의 persona를 반환 (없으면 None)"""
+    return task_data.get('persona') or (context.get('persona') if isinstance(context, dict) else None)
+
 class BaseAgent:
     """
     모든 에이전트의 기본 클래스.
@@ -256,10 +256,10 @@ class CoordinatorAgent(BaseAgent):
                     "description": st.get("description"),
                 }
                 sel = self.persona_selector.select(task_meta) if self.persona_selector else None
-                if sel and sel.get("persona"):
-                    st["persona_name"] = sel.get("name")
-                    st["persona"] = sel.get("persona")
-                    st["persona_score"] = sel.get("score")
+                if sel and sel.persona:
+                    st["persona_name"] = sel.name
+                    st["persona"] = sel.persona
+                    st["persona_score"] = sel.score
                     try:
                         logger.info(
                             f"Persona selected for subtask {st.get('subtask_id')}: "
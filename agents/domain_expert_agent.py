@@ -1,4 +1,4 @@
-from .agent_base import BaseAgent
+from .agent_base import BaseAgent, resolve_persona
 from tools.prompt_tool.core import domain_expert_feedback
 from typing import Dict, Any
 
@@ -10,9 +10,5 @@ class DomainExpertAgent(BaseAgent):
         prompt = task_data.get('prompt', '')
         domain = task_data.get('domain', '일반')
         # 페르소나 컨텍스트 지원(없으면 None)
-        persona = None
-        try:
-            persona = task_data.get('persona') or (context.get('persona') if isinstance(context, dict) else None)
-        except Exception:
-            persona = None
+        persona = resolve_persona(task_data, context)
         return domain_expert_feedback(prompt, domain, persona=persona)
\ No newline at end of file
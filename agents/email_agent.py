@@ -7,10 +7,20 @@ email_agent.py - A2A 시스템의 이메일 처리 에이전트
 
 import sys
 import os
+import json
+import asyncio
+import hashlib
 import logging
+import threading
+from enum import Enum
 from typing import Dict, List, Any, Optional, Union
 import openai
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # optional dependency; falls back to stdlib json
+
 # 상위 디렉토리 import를 위한 경로 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
@@ -20,12 +30,87 @@ if parent_dir not in sys.path:
 from agents.agent_base import BaseAgent
 from agents.agent_protocol import AgentMessage, MessageType
 from agents.error_handler import ErrorHandler, NetworkError, APIError, APIRateLimitError, ValidationError
-from utils.prompt_personalizer import build_persona_context, build_personalized_prompt
+from utils.async_runner import run_coroutine_sync
+from utils.prompt_personalizer import build_personalized_prompt
 from configs.prompt_loader import get_prompt_text
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+
+class EmailTaskType(str, Enum):
+    """EmailAgent가 처리하는 작업 유형"""
+    SEARCH = "search_emails"
+    GET_DETAILS = "get_email_details"
+    GENERATE_REPLY = "generate_reply"
+    FULL_PROCESS = "full_process"
+    SEND_REPLY = "send_reply"
+    SAVE_ATTACHMENTS = "save_attachments"
+    DAILY_SUMMARY = "get_daily_email_summary"
+
+
+# 첨부파일 저장 기본 경로 (경로 구분자 포함)
+_ATTACHMENT_BASE_DIR = "/local/path/"
+
+
+def _build_analysis_prompt(email_subject: str, email_from: str, email_date: str,
+                           email_body: str, persona_dict: Optional[Dict[str, Any]]) -> str:
+    """메일 분석용 프롬프트를 생성합니다 (MailAnalysisAgent와 통합 파이프라인 공용)."""
+    preamble = get_prompt_text('email_analysis_preamble', "다음 이메일의 중요도와 의사결정을 분석해주세요.")
+    base_prompt = f"""
+            {preamble}
+            
+            [제목]: {email_subject}
+            [발신자]: {email_from}
+            [날짜]: {email_date}
+            [본문]: {email_body}
+            """
+    return build_personalized_prompt(base_prompt, persona_dict)
+
+
+def _persona_cache_key(persona_dict: Optional[Dict[str, Any]]) -> str:
+    """
+    페르소나 기반 OpenAI prompt_cache_key를 생성합니다.
+    
+    같은 페르소나의 요청은 프롬프트 앞부분(페르소나 지침 + preamble)이 동일하므로,
+    동일한 키로 라우팅해 배치 처리 시 프롬프트 캐시 적중률을 높입니다.
+    """
+    if orjson is not None:
+        canonical = orjson.dumps(persona_dict or {}, option=orjson.OPT_SORT_KEYS, default=str)
+    else:
+        canonical = json.dumps(persona_dict or {}, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    return hashlib.blake2b(canonical, digest_size=8).hexdigest()
+
+
+def _json_loads(text: str) -> Any:
+    """LLM 응답 JSON 파싱 (orjson 우선). 실패 시 json.JSONDecodeError 계열 예외를 발생시킵니다."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _parse_analysis_text(analysis_text: str) -> Dict[str, Any]:
+    """LLM 분석 응답을 결과 딕셔너리로 변환합니다. JSON이 아니면 텍스트에서 추출합니다."""
+    try:
+        analysis_data = _json_loads(analysis_text)
+        return {
+            "status": "success",
+            "analysis": analysis_data.get("summary", "분석 완료"),
+            "importance": analysis_data.get("importance", "일반"),
+            "action": analysis_data.get("action", "참조만 해도 됨"),
+            "reason": analysis_data.get("reason", "분석 완료")
+        }
+    except json.JSONDecodeError:
+        # JSON 파싱 실패 시 텍스트에서 추출
+        return {
+            "status": "success",
+            "analysis": analysis_text[:50] + "..." if len(analysis_text) > 50 else analysis_text,
+            "importance": "일반",
+            "action": "참조만 해도 됨",
+            "reason": "LLM 분석 완료"
+        }
+
+
 class MailSummaryAgent(BaseAgent):
     """
     메일 본문 요약 담당 에이전트
@@ -61,46 +146,21 @@ class MailAnalysisAgent(BaseAgent):
                 persona_dict = task_data.get('persona') or (context.get('persona') if isinstance(context, dict) else None)
             except Exception:
                 persona_dict = None
-            preamble = get_prompt_text('email_analysis_preamble', "다음 이메일의 중요도와 의사결정을 분석해주세요.")
-            base_prompt = f"""
-            {preamble}
-            
-            [제목]: {email_subject}
-            [발신자]: {email_from}
-            [날짜]: {email_date}
-            [본문]: {email_body}
-            """
-            prompt = build_personalized_prompt(base_prompt, persona_dict)
+            prompt = _build_analysis_prompt(email_subject, email_from, email_date, email_body, persona_dict)
             
+            # 구버전 SDK 호환을 위해 extra_body로 prompt_cache_key 전달
             response = client.chat.completions.create(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=300,
                 temperature=0.3,
+                extra_body={"prompt_cache_key": _persona_cache_key(persona_dict)},
             )
             
             analysis_text = response.choices[0].message.content.strip()
             
             # JSON 파싱 시도
-            try:
-                import json
-                analysis_data = json.loads(analysis_text)
-                return {
-                    "status": "success",
-                    "analysis": analysis_data.get("summary", "분석 완료"),
-                    "importance": analysis_data.get("importance", "일반"),
-                    "action": analysis_data.get("action", "참조만 해도 됨"),
-                    "reason": analysis_data.get("reason", "분석 완료")
-                }
-            except json.JSONDecodeError:
-                # JSON 파싱 실패 시 텍스트에서 추출
-                return {
-                    "status": "success",
-                    "analysis": analysis_text[:50] + "..." if len(analysis_text) > 50 else analysis_text,
-                    "importance": "일반",
-                    "action": "참조만 해도 됨",
-                    "reason": "LLM 분석 완료"
-                }
+            return _parse_analysis_text(analysis_text)
                 
         except Exception as e:
             logger.error(f"메일 분석 실패: {e}")
@@ -118,9 +178,10 @@ class MailAttachmentAgent(BaseAgent):
     메일 첨부파일 추출/저장 담당 에이전트
     """
     def process_task(self, task_data: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        # TODO: 첨부파일 추출/저장 구현
+        # TODO: 첨부파일 추출/저장 구현 (실제 저장 시 ThreadPoolExecutor로 병렬 쓰기)
         attachments = task_data.get("attachments", [])
-        return {"status": "success", "saved_files": [f"/local/path/{a['filename']}" for a in attachments]}
+        base = _ATTACHMENT_BASE_DIR
+        return {"status": "success", "saved_files": [base + a["filename"] for a in attachments]}
 
 class MailContextAgent(BaseAgent):
     """
@@ -150,7 +211,8 @@ class EmailAgent(BaseAgent):
     
     def __init__(self, agent_id: str = None, name: str = "EmailSpecialist",
                  specialization: str = "email_processing", 
-                 tools: List[str] = None):
+                 tools: List[str] = None,
+                 warmup_personas: Optional[List[Dict[str, Any]]] = None):
         """
         이메일 처리 에이전트 초기화
         
@@ -159,23 +221,106 @@ class EmailAgent(BaseAgent):
             name: 에이전트 이름
             specialization: 전문 영역
             tools: 사용할 도구 목록
+            warmup_personas: 프롬프트 캐시를 미리 데워둘 페르소나 목록 (없으면 비활성)
         """
         # 기본 에이전트 초기화
         super().__init__(agent_id=agent_id, name=name, specialization=specialization)
         
-        # 도구 로드
-        self.loaded_tools = {}
+        # 도구 로드 (첫 사용 시점까지 import 지연)
+        self._loaded_tools: Dict[str, Dict[str, Any]] = {}
         
         # 기본 도구 목록
         if tools is None:
             # 기본적으로 email_tool 도구를 로드
             tools = ["email_tool"]
         
-        self.load_tools(tools)
+        self._pending_tools: List[str] = list(tools)
+        
+        # 작업 유형별 처리 메서드
+        self._task_handlers = {
+            EmailTaskType.SEARCH: self._handle_search_emails,
+            EmailTaskType.GET_DETAILS: self._handle_get_email_details,
+            EmailTaskType.GENERATE_REPLY: self._handle_generate_reply,
+            EmailTaskType.FULL_PROCESS: self._handle_full_process,
+            EmailTaskType.SEND_REPLY: self._handle_send_reply,
+            EmailTaskType.SAVE_ATTACHMENTS: self._handle_save_attachments,
+            EmailTaskType.DAILY_SUMMARY: self._handle_get_daily_email_summary,
+        }
         
         # 메시지 핸들러 등록
         self.register_callback(MessageType.TASK_REQUEST.value, self._handle_task_request)
         self.register_callback(MessageType.QUERY.value, self._handle_query)
+        
+        # 프롬프트 캐시 워밍업 (트래픽이 많은 페르소나에 한해 선택적으로 사용)
+        self._warmup_stop: Optional[threading.Event] = None
+        if warmup_personas:
+            self.start_prompt_cache_warmup(warmup_personas)
+    
+    def start_prompt_cache_warmup(self, personas: List[Dict[str, Any]], interval: float = 240.0) -> None:
+        """
+        페르소나별 분석 프롬프트 접두부로 주기적으로 최소 요청을 보내 OpenAI 프롬프트 캐시를 유지합니다.
+        
+        프롬프트 캐시는 약 5분간 요청이 없으면 만료되므로, 기본 4분 간격으로
+        max_tokens=1 요청을 백그라운드 데몬 스레드에서 보냅니다.
+        
+        Args:
+            personas: 워밍업할 페르소나 목록
+            interval: 워밍업 주기(초)
+        """
+        self.stop_prompt_cache_warmup()
+        stop_event = threading.Event()
+        self._warmup_stop = stop_event
+        thread = threading.Thread(
+            target=self._prompt_cache_warmup_loop,
+            args=(list(personas), interval, stop_event),
+            name=f"{self.agent_id}-prompt-cache-warmup",
+            daemon=True
+        )
+        thread.start()
+    
+    def stop_prompt_cache_warmup(self) -> None:
+        """실행 중인 프롬프트 캐시 워밍업을 중지합니다."""
+        if self._warmup_stop is not None:
+            self._warmup_stop.set()
+            self._warmup_stop = None
+    
+    def _prompt_cache_warmup_loop(self, personas: List[Dict[str, Any]], interval: float,
+                                  stop_event: threading.Event) -> None:
+        from openai import OpenAI
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            logger.warning("OPENAI_API_KEY가 없어 프롬프트 캐시 워밍업을 건너뜁니다.")
+            return
+        client = OpenAI(api_key=api_key)
+        # 실제 분석 요청과 바이트 단위로 같은 접두부(페르소나 지침 + preamble)를 사용
+        prefixes = [
+            (_build_analysis_prompt("", "", "", "", persona), _persona_cache_key(persona))
+            for persona in personas
+        ]
+        while not stop_event.is_set():
+            for prompt, cache_key in prefixes:
+                try:
+                    client.chat.completions.create(
+                        model="gpt-4o",
+                        messages=[{"role": "user", "content": prompt}],
+                        max_tokens=1,
+                        extra_body={"prompt_cache_key": cache_key},
+                    )
+                except Exception as e:
+                    logger.warning(f"프롬프트 캐시 워밍업 실패: {e}")
+            stop_event.wait(interval)
+    
+    @property
+    def loaded_tools(self) -> Dict[str, Dict[str, Any]]:
+        """
+        로드된 도구 정보. 처음 접근할 때 대기 중인 도구 모듈을 import합니다.
+        
+        쿼리만 처리하는 인스턴스는 무거운 도구 모듈(IMAP, Google SDK 등)을 import하지 않습니다.
+        """
+        if self._pending_tools:
+            pending, self._pending_tools = self._pending_tools, []
+            self.load_tools(pending)
+        return self._loaded_tools
     
     def load_tools(self, tool_names: List[str]) -> None:
         """
@@ -204,6 +349,341 @@ class EmailAgent(BaseAgent):
             except (ImportError, AttributeError) as e:
                 logger.error(f"도구 '{tool_name}' 로드 실패: {str(e)}")
     
+    async def process_email_pipeline(self, email: Dict[str, Any],
+                                     persona: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        메일 한 건에 대해 요약/분석/히스토리 분석을 동시에 수행한 뒤 답장 초안을 생성합니다.
+        
+        세 단계는 서로 독립적인 LLM 호출이므로 asyncio.gather로 병렬 실행하고,
+        그 결과를 답장 생성 단계에 전달합니다.
+        
+        Args:
+            email: 메일 정보 (subject, body, from, date, history, tone, extra_instruction)
+            persona: 프롬프트에 병합할 페르소나 (선택)
+            
+        Returns:
+            summary, analysis, context, reply를 담은 결과 딕셔너리
+        """
+        from openai import AsyncOpenAI
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            raise APIError("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.", api_name="openai")
+        # 비동기 클라이언트는 이벤트 루프에 묶이므로 파이프라인 실행 단위로 생성/종료
+        client = AsyncOpenAI(api_key=api_key)
+        cache_key = _persona_cache_key(persona)
+        try:
+            summary, analysis, ctx = await asyncio.gather(
+                self._summary_async(client, email, persona, cache_key),
+                self._analysis_async(client, email, persona, cache_key),
+                self._context_async(client, email, persona, cache_key),
+            )
+            reply = await self._reply_async(client, email, persona, cache_key, summary, analysis, ctx)
+        finally:
+            await client.close()
+        return {
+            "summary": summary,
+            "analysis": analysis,
+            "context": ctx,
+            "reply": reply
+        }
+    
+    async def _chat_async(self, client: Any, prompt: str, max_tokens: int, temperature: float,
+                          cache_key: str) -> str:
+        """비동기 클라이언트로 단일 프롬프트 응답을 생성합니다."""
+        response = await client.chat.completions.create(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=temperature,
+            extra_body={"prompt_cache_key": cache_key},
+        )
+        return response.choices[0].message.content.strip()
+    
+    async def _summary_async(self, client: Any, email: Dict[str, Any],
+                             persona: Optional[Dict[str, Any]], cache_key: str) -> str:
+        body = email.get("body", "")
+        try:
+            base_prompt = f"""
+            다음 이메일의 핵심 내용을 3문장 이내로 요약해줘.
+            
+            [제목]: {email.get("subject", "")}
+            [본문]: {body}
+            """
+            prompt = build_personalized_prompt(base_prompt, persona)
+            return await self._chat_async(client, prompt, max_tokens=200, temperature=0.3, cache_key=cache_key)
+        except Exception as e:
+            logger.error(f"메일 요약 실패: {e}")
+            return f"{body[:50]}... (요약 실패)"
+    
+    async def _analysis_async(self, client: Any, email: Dict[str, Any],
+                              persona: Optional[Dict[str, Any]], cache_key: str) -> Dict[str, Any]:
+        body = email.get("body", "")
+        try:
+            prompt = _build_analysis_prompt(
+                email.get("subject", ""), email.get("from", ""), email.get("date", ""), body, persona
+            )
+            analysis_text = await self._chat_async(client, prompt, max_tokens=300, temperature=0.3, cache_key=cache_key)
+            return _parse_analysis_text(analysis_text)
+        except Exception as e:
+            logger.error(f"메일 분석 실패: {e}")
+            return {
+                "status": "success",
+                "analysis": f"{body[:50]}... (분석 실패)",
+                "importance": "일반",
+                "action": "참조만 해도 됨",
+                "reason": f"분석 실패: {str(e)}"
+            }
+    
+    async def _context_async(self, client: Any, email: Dict[str, Any],
+                             persona: Optional[Dict[str, Any]], cache_key: str) -> str:
+        history = email.get("history", "")
+        if not history:
+            # 히스토리가 없으면 LLM 호출 없이 반환
+            return ""
+        try:
+            base_prompt = f"""
+            다음 메일 스레드의 과거 대화를 분석해 답장 작성 시 참고할 맥락을 정리해줘.
+            
+            [원본 메일 제목]: {email.get("subject", "")}
+            [과거 히스토리]: {history}
+            """
+            prompt = build_personalized_prompt(base_prompt, persona)
+            return await self._chat_async(client, prompt, max_tokens=300, temperature=0.3, cache_key=cache_key)
+        except Exception as e:
+            logger.error(f"메일 히스토리 분석 실패: {e}")
+            return str(history)
+    
+    async def _reply_async(self, client: Any, email: Dict[str, Any], persona: Optional[Dict[str, Any]],
+                           cache_key: str, summary: str, analysis: Dict[str, Any], ctx: str) -> str:
+        try:
+            preamble = get_prompt_text('email_reply_preamble', "아래 메일에 대한 답장 초안을 작성해줘.")
+            base_prompt = f"""
+            {preamble}
+            
+            [요청 톤]: {email.get("tone", "")}
+            [원본 메일 제목]: {email.get("subject", "")}
+            [원본 메일 본문]: {email.get("body", "")}
+            [발신자]: {email.get("from", "")}
+            [메일 요약]: {summary}
+            [중요도/조치]: {analysis.get("importance", "")} / {analysis.get("action", "")}
+            [히스토리 맥락]: {ctx}
+            [추가 지시사항]: {email.get("extra_instruction", "")}
+            """
+            prompt = build_personalized_prompt(base_prompt, persona)
+            return await self._chat_async(client, prompt, max_tokens=500, temperature=0.7, cache_key=cache_key)
+        except Exception as e:
+            logger.error(f"LLM 답장 생성 실패: {e}")
+            return f"[LLM 답장 생성 실패] {e}"
+    
+    def _handle_search_emails(self, task_data: Dict[str, Any], message: AgentMessage) -> Dict[str, Any]:
+        """이메일 검색 작업을 처리합니다."""
+        # 이메일 검색 작업 처리
+        keywords = task_data.get("keywords")
+        subject = task_data.get("subject")
+        date_on = task_data.get("date_on")
+        date_after = task_data.get("date_after")
+        date_before = task_data.get("date_before")
+        mail_folder = task_data.get("mail_folder", "inbox")
+        max_results = task_data.get("max_results", 10)
+
+        # email_tool의 search_emails 함수 호출
+        if "email_tool" in self.loaded_tools and "search_emails" in self.loaded_tools["email_tool"]["functions"]:
+            try:
+                # 지수 백오프를 사용한 재시도 로직 적용
+                return ErrorHandler.retry_call(
+                    self.loaded_tools["email_tool"]["functions"]["search_emails"],
+                    kwargs={
+                        "keywords": keywords,
+                        "subject": subject,
+                        "date_on": date_on,
+                        "date_after": date_after,
+                        "date_before": date_before,
+                        "mail_folder": mail_folder,
+                        "max_results": max_results
+                    },
+                    max_retries=3,
+                    exceptions=(NetworkError, APIError),
+                    check=bool,
+                    error_message="이메일 검색에 실패했습니다.",
+                    api_name="search_emails"
+                )
+            except (NetworkError, APIError) as e:
+                logger.warning(f"이메일 검색 중 오류 발생: {str(e)}")
+                raise
+        else:
+            raise APIError("search_emails 도구를 찾을 수 없습니다.", api_name="email_tool")
+    
+    def _handle_get_email_details(self, task_data: Dict[str, Any], message: AgentMessage) -> Dict[str, Any]:
+        """이메일 상세 조회 작업을 처리합니다."""
+        # 이메일 상세 조회 작업 처리
+        email_id = task_data.get("email_id")
+        mail_folder = task_data.get("mail_folder", "inbox")
+
+        if not email_id:
+            raise ValidationError("이메일 ID가 제공되지 않았습니다.", field="email_id")
+
+        # email_tool의 get_email_details 함수 호출
+        if "email_tool" in self.loaded_tools and "get_email_details" in self.loaded_tools["email_tool"]["functions"]:
+            try:
+                # 지수 백오프를 사용한 재시도 로직 적용
+                return ErrorHandler.retry_call(
+                    self.loaded_tools["email_tool"]["functions"]["get_email_details"],
+                    kwargs={"email_id": email_id, "mail_folder": mail_folder},
+                    max_retries=3,
+                    exceptions=(NetworkError, APIError),
+                    check=bool,
+                    error_message="이메일 상세 정보 조회에 실패했습니다.",
+                    api_name="get_email_details"
+                )
+            except (NetworkError, APIError) as e:
+                logger.warning(f"이메일 상세 정보 조회 중 오류 발생: {str(e)}")
+                raise
+        else:
+            raise APIError("get_email_details 도구를 찾을 수 없습니다.", api_name="email_tool")
+    
+    def _handle_generate_reply(self, task_data: Dict[str, Any], message: AgentMessage) -> Dict[str, Any]:
+        """LLM 답장 초안 생성 작업을 처리합니다."""
+        subject = task_data.get("subject", "")
+        body = task_data.get("body", "")
+        sender = task_data.get("from", "")
+        history = task_data.get("history", "")
+        tone = task_data.get("tone", "")
+        extra = task_data.get("extra_instruction", "")
+        try:
+            from openai import OpenAI
+            import os
+            api_key = os.environ.get("OPENAI_API_KEY")
+            if not api_key:
+                raise Exception("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
+            client = OpenAI(api_key=api_key)
+            # 페르소나 딕셔너리 추출 (task_data 우선, 없으면 message.context)
+            persona_dict = None
+            try:
+                persona_dict = task_data.get('persona') or (message.content.get('context', {}).get('persona') if isinstance(message.content.get('context'), dict) else None)
+            except Exception:
+                persona_dict = None
+            preamble = get_prompt_text('email_reply_preamble', "아래 메일에 대한 답장 초안을 작성해줘.")
+            base_prompt = f"""
+            {preamble}
+            
+            [요청 톤]: {tone}
+            [원본 메일 제목]: {subject}
+            [원본 메일 본문]: {body}
+            [발신자]: {sender}
+            [과거 히스토리]: {history}
+            [추가 지시사항]: {extra}
+            """
+            # 일관된 프롬프트 병합 유틸 사용
+            prompt = build_personalized_prompt(base_prompt, persona_dict)
+            response = client.chat.completions.create(
+                model="gpt-4o",
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=500,
+                temperature=0.7,
+            )
+            reply = response.choices[0].message.content.strip()
+        except Exception as e:
+            logger.error(f"LLM 답장 생성 실패: {e}")
+            reply = f"[LLM 답장 생성 실패] {e}"
+        return {"reply": reply}
+    
+    def _handle_full_process(self, task_data: Dict[str, Any], message: AgentMessage) -> Dict[str, Any]:
+        """메일 통합 처리(요약/분석/히스토리 → 답장) 작업을 처리합니다."""
+        # 요약/분석/히스토리 분석 병렬 수행 후 답장 초안 생성
+        email = task_data.get("email") or task_data
+        persona_dict = task_data.get("persona")
+        if not (email.get("body") or email.get("subject")):
+            raise ValidationError("처리할 메일 내용이 없습니다.", field="email")
+        return run_coroutine_sync(self.process_email_pipeline(email, persona_dict))
+    
+    def _handle_send_reply(self, task_data: Dict[str, Any], message: AgentMessage) -> Dict[str, Any]:
+        """이메일 답장 전송 작업을 처리합니다."""
+        # 이메일 답장 작업 처리
+        email_id = task_data.get("email_id")
+        reply_body = task_data.get("reply_body")
+        mail_folder = task_data.get("mail_folder", "inbox")
+
+        if not email_id:
+            raise ValidationError("이메일 ID가 제공되지 않았습니다.", field="email_id")
+        if not reply_body:
+            raise ValidationError("답장 내용이 제공되지 않았습니다.", field="reply_body")
+
+        # email_tool의 send_reply 함수 호출
+        if "email_tool" in self.loaded_tools and "send_reply" in self.loaded_tools["email_tool"]["functions"]:
+            try:
+                # 지수 백오프를 사용한 재시도 로직 적용
+                return ErrorHandler.retry_call(
+                    self.loaded_tools["email_tool"]["functions"]["send_reply"],
+                    kwargs={"email_id": email_id, "reply_body": reply_body, "mail_folder": mail_folder},
+                    max_retries=3,
+                    exceptions=(NetworkError, APIError),
+                    check=bool,
+                    error_message="이메일 답장 전송에 실패했습니다.",
+                    api_name="send_reply"
+                )
+            except (NetworkError, APIError) as e:
+                logger.warning(f"이메일 답장 전송 중 오류 발생: {str(e)}")
+                raise
+        else:
+            raise APIError("send_reply 도구를 찾을 수 없습니다.", api_name="email_tool")
+    
+    def _handle_save_attachments(self, task_data: Dict[str, Any], message: AgentMessage) -> Dict[str, Any]:
+        """첨부파일 저장 작업을 처리합니다."""
+        # 이메일 첨부파일 저장 작업 처리
+        email_id = task_data.get("email_id")
+        save_path = task_data.get("save_path")
+        mail_folder = task_data.get("mail_folder", "inbox")
+
+        if not email_id:
+            raise ValidationError("이메일 ID가 제공되지 않았습니다.", field="email_id")
+        if not save_path:
+            raise ValidationError("저장 경로가 제공되지 않았습니다.", field="save_path")
+
+        # email_tool의 save_attachments 함수 호출
+        if "email_tool" in self.loaded_tools and "save_attachments" in self.loaded_tools["email_tool"]["functions"]:
+            try:
+                # 지수 백오프를 사용한 재시도 로직 적용
+                return ErrorHandler.retry_call(
+                    self.loaded_tools["email_tool"]["functions"]["save_attachments"],
+                    kwargs={"email_id": email_id, "save_path": save_path, "mail_folder": mail_folder},
+                    max_retries=3,
+                    exceptions=(NetworkError, APIError),
+                    check=bool,
+                    error_message="첨부파일 저장에 실패했습니다.",
+                    api_name="save_attachments"
+                )
+            except (NetworkError, APIError) as e:
+                logger.warning(f"첨부파일 저장 중 오류 발생: {str(e)}")
+                raise
+        else:
+            raise APIError("save_attachments 도구를 찾을 수 없습니다.", api_name="email_tool")
+    
+    def _handle_get_daily_email_summary(self, task_data: Dict[str, Any], message: AgentMessage) -> Dict[str, Any]:
+        """일일 이메일 요약 작업을 처리합니다."""
+        # 일일 이메일 요약 작업 처리
+        days_ago = task_data.get("days_ago", 0)
+        mail_folder = task_data.get("mail_folder", "inbox")
+        max_results = task_data.get("max_results", 20)
+
+        # email_tool의 get_daily_email_summary 함수 호출
+        if "email_tool" in self.loaded_tools and "get_daily_email_summary" in self.loaded_tools["email_tool"]["functions"]:
+            try:
+                # 지수 백오프를 사용한 재시도 로직 적용
+                return ErrorHandler.retry_call(
+                    self.loaded_tools["email_tool"]["functions"]["get_daily_email_summary"],
+                    kwargs={"days_ago": days_ago, "mail_folder": mail_folder, "max_results": max_results},
+                    max_retries=3,
+                    exceptions=(NetworkError, APIError),
+                    check=bool,
+                    error_message="이메일 요약 생성에 실패했습니다.",
+                    api_name="get_daily_email_summary"
+                )
+            except (NetworkError, APIError) as e:
+                logger.warning(f"이메일 요약 생성 중 오류 발생: {str(e)}")
+                raise
+        else:
+            raise APIError("get_daily_email_summary 도구를 찾을 수 없습니다.", api_name="email_tool")
+    
     def _handle_task_request(self, message: AgentMessage) -> Dict[str, Any]:
         """
         작업 요청 메시지를 처리합니다.
@@ -216,7 +696,6 @@ class EmailAgent(BaseAgent):
         """
         try:
             task_data = message.content.get("task_data", {})
-            response_data = {}
             
             # 작업 유형 검증
             task_type = task_data.get("type", "")
@@ -225,221 +704,11 @@ class EmailAgent(BaseAgent):
                 
             logger.info(f"이메일 작업 처리 시작: {task_type}")
             
-            if task_type == "search_emails":
-                # 이메일 검색 작업 처리
-                keywords = task_data.get("keywords")
-                subject = task_data.get("subject")
-                date_on = task_data.get("date_on")
-                date_after = task_data.get("date_after")
-                date_before = task_data.get("date_before")
-                mail_folder = task_data.get("mail_folder", "inbox")
-                max_results = task_data.get("max_results", 10)
-                
-                # email_tool의 search_emails 함수 호출
-                if "email_tool" in self.loaded_tools and "search_emails" in self.loaded_tools["email_tool"]["functions"]:
-                    try:
-                        # 지수 백오프를 사용한 재시도 로직 적용
-                        def search_with_retry():
-                            search_fn = self.loaded_tools["email_tool"]["functions"]["search_emails"]
-                            result = search_fn(
-                                keywords=keywords,
-                                subject=subject,
-                                date_on=date_on,
-                                date_after=date_after,
-                                date_before=date_before,
-                                mail_folder=mail_folder,
-                                max_results=max_results
-                            )
-                            if not result:
-                                raise APIError("이메일 검색에 실패했습니다.", api_name="search_emails")
-                            return result
-                        
-                        result = ErrorHandler.retry_with_backoff(
-                            search_with_retry,
-                            max_retries=3,
-                            exceptions=(NetworkError, APIError)
-                        )
-                        response_data = result
-                    except (NetworkError, APIError) as e:
-                        logger.warning(f"이메일 검색 중 오류 발생: {str(e)}")
-                        raise
-                else:
-                    raise APIError("search_emails 도구를 찾을 수 없습니다.", api_name="email_tool")
-            
-            elif task_type == "get_email_details":
-                # 이메일 상세 조회 작업 처리
-                email_id = task_data.get("email_id")
-                mail_folder = task_data.get("mail_folder", "inbox")
-                
-                if not email_id:
-                    raise ValidationError("이메일 ID가 제공되지 않았습니다.", field="email_id")
-                
-                # email_tool의 get_email_details 함수 호출
-                if "email_tool" in self.loaded_tools and "get_email_details" in self.loaded_tools["email_tool"]["functions"]:
-                    try:
-                        # 지수 백오프를 사용한 재시도 로직 적용
-                        def get_details_with_retry():
-                            get_details_fn = self.loaded_tools["email_tool"]["functions"]["get_email_details"]
-                            result = get_details_fn(email_id=email_id, mail_folder=mail_folder)
-                            if not result:
-                                raise APIError("이메일 상세 정보 조회에 실패했습니다.", api_name="get_email_details")
-                            return result
-                            
-                        result = ErrorHandler.retry_with_backoff(
-                            get_details_with_retry,
-                            max_retries=3,
-                            exceptions=(NetworkError, APIError)
-                        )
-                        response_data = result
-                    except (NetworkError, APIError) as e:
-                        logger.warning(f"이메일 상세 정보 조회 중 오류 발생: {str(e)}")
-                        raise
-                else:
-                    raise APIError("get_email_details 도구를 찾을 수 없습니다.", api_name="email_tool")
-            
-            elif task_type == "generate_reply":
-                subject = task_data.get("subject", "")
-                body = task_data.get("body", "")
-                sender = task_data.get("from", "")
-                history = task_data.get("history", "")
-                tone = task_data.get("tone", "")
-                extra = task_data.get("extra_instruction", "")
-                try:
-                    from openai import OpenAI
-                    import os
-                    api_key = os.environ.get("OPENAI_API_KEY")
-                    if not api_key:
-                        raise Exception("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
-                    client = OpenAI(api_key=api_key)
-                    # 페르소나 딕셔너리 추출 (task_data 우선, 없으면 message.context)
-                    persona_dict = None
-                    try:
-                        persona_dict = task_data.get('persona') or (message.content.get('context', {}).get('persona') if isinstance(message.content.get('context'), dict) else None)
-                    except Exception:
-                        persona_dict = None
-                    preamble = get_prompt_text('email_reply_preamble', "아래 메일에 대한 답장 초안을 작성해줘.")
-                    base_prompt = f"""
-                    {preamble}
-                    
-                    [요청 톤]: {tone}
-                    [원본 메일 제목]: {subject}
-                    [원본 메일 본문]: {body}
-                    [발신자]: {sender}
-                    [과거 히스토리]: {history}
-                    [추가 지시사항]: {extra}
-                    """
-                    # 일관된 프롬프트 병합 유틸 사용
-                    prompt = build_personalized_prompt(base_prompt, persona_dict)
-                    response = client.chat.completions.create(
-                        model="gpt-4o",
-                        messages=[{"role": "user", "content": prompt}],
-                        max_tokens=500,
-                        temperature=0.7,
-                    )
-                    reply = response.choices[0].message.content.strip()
-                except Exception as e:
-                    logger.error(f"LLM 답장 생성 실패: {e}")
-                    reply = f"[LLM 답장 생성 실패] {e}"
-                response_data = {"reply": reply}
-            elif task_type == "send_reply":
-                # 이메일 답장 작업 처리
-                email_id = task_data.get("email_id")
-                reply_body = task_data.get("reply_body")
-                mail_folder = task_data.get("mail_folder", "inbox")
-                
-                if not email_id:
-                    raise ValidationError("이메일 ID가 제공되지 않았습니다.", field="email_id")
-                if not reply_body:
-                    raise ValidationError("답장 내용이 제공되지 않았습니다.", field="reply_body")
-                
-                # email_tool의 send_reply 함수 호출
-                if "email_tool" in self.loaded_tools and "send_reply" in self.loaded_tools["email_tool"]["functions"]:
-                    try:
-                        # 지수 백오프를 사용한 재시도 로직 적용
-                        def send_reply_with_retry():
-                            reply_fn = self.loaded_tools["email_tool"]["functions"]["send_reply"]
-                            result = reply_fn(email_id=email_id, reply_body=reply_body, mail_folder=mail_folder)
-                            if not result:
-                                raise APIError("이메일 답장 전송에 실패했습니다.", api_name="send_reply")
-                            return result
-                            
-                        result = ErrorHandler.retry_with_backoff(
-                            send_reply_with_retry,
-                            max_retries=3,
-                            exceptions=(NetworkError, APIError)
-                        )
-                        response_data = result
-                    except (NetworkError, APIError) as e:
-                        logger.warning(f"이메일 답장 전송 중 오류 발생: {str(e)}")
-                        raise
-                else:
-                    raise APIError("send_reply 도구를 찾을 수 없습니다.", api_name="email_tool")
-            
-            elif task_type == "save_attachments":
-                # 이메일 첨부파일 저장 작업 처리
-                email_id = task_data.get("email_id")
-                save_path = task_data.get("save_path")
-                mail_folder = task_data.get("mail_folder", "inbox")
-                
-                if not email_id:
-                    raise ValidationError("이메일 ID가 제공되지 않았습니다.", field="email_id")
-                if not save_path:
-                    raise ValidationError("저장 경로가 제공되지 않았습니다.", field="save_path")
-                
-                # email_tool의 save_attachments 함수 호출
-                if "email_tool" in self.loaded_tools and "save_attachments" in self.loaded_tools["email_tool"]["functions"]:
-                    try:
-                        # 지수 백오프를 사용한 재시도 로직 적용
-                        def save_attachments_with_retry():
-                            save_fn = self.loaded_tools["email_tool"]["functions"]["save_attachments"]
-                            result = save_fn(email_id=email_id, save_path=save_path, mail_folder=mail_folder)
-                            if not result:
-                                raise APIError("첨부파일 저장에 실패했습니다.", api_name="save_attachments")
-                            return result
-                            
-                        result = ErrorHandler.retry_with_backoff(
-                            save_attachments_with_retry,
-                            max_retries=3,
-                            exceptions=(NetworkError, APIError)
-                        )
-                        response_data = result
-                    except (NetworkError, APIError) as e:
-                        logger.warning(f"첨부파일 저장 중 오류 발생: {str(e)}")
-                        raise
-                else:
-                    raise APIError("save_attachments 도구를 찾을 수 없습니다.", api_name="email_tool")
-            
-            elif task_type == "get_daily_email_summary":
-                # 일일 이메일 요약 작업 처리
-                days_ago = task_data.get("days_ago", 0)
-                mail_folder = task_data.get("mail_folder", "inbox")
-                max_results = task_data.get("max_results", 20)
-                
-                # email_tool의 get_daily_email_summary 함수 호출
-                if "email_tool" in self.loaded_tools and "get_daily_email_summary" in self.loaded_tools["email_tool"]["functions"]:
-                    try:
-                        # 지수 백오프를 사용한 재시도 로직 적용
-                        def get_summary_with_retry():
-                            summary_fn = self.loaded_tools["email_tool"]["functions"]["get_daily_email_summary"]
-                            result = summary_fn(days_ago=days_ago, mail_folder=mail_folder, max_results=max_results)
-                            if not result:
-                                raise APIError("이메일 요약 생성에 실패했습니다.", api_name="get_daily_email_summary")
-                            return result
-                            
-                        result = ErrorHandler.retry_with_backoff(
-                            get_summary_with_retry,
-                            max_retries=3,
-                            exceptions=(NetworkError, APIError)
-                        )
-                        response_data = result
-                    except (NetworkError, APIError) as e:
-                        logger.warning(f"이메일 요약 생성 중 오류 발생: {str(e)}")
-                        raise
-                else:
-                    raise APIError("get_daily_email_summary 도구를 찾을 수 없습니다.", api_name="email_tool")
-            
-            else:
+            try:
+                handler = self._task_handlers[EmailTaskType(task_type)]
+            except (KeyError, ValueError):
                 raise ValidationError(f"지원하지 않는 작업 유형입니다: {task_type}", field="type")
+            response_data = handler(task_data, message)
             
             # 응답 반환
             return {
@@ -527,7 +796,8 @@ class EmailAgent(BaseAgent):
                             "이메일 상세 조회",
                             "이메일 답장 보내기",
                             "이메일 첨부파일 저장",
-                            "일일 이메일 요약"
+                            "일일 이메일 요약",
+                            "메일 통합 처리(요약/분석/답장)"
                         ]
                     }
                 }
@@ -4,8 +4,13 @@
 이 모듈은 A2A 시스템에서 발생할 수 있는 다양한 오류를 처리하고 관리합니다.
 """
 
+import asyncio
+import inspect
 import logging
-from typing import Dict, Any, Optional
+import random
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, Optional, Callable, Hashable
 import traceback
 import time
 from enum import Enum
@@ -111,9 +116,68 @@ class ValidationError(AgentError):
         )
 
 
+class SingleFlight:
+    """
+    동일한 키로 동시에 들어온 호출을 하나로 합치는 헬퍼 (single-flight 패턴).
+    
+    먼저 들어온 호출만 실제로 함수를 실행하고, 실행 중에 같은 키로 들어온 호출은
+    그 결과(또는 예외)를 그대로 공유받습니다. 완료 후에는 키가 제거되므로 캐시가 아닙니다.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, Future] = {}
+    
+    def do(self, key: Hashable, func: Callable, *args, **kwargs) -> Any:
+        """
+        key로 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 func(*args, **kwargs)를 실행합니다.
+        
+        Args:
+            key: 동일 요청 판별 키
+            func: 실행할 함수
+            
+        Returns:
+            func의 반환값 (동시 호출자들은 같은 객체를 공유)
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_leader:
+            return future.result()
+        
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+
 class ErrorHandler:
     """오류 처리 및 관리 클래스"""
     
+    @staticmethod
+    def _needs_traceback(error: Exception) -> bool:
+        """
+        로그에 traceback을 렌더링해야 하는지 판단
+        
+        details에 이미 stack_trace가 담겨 있거나, 한 번도 raise되지 않아
+        렌더링할 프레임이 없는 예외는 제외한다.
+        """
+        details = getattr(error, "details", None)
+        if isinstance(details, dict) and "stack_trace" in details:
+            return False
+        return error.__traceback__ is not None
+    
     @staticmethod
     def handle_error(error: Exception, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -127,53 +191,124 @@ class ErrorHandler:
             오류 처리 결과 딕셔너리
         """
         context = context or {}
+        message = str(error)
         
         # 표준화된 오류 정보
         error_info = {
             "success": False,
             "error_type": type(error).__name__,
-            "message": str(error),
+            "message": message,
             "context": context
         }
         
         # 스택 트레이스 (개발 모드에서만 포함)
-        if logger.level <= logging.DEBUG:
+        # logger.level은 기본값 NOTSET(0)이라 항상 참이 되므로 실제 유효 레벨로 판단
+        if logger.isEnabledFor(logging.DEBUG):
             error_info["stack_trace"] = traceback.format_exc()
             
         # AgentError 타입은 추가 정보 포함
         if isinstance(error, AgentError):
-            error_info.update({
-                "error_code": error.error_code,
-                "severity": error.severity.name,
-                "details": error.details
-            })
+            # 임시 dict를 만드는 update() 대신 키를 직접 채운다
+            error_info["error_code"] = error.error_code
+            error_info["severity"] = error.severity.name
+            error_info["details"] = error.details
             
             # 심각도에 따라 로깅 수준 결정
             if error.severity == ErrorSeverity.CRITICAL:
-                logger.critical(f"Critical Error: {error}", exc_info=True)
+                logger.critical("Critical Error: %s", error,
+                                exc_info=error if ErrorHandler._needs_traceback(error) else None)
             elif error.severity == ErrorSeverity.HIGH:
-                logger.error(f"High Severity Error: {error}", exc_info=True)
+                logger.error("High Severity Error: %s", error,
+                             exc_info=error if ErrorHandler._needs_traceback(error) else None)
             elif error.severity == ErrorSeverity.MEDIUM:
-                logger.warning(f"Medium Severity Error: {error}")
+                logger.warning("Medium Severity Error: %s", error)
             else:
-                logger.info(f"Low Severity Error: {error}")
+                logger.info("Low Severity Error: %s", error)
                 
             # API 속도 제한 오류의 경우 재시도 정보 제공
             if isinstance(error, APIRateLimitError) and error.retry_after:
                 error_info["retry_after"] = error.retry_after
         else:
             # 기본 예외의 경우 ERROR 레벨로 로깅
-            logger.error(f"Unhandled Error: {error}", exc_info=True)
+            logger.error("Unhandled Error: %s", error,
+                         exc_info=error if ErrorHandler._needs_traceback(error) else None)
             
         return {
             "status": "error",
             "error_info": error_info,
-            "result": {"error": str(error)}  # 테스트 호환성을 위한 result 키
+            "result": {"error": message}  # 테스트 호환성을 위한 result 키
         }
     
+    # API 이름 -> 다시 호출해도 되는 시각(time.monotonic 기준).
+    # 속도 제한을 받은 API에 여러 호출자가 retry_after 직후 한꺼번에 몰리지 않도록 프로세스 전체에서 공유
+    _retry_not_before: Dict[str, float] = {}
+    _retry_not_before_lock = threading.Lock()
+    # retry_after에 더할 무작위 지연 상한(초). 서버가 요청한 시간보다 일찍 보내지 않도록 더하기만 함
+    _RETRY_AFTER_JITTER = 0.25
+    
+    @staticmethod
+    def _backoff_wait(error: Exception, delay: float, jitter: float, max_delay: float) -> float:
+        """
+        실제 대기 시간 계산.
+        
+        서버가 제공한 retry_after는 그보다 짧아지지 않도록 작은 지연만 더해 사용하고(상한 적용),
+        그 외에는 delay * (1 ± jitter)로 흩뜨려 동시 재시도가 한꺼번에 몰리지 않게 합니다.
+        """
+        if isinstance(error, APIRateLimitError) and error.retry_after:
+            return min(error.retry_after + random.uniform(0, ErrorHandler._RETRY_AFTER_JITTER), max_delay)
+        return min(delay * (1 + random.uniform(-jitter, jitter)), max_delay)
+    
+    @staticmethod
+    def _note_rate_limit(error: Exception) -> Optional[str]:
+        """
+        속도 제한 오류의 retry_after를 API별 공유 대기 시각에 반영
+        
+        Returns:
+            오류의 API 이름 (속도 제한 오류가 아니면 None)
+        """
+        if not isinstance(error, APIRateLimitError):
+            return None
+        api_name = error.details.get("api_name")
+        if api_name and error.retry_after:
+            not_before = time.monotonic() + error.retry_after
+            with ErrorHandler._retry_not_before_lock:
+                if not_before > ErrorHandler._retry_not_before.get(api_name, 0.0):
+                    ErrorHandler._retry_not_before[api_name] = not_before
+        return api_name
+    
+    @staticmethod
+    def _rate_limit_pause(api_name: Optional[str], max_delay: float) -> float:
+        """api_name이 속도 제한으로 대기 중이면 남은 시간(+작은 지연), 아니면 0"""
+        if not api_name:
+            return 0.0
+        with ErrorHandler._retry_not_before_lock:
+            remaining = ErrorHandler._retry_not_before.get(api_name, 0.0) - time.monotonic()
+            if remaining <= 0:
+                ErrorHandler._retry_not_before.pop(api_name, None)
+                return 0.0
+        return min(remaining + random.uniform(0, ErrorHandler._RETRY_AFTER_JITTER), max_delay)
+    
+    @staticmethod
+    def _next_retry(error: Exception, delay: float, gate: Optional[str], backoff_factor: float,
+                    jitter: float, max_delay: float):
+        """
+        재시도 전 대기 시간과 다음 delay 계산
+        
+        retry_after로 기다린 경우에는 지수 백오프 단계를 올리지 않고,
+        같은 API가 다른 호출자 때문에 더 오래 대기 중이면 그 시각까지 기다립니다.
+        
+        Returns:
+            (대기 시간, 다음 delay)
+        """
+        wait = max(ErrorHandler._backoff_wait(error, delay, jitter, max_delay),
+                   ErrorHandler._rate_limit_pause(gate, max_delay))
+        if isinstance(error, APIRateLimitError) and error.retry_after:
+            return wait, delay
+        return wait, delay * backoff_factor
+    
     @staticmethod
     def retry_with_backoff(func, max_retries=3, initial_delay=1, backoff_factor=2, 
-                          exceptions=(NetworkError, APIRateLimitError)):
+                          exceptions=(NetworkError, APIRateLimitError), jitter=0.5, max_delay=30.0):
         """
         오류 발생 시 지수 백오프로 재시도하는 함수
         
@@ -183,31 +318,133 @@ class ErrorHandler:
             initial_delay: 초기 대기 시간(초)
             backoff_factor: 백오프 계수
             exceptions: 재시도할 예외 클래스 튜플
+            jitter: 대기 시간에 곱할 무작위 편차 비율 (delay * (1 ± jitter))
+            max_delay: 대기 시간 상한(초)
+            
+        Returns:
+            원래 함수의 반환값 (func가 코루틴 함수면 await 가능한 코루틴)
+        """
+        # 코루틴 함수는 이벤트 루프를 막지 않도록 비동기 경로로 위임
+        if inspect.iscoroutinefunction(func):
+            return ErrorHandler.aretry_with_backoff(
+                func,
+                max_retries=max_retries,
+                initial_delay=initial_delay,
+                backoff_factor=backoff_factor,
+                exceptions=exceptions,
+                jitter=jitter,
+                max_delay=max_delay
+            )
+        return ErrorHandler.retry_call(
+            func,
+            max_retries=max_retries,
+            initial_delay=initial_delay,
+            backoff_factor=backoff_factor,
+            exceptions=exceptions,
+            jitter=jitter,
+            max_delay=max_delay
+        )
+    
+    @staticmethod
+    def retry_call(func, args=(), kwargs=None, *, max_retries=3, initial_delay=1, backoff_factor=2,
+                   exceptions=(NetworkError, APIRateLimitError), check=None,
+                   error_message=None, api_name=None, jitter=0.5, max_delay=30.0):
+        """
+        func(*args, **kwargs)를 지수 백오프로 재시도합니다.
+        
+        호출마다 재시도용 클로저를 만들 필요 없이 함수와 인자를 그대로 전달합니다.
+        
+        Args:
+            func: 재시도할 함수
+            args: 위치 인자 튜플
+            kwargs: 키워드 인자 딕셔너리
+            max_retries: 최대 재시도 횟수
+            initial_delay: 초기 대기 시간(초)
+            backoff_factor: 백오프 계수
+            exceptions: 재시도할 예외 클래스 튜플
+            check: 결과 검증 함수. 거짓을 반환하면 APIError를 발생시켜 재시도 대상으로 처리
+            error_message: check 실패 시 APIError 메시지
+            api_name: check 실패 시 APIError의 api_name (기본값: 함수 이름)
+            jitter: 대기 시간에 곱할 무작위 편차 비율 (delay * (1 ± jitter))
+            max_delay: 대기 시간 상한(초)
             
         Returns:
             원래 함수의 반환값
         """
+        if kwargs is None:
+            kwargs = {}
         retries = 0
         delay = initial_delay
         
+        # 같은 API가 다른 호출자의 속도 제한으로 대기 중이면 첫 시도 전에 기다림
+        gate = api_name
+        pause = ErrorHandler._rate_limit_pause(gate, max_delay)
+        if pause:
+            logger.info("Waiting %.2f seconds for %s rate limit", pause, gate)
+            time.sleep(pause)
+        
         while True:
             try:
-                return func()
+                result = func(*args, **kwargs)
+                if check is not None and not check(result):
+                    name = api_name or getattr(func, "__name__", "unknown")
+                    raise APIError(error_message or f"{name} 호출 결과가 유효하지 않습니다.", api_name=name)
+                return result
             except exceptions as e:
                 retries += 1
+                # 속도 제한이면 retry_after를 같은 API의 다른 호출자와 공유
+                gate = ErrorHandler._note_rate_limit(e) or gate
                 
                 # 재시도 횟수 초과 시 예외 다시 발생
                 if retries >= max_retries:
-                    logger.warning(f"Max retries ({max_retries}) exceeded. Last error: {e}")
+                    logger.warning("Max retries (%d) exceeded. Last error: %s", max_retries, e)
                     raise
                 
-                # API 속도 제한의 경우 제공된 재시도 시간 사용
-                if isinstance(e, APIRateLimitError) and e.retry_after:
-                    delay = e.retry_after
+                # API 속도 제한의 경우 제공된 재시도 시간 사용 (이때는 백오프 단계를 올리지 않음)
+                wait, delay = ErrorHandler._next_retry(e, delay, gate, backoff_factor, jitter, max_delay)
                 
                 # 로그 출력 및 대기
-                logger.info(f"Retry {retries}/{max_retries} after {delay} seconds. Error: {e}")
-                time.sleep(delay)
+                logger.info("Retry %d/%d after %.2f seconds. Error: %s", retries, max_retries, wait, e)
+                time.sleep(wait)
+    
+    @staticmethod
+    async def aretry_with_backoff(coro_factory, max_retries=3, initial_delay=1, backoff_factor=2,
+                                  exceptions=(NetworkError, APIRateLimitError), jitter=0.5, max_delay=30.0):
+        """
+        retry_with_backoff의 비동기 버전. 대기 중에도 이벤트 루프를 막지 않습니다.
+        
+        Args:
+            coro_factory: 호출할 때마다 새 코루틴을 반환하는 함수
+            max_retries: 최대 재시도 횟수
+            initial_delay: 초기 대기 시간(초)
+            backoff_factor: 백오프 계수
+            exceptions: 재시도할 예외 클래스 튜플
+            jitter: 대기 시간에 곱할 무작위 편차 비율 (delay * (1 ± jitter))
+            max_delay: 대기 시간 상한(초)
+            
+        Returns:
+            코루틴의 반환값
+        """
+        retries = 0
+        delay = initial_delay
+        gate = None
+        
+        while True:
+            try:
+                return await coro_factory()
+            except exceptions as e:
+                retries += 1
+                # 속도 제한이면 retry_after를 같은 API의 다른 호출자와 공유
+                gate = ErrorHandler._note_rate_limit(e) or gate
+                
+                # 재시도 횟수 초과 시 예외 다시 발생
+                if retries >= max_retries:
+                    logger.warning("Max retries (%d) exceeded. Last error: %s", max_retries, e)
+                    raise
                 
-                # 다음 대기 시간 계산
-                delay *= backoff_factor
+                # API 속도 제한의 경우 제공된 재시도 시간 사용 (이때는 백오프 단계를 올리지 않음)
+                wait, delay = ErrorHandler._next_retry(e, delay, gate, backoff_factor, jitter, max_delay)
+                
+                # 로그 출력 및 대기
+                logger.info("Retry %d/%d after %.2f seconds. Error: %s", retries, max_retries, wait, e)
+                await asyncio.sleep(wait)
@@ -4,86 +4,243 @@
 PersonaSelectorAgent: 작업 메타데이터를 바탕으로 적절한 페르소나를 선택하는 경량 에이전트.
 초기 구현은 규칙 기반 점수(rank_for_task) 결과를 사용하고, 상위 1개를 반환합니다.
 """
-from typing import Any, Dict, Optional, List, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, NamedTuple, Optional, List, Tuple
 import logging
+import sys
+import threading
+
+import numpy as np
 
 from personas.repository import PersonaRepository
+from .error_handler import ValidationError
 
 logger = logging.getLogger("PersonaSelectorAgent")
 
+# rank_for_task 결과 캐시 최대 항목 수
+_RANK_CACHE_SIZE = 256
+# 이 수 이상의 후보를 거를 때는 NumPy 문자열 연산(np.char.find)으로 부분 문자열 필터를 수행
+_VECTORIZE_MIN_PERSONAS = 200
+# 계층 필터 단계별 일치 비트
+_CATEGORY, _ROLE, _EXPERTISE = 1, 2, 4
+# 계층 필터에 쓰이는 task_meta 필드 (필터 순서)
+_FILTER_FIELDS = ("category", "role", "expertise")
+
+
+class PersonaSelection(NamedTuple):
+    """select() 결과 (필드는 속성으로 접근: sel.name, sel.persona, sel.score, sel.rationale)"""
+    name: str
+    persona: Dict[str, Any]
+    score: float
+    rationale: Dict[str, Any]
+
+
+def _norm_field(meta: Dict[str, Any], field: str) -> str:
+    """task_meta의 필터 필드를 공백 제거한 문자열로 정규화한다(없으면 빈 문자열)."""
+    value = meta.get(field) or ""
+    if not isinstance(value, str):
+        raise ValidationError(f"task_meta.{field} must be a string", field=field, value=value)
+    return value.strip()
+
+
+def _freeze(value: Any) -> Hashable:
+    """task_meta 값을 캐시 키로 쓸 수 있게 해시 가능한 형태로 변환한다."""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
 
 class PersonaSelectorAgent:
     """아주 간단한 페르소나 선택 에이전트"""
 
     def __init__(self, strategy: str = "rules_first") -> None:
         self.strategy = strategy
+        # 소문자 정규화 색인과 색인 생성에 사용한 리포지토리 스냅샷
+        self._idx: Optional[Dict[str, Any]] = None
+        self._idx_source: Optional[Dict[str, Any]] = None
+        # 정규화된 task_meta 키 -> rank_for_task 결과 (LRU, 리포지토리 스냅샷이 바뀌면 비움)
+        self._rank_cache: "OrderedDict[Hashable, List[Tuple[str, Dict[str, Any], float]]]" = OrderedDict()
+        self._rank_cache_source: Optional[Dict[str, Any]] = None
+        self._rank_cache_lock = threading.Lock()
+
+    def _persona_index(self, all_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        category/role/expertise 소문자 색인과 동점 처리용 skills/description 색인을 반환한다.
+        리포지토리 스냅샷(get_all() 반환 객체)이 바뀐 경우에만 다시 만든다.
+        """
+        if self._idx is None or self._idx_source is not all_data:
+            names = list(all_data.keys())
+            cat_lc: Dict[str, str] = {}
+            role_lc: Dict[str, str] = {}
+            exp_lc: Dict[str, str] = {}
+            skill_sets: Dict[str, frozenset] = {}
+            descriptions: Dict[str, str] = {}
+            for n, p in all_data.items():
+                # 소문자 문자열은 intern해 중복 값이 하나의 객체를 공유하도록 한다
+                cat_lc[n] = sys.intern(str(p.get("category", "")).lower())
+                role_lc[n] = sys.intern(str(p.get("role", p.get("직책", ""))).lower())
+                exp_lc[n] = sys.intern(str(p.get("expertise", p.get("전문 분야", ""))).lower())
+                # select()의 동점 처리용
+                skill_sets[n] = frozenset(p.get("skills", []) or [])
+                descriptions[n] = str(p.get("description", ""))
+            self._idx = {
+                "names": names,
+                "cat_lc": cat_lc,
+                "role_lc": role_lc,
+                "exp_lc": exp_lc,
+                "skill_sets": skill_sets,
+                "descriptions": descriptions,
+                # 대규모 리포지토리용 열(column) 배열
+                "cat_lc_arr": np.array([cat_lc[n] for n in names], dtype=str),
+                "role_lc_arr": np.array([role_lc[n] for n in names], dtype=str),
+                "exp_lc_arr": np.array([exp_lc[n] for n in names], dtype=str),
+            }
+            self._idx_source = all_data
+        return self._idx
+
+    @staticmethod
+    def _match_flags(idx: Dict[str, Any], lc_cat: str, lc_role: str, lc_exp: str) -> Any:
+        """
+        모든 페르소나에 대해 단계별 일치 여부를 한 번의 스캔으로 계산한다.
+        비트: _CATEGORY(일치), _ROLE(포함/피포함), _EXPERTISE(포함). 값이 빈 조건은 평가하지 않는다.
+        후보가 많으면 NumPy int 배열, 적으면 int 리스트를 반환한다.
+        """
+        names = idx["names"]
+        if len(names) >= _VECTORIZE_MIN_PERSONAS:
+            flags = np.zeros(len(names), dtype=np.int8)
+            if lc_cat:
+                flags |= (idx["cat_lc_arr"] == lc_cat) * np.int8(_CATEGORY)
+            if lc_role:
+                role_arr = idx["role_lc_arr"]
+                hit = (np.char.find(role_arr, lc_role) >= 0) | (np.char.find(lc_role, role_arr) >= 0)
+                flags |= hit * np.int8(_ROLE)
+            if lc_exp:
+                flags |= (np.char.find(idx["exp_lc_arr"], lc_exp) >= 0) * np.int8(_EXPERTISE)
+            return flags
+        cat_lc, role_lc, exp_lc = idx["cat_lc"], idx["role_lc"], idx["exp_lc"]
+        flags = []
+        for n in names:
+            f = 0
+            if lc_cat and cat_lc[n] == lc_cat:
+                f |= _CATEGORY
+            if lc_role and (lc_role in role_lc[n] or role_lc[n] in lc_role):
+                f |= _ROLE
+            if lc_exp and lc_exp in exp_lc[n]:
+                f |= _EXPERTISE
+            flags.append(f)
+        return flags
 
     # 내부: 계층적 후보군 산출(category -> role -> expertise)
-    def _hierarchical_candidates(self, task_meta: Dict[str, Any]) -> Tuple[List[str], Dict[str, Any]]:
+    def _hierarchical_candidates(self, meta: Dict[str, Any], all_data: Dict[str, Any]) -> Tuple[List[str], Dict[str, Any]]:
         """
         category, role, expertise 순서로 필터를 시도하며, 단계별로 후보를 좁힌다.
         해당 단계에서 후보가 0명이면 그 필터는 건너뛴다(완전 배제 방지).
+        all_data: 선택 호출 시작 시 한 번 가져온 PersonaRepository.get_all() 스냅샷
         반환: (후보 이름 리스트, rationale dict)
+        meta: 호출부에서 `task_meta or {}`로 한 번 정규화한 값. 형식이 잘못되면 ValidationError를 발생시킨다.
         """
-        meta = task_meta or {}
-        cat = (meta.get("category") or "").strip()
-        role = (meta.get("role") or "").strip()
-        exp = (meta.get("expertise") or "").strip()
+        if not isinstance(meta, dict):
+            raise ValidationError("task_meta must be a dict", field="task_meta", value=meta)
+        cat, role, exp = (_norm_field(meta, field) for field in _FILTER_FIELDS)
 
-        all_data = PersonaRepository.get_all()
-        names = list(all_data.keys())
+        idx = self._persona_index(all_data)
+        names = idx["names"]
         rationale: Dict[str, Any] = {"filters": []}
+        if not (cat or role or exp):
+            return list(names), rationale
 
-        # 1) category exact match
-        if cat:
-            cands = [n for n in names if str(all_data[n].get("category", "")).lower() == cat.lower()]
-            if cands:
-                names = cands
-                rationale["filters"].append({"stage": "category", "value": cat, "kept": len(names)})
-            else:
-                rationale["filters"].append({"stage": "category", "value": cat, "kept": "all (no match)"})
-
-        # 2) role contains/contained match
-        if role:
-            lc_role = role.lower()
-            cands = [
-                n for n in names
-                if lc_role in str(all_data[n].get("role", all_data[n].get("직책", ""))).lower()
-                or str(all_data[n].get("role", all_data[n].get("직책", ""))).lower() in lc_role
-            ]
-            if cands:
-                names = cands
-                rationale["filters"].append({"stage": "role", "value": role, "kept": len(names)})
+        # 세 조건을 한 번의 스캔으로 평가한 뒤 단계별로 요구 비트를 누적한다.
+        # 앞 단계까지 남은 후보 중 해당 조건 일치가 없으면 그 단계는 건너뛴다.
+        flags = self._match_flags(
+            idx, sys.intern(cat.lower()), sys.intern(role.lower()), sys.intern(exp.lower())
+        )
+        vectorized = isinstance(flags, np.ndarray)
+        required = 0
+        stages = (
+            (_CATEGORY, "category", cat, "all (no match)"),
+            (_ROLE, "role", role, "unchanged (no match)"),
+            (_EXPERTISE, "expertise", exp, "unchanged (no match)"),
+        )
+        for bit, stage, value, no_match in stages:
+            if not value:
+                continue
+            want = required | bit
+            if vectorized:
+                kept = int(np.count_nonzero((flags & want) == want))
             else:
-                rationale["filters"].append({"stage": "role", "value": role, "kept": "unchanged (no match)"})
-
-        # 3) expertise contains
-        if exp:
-            lc_exp = exp.lower()
-            cands = [
-                n for n in names
-                if lc_exp in str(all_data[n].get("expertise", all_data[n].get("전문 분야", ""))).lower()
-            ]
-            if cands:
-                names = cands
-                rationale["filters"].append({"stage": "expertise", "value": exp, "kept": len(names)})
+                kept = sum(1 for f in flags if f & want == want)
+            if kept:
+                required = want
+                rationale["filters"].append({"stage": stage, "value": value, "kept": kept})
             else:
-                rationale["filters"].append({"stage": "expertise", "value": exp, "kept": "unchanged (no match)"})
+                rationale["filters"].append({"stage": stage, "value": value, "kept": no_match})
 
+        if vectorized:
+            names = [names[i] for i in np.flatnonzero((flags & required) == required)]
+        else:
+            names = [n for n, f in zip(names, flags) if f & required == required]
         return names, rationale
 
-    def select(self, task_meta: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _rank_cached(self, meta: Dict[str, Any], top_k: int, snapshot: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any], float]]:
+        """
+        동일한 task_meta/top_k에 대한 rank_for_task 결과를 재사용한다.
+        작성자/검토자 선정 후 협업자 선정처럼 같은 메타로 여러 번 랭킹하는 경우 비용을 한 번만 낸다.
+        snapshot이 바뀌면(리포지토리 갱신) 캐시를 비운다.
+        """
+        key = (_freeze(meta), top_k)
+        with self._rank_cache_lock:
+            if self._rank_cache_source is not snapshot:
+                self._rank_cache.clear()
+                self._rank_cache_source = snapshot
+            cached = self._rank_cache.get(key)
+            if cached is not None:
+                self._rank_cache.move_to_end(key)
+                return list(cached)
+        ranked = PersonaRepository.rank_for_task(task_meta=meta, top_k=top_k) or []
+        with self._rank_cache_lock:
+            if self._rank_cache_source is snapshot:
+                self._rank_cache[key] = ranked
+                if len(self._rank_cache) > _RANK_CACHE_SIZE:
+                    self._rank_cache.popitem(last=False)
+        return list(ranked)
+
+    def _ranked_intersected(
+        self,
+        meta: Dict[str, Any],
+        top_k: int,
+        all_data: Dict[str, Any],
+        hierarchy: Optional[Tuple[List[str], Dict[str, Any]]] = None,
+    ) -> Tuple[List[Tuple[str, Dict[str, Any], float]], Dict[str, Any]]:
+        """
+        rank_for_task 결과를 계층 후보군으로 걸러 반환한다.
+        all_data: PersonaRepository.get_all() 스냅샷
+        hierarchy: 이미 계산한 _hierarchical_candidates 결과(재계산 생략용)
+        반환: (랭킹 리스트 [(name, persona, score)], rationale dict)
+        """
+        candidates, rationale = hierarchy or self._hierarchical_candidates(meta, all_data)
+        ranked = self._rank_cached(meta, top_k, all_data)
+        if candidates:
+            keep = set(candidates)
+            ranked = [r for r in ranked if r[0] in keep]
+        return ranked, rationale
+
+    def select(self, task_meta: Dict[str, Any]) -> Optional[PersonaSelection]:
         """
         입력 task_meta: { 'skills': [..], 'domain': str, 'style': str, ... }
-        반환: { 'name': str, 'persona': dict, 'score': float }
+        반환: PersonaSelection(name, persona, score, rationale)
         선택 실패 시 None
         """
         try:
             # 계층 후보군 산출 후 랭킹
-            candidates, rationale = self._hierarchical_candidates(task_meta)
-            ranked = PersonaRepository.rank_for_task(task_meta=task_meta, top_k=20)
-            if candidates:
-                ranked = [r for r in ranked if r[0] in candidates]
+            meta = task_meta or {}
+            all_data = PersonaRepository.get_all()
+            ranked, rationale = self._ranked_intersected(meta, top_k=20, all_data=all_data)
             if not ranked:
                 logger.info("No persona candidates matched the task meta; returning None.")
                 return None
@@ -91,15 +248,24 @@ class PersonaSelectorAgent:
             top_group = [r for r in ranked if r[2] == top_score]
 
             # tie-break: 스킬 겹침 수가 많은 후보 우선, 그 다음 스타일 일치 여부
-            skills = set((task_meta or {}).get("skills", []) or [])
-            desired_style = (task_meta or {}).get("style")
+            skills = set(meta.get("skills") or ())
+            desired_style = meta.get("style")
+
+            idx = self._persona_index(all_data)
+            skill_sets, descriptions = idx["skill_sets"], idx["descriptions"]
 
             def _key(item):
                 _name, _persona, _score = item
-                p_skills = set((_persona or {}).get("skills", []) or [])
+                p_skills = skill_sets.get(_name)
+                if p_skills is None:
+                    p_skills = set((_persona or {}).get("skills", []) or [])
                 overlap = len(skills & p_skills)
-                style_match = 1 if desired_style and desired_style in str((_persona or {}).get("description", "")) else 0
-                return (overlap, style_match)
+                if not desired_style:
+                    return (overlap, 0)
+                desc = descriptions.get(_name)
+                if desc is None:
+                    desc = str((_persona or {}).get("description", ""))
+                return (overlap, 1 if desired_style in desc else 0)
 
             best = max(top_group, key=_key) if len(top_group) > 1 else ranked[0]
             name, persona, score = best
@@ -115,9 +281,12 @@ class PersonaSelectorAgent:
                 "Persona selected (score=%s, skills=%s, desired_style=%s): %s",
                 score, list(skills), desired_style, name,
             )
-            return {"name": name, "persona": persona, "score": score, "rationale": rationale}
-        except Exception as e:
-            logger.exception(f"Persona selection failed: {e}")
+            return PersonaSelection(name, persona, score, rationale)
+        except ValidationError as e:
+            logger.warning("Invalid task meta for persona selection: %s", e)
+            return None
+        except (KeyError, AttributeError, TypeError, ValueError) as e:
+            logger.exception("Persona selection failed: %s", e)
             return None
 
     def select_pair(self, task_meta: Dict[str, Any]) -> Dict[str, Optional[str]]:
@@ -128,10 +297,13 @@ class PersonaSelectorAgent:
         반환: { 'writer': Optional[str], 'reviewer': Optional[str] }
         """
         try:
-            candidates, _ = self._hierarchical_candidates(task_meta)
-            ranked = PersonaRepository.rank_for_task(task_meta=task_meta, top_k=20) or []
-            if candidates:
-                ranked = [r for r in ranked if r[0] in candidates]
+            meta = task_meta or {}
+            all_data = PersonaRepository.get_all()
+            hierarchy = self._hierarchical_candidates(meta, all_data)
+            # 후보가 1명으로 좁혀졌으면 랭킹 없이 작성자로 확정
+            if len(hierarchy[0]) == 1:
+                return {"writer": hierarchy[0][0], "reviewer": None}
+            ranked, _ = self._ranked_intersected(meta, top_k=20, all_data=all_data, hierarchy=hierarchy)
             if not ranked:
                 return {"writer": None, "reviewer": None}
             writer = ranked[0][0]
@@ -141,8 +313,11 @@ class PersonaSelectorAgent:
                     reviewer = name
                     break
             return {"writer": writer, "reviewer": reviewer}
-        except Exception as e:
-            logger.exception(f"Persona pair selection failed: {e}")
+        except ValidationError as e:
+            logger.warning("Invalid task meta for persona pair selection: %s", e)
+            return {"writer": None, "reviewer": None}
+        except (KeyError, AttributeError, TypeError, ValueError) as e:
+            logger.exception("Persona pair selection failed: %s", e)
             return {"writer": None, "reviewer": None}
 
     def select_collaborators(self, task_meta: Dict[str, Any], k: int = 3) -> list[str]:
@@ -150,12 +325,17 @@ class PersonaSelectorAgent:
         협업용 다중 페르소나 선정. 상위 k명 이름 리스트 반환.
         """
         try:
-            candidates, _ = self._hierarchical_candidates(task_meta)
-            ranked = PersonaRepository.rank_for_task(task_meta=task_meta, top_k=max(k * 3, 3)) or []
-            if candidates:
-                ranked = [r for r in ranked if r[0] in candidates]
+            meta = task_meta or {}
+            all_data = PersonaRepository.get_all()
+            hierarchy = self._hierarchical_candidates(meta, all_data)
+            if len(hierarchy[0]) == 1:
+                return list(hierarchy[0])[:k]
+            ranked, _ = self._ranked_intersected(meta, top_k=max(k * 3, 3), all_data=all_data, hierarchy=hierarchy)
             names = [r[0] for r in ranked]
             return names[:k]
-        except Exception as e:
-            logger.exception(f"Persona collaborators selection failed: {e}")
+        except ValidationError as e:
+            logger.warning("Invalid task meta for persona collaborators selection: %s", e)
+            return []
+        except (KeyError, AttributeError, TypeError, ValueError) as e:
+            logger.exception("Persona collaborators selection failed: %s", e)
             return []
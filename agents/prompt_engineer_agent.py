@@ -1,7 +1,13 @@
-from .agent_base import BaseAgent
+import json
+from .agent_base import BaseAgent, resolve_persona
+from .error_handler import SingleFlight
 from tools.prompt_tool.core import generate_high_quality_prompt
 from typing import Dict, Any
 
+# 인스턴스 간 동일 요청의 동시 LLM 호출을 하나로 합침
+_inflight = SingleFlight()
+
+
 class PromptEngineerAgent(BaseAgent):
     """
     프롬프트 엔지니어 역할: 고퀄리티 프롬프트 초안 생성 담당
@@ -11,9 +17,11 @@ class PromptEngineerAgent(BaseAgent):
         options = task_data.get('options', {})
         mode = task_data.get('mode', 'basic')
         # 페르소나 컨텍스트 전달(없으면 None)
-        persona = None
-        try:
-            persona = task_data.get('persona') or (context.get('persona') if isinstance(context, dict) else None)
-        except Exception:
-            persona = None
-        return generate_high_quality_prompt(user_input, options, mode=mode, persona=persona)
\ No newline at end of file
+        persona = resolve_persona(task_data, context)
+        key = (
+            user_input,
+            json.dumps(options, sort_keys=True, default=str),
+            mode,
+            json.dumps(persona, sort_keys=True, default=str),
+        )
+        return _inflight.do(key, generate_high_quality_prompt, user_input, options, mode=mode, persona=persona)
@@ -1,16 +1,19 @@
-from .agent_base import BaseAgent
+import json
+from .agent_base import BaseAgent, resolve_persona
+from .error_handler import SingleFlight
 from tools.prompt_tool.core import qa_evaluate_prompt
 from typing import Dict, Any
 
+# 인스턴스 간 동일 요청의 동시 LLM 호출을 하나로 합침
+_inflight = SingleFlight()
+
+
 class QAAssistantAgent(BaseAgent):
     """
     QA 평가자 역할: 프롬프트 품질 평가/개선점 제안 담당
     """
     def process_task(self, task_data: Dict[str, Any], context: Dict[str, Any] = None) -> Dict[str, Any]:
         prompt = task_data.get('prompt', '')
-        persona = None
-        try:
-            persona = task_data.get('persona') or (context.get('persona') if isinstance(context, dict) else None)
-        except Exception:
-            persona = None
-        return qa_evaluate_prompt(prompt, persona=persona)
\ No newline at end of file
+        persona = resolve_persona(task_data, context)
+        key = (prompt, json.dumps(persona, sort_keys=True, default=str))
+        return _inflight.do(key, qa_evaluate_prompt, prompt, persona=persona)
@@ -1,38 +1,351 @@
+import asyncio
+import functools
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional, Tuple
 import json
 import os
 import sys
 import importlib
-import time
-
-# .env 파일 로드 시도
-try:
-    from dotenv import load_dotenv
-    load_dotenv()  # .env 파일에서 환경 변수 로드
-    ENV_LOADED = True
-except ImportError:
-    ENV_LOADED = False
-    logging.warning("python-dotenv library not found. Environment variables may not be loaded.")
-
-# OpenAI 임포트 시도
-try:
-    import openai
-    from openai import OpenAI
-    HAS_OPENAI = True
-except ImportError:
-    HAS_OPENAI = False
-    logging.warning("OpenAI library not found. Some functions may not work.")
+import importlib.util
 
 from .agent_base import BaseAgent
 from .agent_protocol import MessageType
-from utils.prompt_personalizer import build_persona_context, build_personalized_prompt
+from .error_handler import APIRateLimitError, ErrorHandler, NetworkError, SingleFlight
+from utils.async_runner import run_coroutine_sync
+from utils.lru_cache import LRUCache, TTLCache
+from utils.rate_limiter import TokenBucket
+from utils.prompt_personalizer import build_personalized_prompt
 from configs.prompt_loader import get_prompt_text
 
+# .env 로드와 openai 임포트는 ResearchAgent를 실제로 사용할 때까지 미룬다
+# (openai는 httpx/pydantic 등을 함께 불러와 임포트 비용이 크다)
+ENV_LOADED = False
+_DOTENV_ATTEMPTED = False
+
+# 설치 여부만 먼저 확인하고, 클래스는 _ensure_openai()에서 첫 사용 시 임포트
+HAS_OPENAI = importlib.util.find_spec("openai") is not None
+if not HAS_OPENAI:
+    logging.warning("OpenAI library not found. Some functions may not work.")
+OpenAI = None
+AsyncOpenAI = None
+
+
+def _load_env_once() -> None:
+    """.env 파일을 프로세스당 한 번만 로드"""
+    global ENV_LOADED, _DOTENV_ATTEMPTED
+    if _DOTENV_ATTEMPTED:
+        return
+    _DOTENV_ATTEMPTED = True
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()  # .env 파일에서 환경 변수 로드
+        ENV_LOADED = True
+    except ImportError:
+        logging.warning("python-dotenv library not found. Environment variables may not be loaded.")
+
+
+def _ensure_openai() -> bool:
+    """OpenAI 클래스를 처음 필요할 때 임포트 (사용 가능 여부 반환)"""
+    global OpenAI, HAS_OPENAI
+    if OpenAI is None and HAS_OPENAI:
+        try:
+            from openai import OpenAI as _OpenAI
+            OpenAI = _OpenAI
+        except ImportError:
+            HAS_OPENAI = False
+    return OpenAI is not None
+
+
+def _ensure_async_openai() -> bool:
+    """AsyncOpenAI 클래스를 처음 필요할 때 임포트 (사용 가능 여부 반환)"""
+    global AsyncOpenAI
+    if AsyncOpenAI is None and HAS_OPENAI:
+        try:
+            from openai import AsyncOpenAI as _AsyncOpenAI
+            AsyncOpenAI = _AsyncOpenAI
+        except ImportError:
+            return False
+    return AsyncOpenAI is not None
+
+
+# 도구 디렉토리 경로 (프로젝트 루트는 위의 utils/configs 임포트를 위해 이미 sys.path에 있음)
+_TOOLS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools")
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("ResearchAgent")
 
+# 연구 작업 기본 프롬프트 (configs의 'research' 프롬프트가 없을 때 사용)
+_DEFAULT_RESEARCH_PROMPT = (
+    "당신은 정보 검색과 연구를 돕는 AI 연구원입니다. "
+    "다음 주제나 질문에 대해 상세한 정보와 사실을 조사하여 제공해주세요:\n\n"
+    "{text_to_summarize}\n\n"
+    "중요한 사실, 데이터, 주요 관점을 포함하여 종합적인 답변을 작성해주세요. "
+    "불확실한 정보는 명확히 표시하고, 가능하면 정보의 출처나 근거를 언급해주세요."
+)
+
+
+# 내장 요약 시스템 메시지 (JSON 모드로 요약/사실/출처를 구조화해 받음)
+_SUMMARY_SYSTEM_PROMPT = (
+    "사용자가 제공한 텍스트를 요약하는 도우미입니다. "
+    "다음 형식의 JSON 객체로만 답하세요: "
+    '{"summary": "요약 본문", "facts": ["핵심 사실", ...], "sources": ["출처나 근거", ...]}'
+)
+
+
+# 요약 실패 결과를 보관할 시간(초). 일시적인 API 장애가 곧 회복될 수 있도록 짧게 둔다
+_NEGATIVE_CACHE_TTL = 10.0
+
+
+# 내장 요약 재시도 정책: 속도 제한/연결/타임아웃 오류만 지수 백오프 + 지터로 재시도
+_SUMMARY_RETRY = {
+    "max_retries": 3,
+    "initial_delay": 1,
+    "backoff_factor": 2,
+    "exceptions": (APIRateLimitError, NetworkError),
+}
+
+
+# 클라이언트 측 OpenAI 속도 제한 (API 키 단위 한도이므로 모든 에이전트가 공유)
+# 분당 요청 수/토큰 수는 계정 등급에 맞게 환경 변수로 조정한다
+_REQUEST_BUCKET = TokenBucket(int(os.environ.get("OPENAI_REQUESTS_PER_MINUTE", "5000")), 60)
+_TOKEN_BUCKET = TokenBucket(int(os.environ.get("OPENAI_TOKENS_PER_MINUTE", "15000000")), 60)
+
+# 요약 응답 최대 토큰 수 (OpenAI는 토큰 한도에 max_tokens까지 포함해 계산)
+_SUMMARY_MAX_TOKENS = 1000
+
+
+# 연구 쿼리 최대 글자 수 (이보다 길면 토큰 예산에 맞춰 자르는 대신 요청을 거절)
+_MAX_QUERY_CHARS = 60000
+
+# 요약할 텍스트에 허용할 최대 토큰 수 (gpt-3.5-turbo 문맥 16k에서 응답과 프롬프트 몫을 뺀 값)
+_SUMMARY_INPUT_TOKENS = 15000
+
+
+@functools.lru_cache(maxsize=None)
+def _token_encoder() -> Optional[Any]:
+    """gpt-3.5-turbo 토크나이저 (tiktoken이 없으면 None)"""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.encoding_for_model("gpt-3.5-turbo")
+
+
+def _count_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수
+    
+    tiktoken이 없으면 ASCII는 4글자당 1토큰, 그 밖의 문자(한글 등)는 글자당 1토큰으로 어림한다.
+    """
+    encoder = _token_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text))
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return (len(text) - non_ascii) // 4 + non_ascii
+
+
+def _truncate_to_budget(text: str, max_tokens: int = _SUMMARY_INPUT_TOKENS) -> str:
+    """모델 문맥을 넘지 않도록 텍스트를 max_tokens 토큰 이내로 자름"""
+    encoder = _token_encoder()
+    if encoder is not None:
+        tokens = encoder.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        truncated = encoder.decode(tokens[:max_tokens])
+    else:
+        count = _count_tokens(text)
+        if count <= max_tokens:
+            return text
+        truncated = text[:len(text) * max_tokens // count]
+    logger.warning("Text to summarize exceeds %d tokens; truncating", max_tokens)
+    return truncated + "\n...[truncated]"
+
+
+def _estimate_tokens(full_prompt: str) -> int:
+    """요약 요청이 토큰 한도에서 차지할 양 (OpenAI는 max_tokens까지 포함해 계산)"""
+    return _count_tokens(_SUMMARY_SYSTEM_PROMPT) + _count_tokens(full_prompt) + _SUMMARY_MAX_TOKENS
+
+
+def _record_rate_limits(headers: Any) -> None:
+    """응답 헤더의 남은 요청/토큰 한도를 버킷에 반영"""
+    for header, bucket in (("x-ratelimit-remaining-requests", _REQUEST_BUCKET),
+                           ("x-ratelimit-remaining-tokens", _TOKEN_BUCKET)):
+        try:
+            bucket.update(float(headers.get(header)))
+        except (AttributeError, TypeError, ValueError):
+            pass
+
+
+def _send_summary_request(client: Any, request: Dict[str, Any]) -> Any:
+    """
+    chat.completions.create 호출 (가능하면 원시 응답으로 받아 속도 제한 헤더를 반영)
+    
+    비동기 클라이언트면 코루틴을 반환하므로 호출 측에서 await한다.
+    """
+    completions = client.chat.completions
+    raw_api = getattr(completions, "with_raw_response", None)
+    if raw_api is None:
+        return completions.create(**request)
+    if asyncio.iscoroutinefunction(raw_api.create):
+        async def _send() -> Any:
+            raw = await raw_api.create(**request)
+            _record_rate_limits(raw.headers)
+            return raw.parse()
+        return _send()
+    raw = raw_api.create(**request)
+    _record_rate_limits(raw.headers)
+    return raw.parse()
+
+
+# 스트리밍 요약 시스템 메시지 (부분 응답을 그대로 보여줄 수 있도록 일반 텍스트로 받음)
+_STREAM_SYSTEM_PROMPT = "사용자가 제공한 텍스트를 요약하는 도우미입니다."
+
+
+def _summary_request(full_prompt: str, stream: bool = False) -> Dict[str, Any]:
+    """
+    내장 요약 chat.completions.create 인자
+    
+    스트리밍 요청은 조각난 JSON이 그대로 전달되지 않도록 JSON 모드 대신 일반 텍스트로 받는다.
+    """
+    request = {
+        "model": "gpt-3.5-turbo",
+        "messages": [
+            {"role": "system", "content": _STREAM_SYSTEM_PROMPT if stream else _SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": full_prompt}
+        ],
+        "max_tokens": _SUMMARY_MAX_TOKENS,
+        "temperature": 0.3,
+    }
+    if stream:
+        request["stream"] = True
+    else:
+        request["response_format"] = {"type": "json_object"}
+    return request
+
+
+def _as_retryable(error: Exception) -> Optional[Exception]:
+    """
+    OpenAI SDK 예외를 ErrorHandler 재시도 대상 예외로 변환 (재시도 대상이 아니면 None)
+    
+    RateLimitError는 Retry-After 헤더 값을 retry_after로 넘겨 서버가 요청한 만큼 기다리게 한다.
+    """
+    import openai
+    if isinstance(error, getattr(openai, "RateLimitError", ())):
+        retry_after = None
+        try:
+            retry_after = float(error.response.headers.get("retry-after"))
+        except (AttributeError, TypeError, ValueError):
+            pass
+        return APIRateLimitError(str(error), api_name="openai", retry_after=retry_after)
+    # APITimeoutError는 APIConnectionError의 하위 클래스
+    if isinstance(error, getattr(openai, "APIConnectionError", ())):
+        return NetworkError(str(error), details={"api_name": "openai"})
+    return None
+
+
+def _create_summary_completion(client: Any, full_prompt: str, stream: bool = False) -> Any:
+    """
+    요약 요청 1회 (재시도 대상 오류는 ErrorHandler 예외로 변환해 다시 발생)
+    
+    보내기 전에 요청/토큰 버킷에서 한도를 확보해 429 응답을 받기 전에 속도를 맞춘다.
+    """
+    _REQUEST_BUCKET.acquire()
+    _TOKEN_BUCKET.acquire(_estimate_tokens(full_prompt))
+    try:
+        return _send_summary_request(client, _summary_request(full_prompt, stream))
+    except Exception as e:
+        retryable = _as_retryable(e)
+        if retryable is None:
+            raise
+        raise retryable from e
+
+
+async def _acreate_summary_completion(client: Any, full_prompt: str, stream: bool = False) -> Any:
+    """_create_summary_completion의 비동기 버전"""
+    await _REQUEST_BUCKET.acquire_async()
+    await _TOKEN_BUCKET.acquire_async(_estimate_tokens(full_prompt))
+    try:
+        return await _send_summary_request(client, _summary_request(full_prompt, stream))
+    except Exception as e:
+        retryable = _as_retryable(e)
+        if retryable is None:
+            raise
+        raise retryable from e
+
+
+def _chunk_text(chunk: Any) -> str:
+    """스트리밍 응답 조각의 텍스트 (내용이 없는 조각은 빈 문자열)"""
+    if not chunk.choices:
+        return ""
+    return chunk.choices[0].delta.content or ""
+
+
+def _collect_stream(stream: Any, on_delta: Callable[[str], None]) -> str:
+    """스트리밍 응답을 조각마다 on_delta로 넘기면서 전체 텍스트로 모음"""
+    buf = []
+    for chunk in stream:
+        delta = _chunk_text(chunk)
+        if delta:
+            buf.append(delta)
+            on_delta(delta)
+    return "".join(buf)
+
+
+def _parse_summary_response(content: Optional[str]) -> Dict[str, Any]:
+    """
+    JSON 모드 응답을 요약 결과로 변환
+    
+    JSON 객체가 아니거나 summary가 없으면 응답 전체를 요약 본문으로 사용한다.
+    """
+    text = (content or "").strip()
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict) or "summary" not in data:
+        return {"status": "success", "summary": text, "facts": [], "sources": []}
+    facts = data.get("facts") or []
+    sources = data.get("sources") or []
+    return {
+        "status": "success",
+        "summary": str(data["summary"]).strip(),
+        "facts": facts if isinstance(facts, list) else [facts],
+        "sources": sources if isinstance(sources, list) else [sources],
+    }
+
+
+def _research_base_prompt() -> str:
+    """configs의 'research' 기본 프롬프트 (prompt_loader가 파일 mtime으로 캐시하므로 수정하면 바로 반영)"""
+    return get_prompt_text('research', _DEFAULT_RESEARCH_PROMPT)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_prompt_cached(base_prompt: str, persona_key: Optional[str]) -> str:
+    """
+    페르소나별 연구 프롬프트 템플릿 생성 (같은 기본 프롬프트/페르소나 조합은 재사용)
+    
+    Args:
+        base_prompt: 기본 프롬프트 템플릿
+        persona_key: 페르소나를 정렬된 JSON으로 직렬화한 문자열 (없으면 None)
+    """
+    persona = json.loads(persona_key) if persona_key is not None else None
+    return build_personalized_prompt(base_prompt, persona)
+
+
+def _cache_key(query: str) -> str:
+    """
+    정보 캐시 키 생성
+    
+    공백을 하나로 합치고 소문자로 바꾼 전체 쿼리의 blake2b 해시를 사용해,
+    앞부분만 같은 서로 다른 쿼리가 같은 캐시 항목을 공유하지 않도록 한다.
+    (소문자 변환을 먼저 해 합쳐진 문자열을 다시 복사하지 않음. split/join이 정규식 치환보다 빠름)
+    """
+    normalized = " ".join(query.lower().split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
 class ResearchAgent(BaseAgent):
     """
     연구 에이전트 클래스
@@ -44,7 +357,7 @@ class ResearchAgent(BaseAgent):
     
     def __init__(self, agent_id: str = None, name: str = "Researcher",
                  specialization: str = "information_gathering", 
-                 tools: List[str] = None):
+                 tools: List[str] = None, cache_size: Optional[int] = None):
         """
         연구 에이전트 초기화
         
@@ -53,15 +366,26 @@ class ResearchAgent(BaseAgent):
             name: 에이전트 이름
             specialization: 특화 영역 (기본값: information_gathering)
             tools: 사용 가능한 도구 목록
+            cache_size: 정보 캐시 최대 항목 수 (없으면 RESEARCH_CACHE_SIZE 환경 변수, 기본 1024)
         """
         # 기본 도구 설정 (없으면)
         default_tools = ["web_search", "summarization_tool"]
         tools = tools or default_tools
         
         super().__init__(agent_id, name, specialization, tools)
+        _load_env_once()
         
-        # 정보 캐시
-        self.information_cache = {}
+        # 정보 캐시 (크기 제한 LRU, 통계는 information_cache.cache_info())
+        if cache_size is None:
+            cache_size = int(os.environ.get("RESEARCH_CACHE_SIZE", "1024"))
+        self.information_cache = LRUCache(maxsize=cache_size)
+        # 요약 실패 결과 캐시 (같은 쿼리로 API를 반복 호출하지 않도록 잠시 보관)
+        self._negative_cache = TTLCache(maxsize=512, ttl=_NEGATIVE_CACHE_TTL)
+        # 진행 중인 요약 요청 (캐시 키 기준). 같은 쿼리가 동시에 들어오면 첫 요청의 결과를 공유
+        self._inflight = SingleFlight()
+        self._inflight_async: Dict[str, asyncio.Future] = {}
+        # 내장 요약용 OpenAI 클라이언트 (첫 사용 시 생성해 연결 풀 재사용)
+        self._openai_client = None
         # 현재 작업 컨텍스트
         self.current_context = {}
         
@@ -69,57 +393,63 @@ class ResearchAgent(BaseAgent):
         self.register_callback(MessageType.TASK_REQUEST.value, self._handle_task_request)
         self.register_callback(MessageType.QUERY.value, self._handle_query)
         
-        logger.info(f"ResearchAgent initialized: {self.name} ({self.agent_id})")
+        logger.info("ResearchAgent initialized: %s (%s)", self.name, self.agent_id)
         
-        # 도구 모듈 로드 시도
-        self._load_tools()
+        # 도구 모듈은 loaded_tools에 처음 접근할 때 로드
+        self._loaded_tools: Optional[Dict[str, Any]] = None
+    
+    @property
+    def loaded_tools(self) -> Dict[str, Any]:
+        """로드된 도구 모듈. 처음 접근할 때 _load_tools로 도구 디렉토리를 훑고 import합니다."""
+        if self._loaded_tools is None:
+            self._load_tools()
+        return self._loaded_tools
         
     def _load_tools(self):
         """각종 도구 모듈 로드"""
-        self.loaded_tools = {}
+        self._loaded_tools = {}
         
-        # 현재 디렉토리의 상위 디렉토리를 sys.path에 추가
-        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if parent_dir not in sys.path:
-            sys.path.append(parent_dir)
-        
-        # 도구 디렉토리 경로
-        tools_dir = os.path.join(parent_dir, "tools")
+        # 도구 디렉토리를 한 번만 훑어 하위 디렉토리 목록 확보 (도구마다 exists 호출 방지)
+        try:
+            with os.scandir(_TOOLS_DIR) as entries:
+                available = {entry.name: entry.path for entry in entries if entry.is_dir()}
+        except OSError as e:
+            logger.warning("Could not scan tools directory %s: %s", _TOOLS_DIR, e)
+            available = {}
         
         # 각 도구 모듈 로드 시도
         for tool_name in self.tools:
             try:
                 # 도구 디렉토리에서 해당 도구 찾기
-                tool_path = os.path.join(tools_dir, tool_name)
-                if os.path.exists(tool_path):
-                    # core.py 파일이 있는지 확인
-                    core_file = os.path.join(tool_path, "core.py")
-                    if os.path.exists(core_file):
-                        # 도구 모듈 임포트
-                        module_name = f"tools.{tool_name}.core"
-                        try:
-                            # 이미 임포트된 모듈인지 확인
-                            if module_name in sys.modules:
-                                tool_module = sys.modules[module_name]
-                            else:
-                                tool_module = importlib.import_module(module_name)
-                                
-                            # 필요한 함수가 있는지 확인
-                            if tool_name == "summarization_tool" and hasattr(tool_module, "summarize_text"):
-                                logger.info(f"Successfully loaded summarization_tool with summarize_text function")
-                                
-                            self.loaded_tools[tool_name] = tool_module
-                            logger.info(f"Successfully loaded tool: {tool_name}")
-                        except ImportError as ie:
-                            logger.warning(f"Could not import {module_name}: {str(ie)}")
+                tool_path = available.get(tool_name)
+                if tool_path is None:
+                    logger.warning("Tool directory for %s not found", tool_name)
+                    continue
+                # core.py 파일이 있는지 확인
+                if not os.path.isfile(os.path.join(tool_path, "core.py")):
+                    logger.warning("Tool %s has no core.py file", tool_name)
+                    continue
+                # 도구 모듈 임포트
+                module_name = f"tools.{tool_name}.core"
+                try:
+                    # 이미 임포트된 모듈인지 확인
+                    if module_name in sys.modules:
+                        tool_module = sys.modules[module_name]
                     else:
-                        logger.warning(f"Tool {tool_name} has no core.py file")
-                else:
-                    logger.warning(f"Tool directory for {tool_name} not found")
+                        tool_module = importlib.import_module(module_name)
+                        
+                    # 필요한 함수가 있는지 확인
+                    if tool_name == "summarization_tool" and hasattr(tool_module, "summarize_text"):
+                        logger.info("Successfully loaded summarization_tool with summarize_text function")
+                        
+                    self.loaded_tools[tool_name] = tool_module
+                    logger.info("Successfully loaded tool: %s", tool_name)
+                except ImportError as ie:
+                    logger.warning("Could not import %s: %s", module_name, ie)
             except Exception as e:
-                logger.error(f"Error loading tool {tool_name}: {str(e)}")
+                logger.error("Error loading tool %s: %s", tool_name, e)
         
-        logger.info(f"Loaded {len(self.loaded_tools)} tools: {list(self.loaded_tools.keys())}")
+        logger.info("Loaded %d tools: %s", len(self._loaded_tools), list(self._loaded_tools))
         
         # 필수 도구가 없는 경우 내장 기능 제공
         if "summarization_tool" not in self.loaded_tools and HAS_OPENAI:
@@ -139,7 +469,7 @@ class ResearchAgent(BaseAgent):
         Returns:
             처리 결과
         """
-        logger.info(f"Processing task: {task_data.get('task_id', 'unknown')}")
+        logger.info("Processing task: %s", task_data.get('task_id', 'unknown'))
         
         # 컨텍스트 정보 저장
         self.current_context = context or {}
@@ -171,134 +501,262 @@ class ResearchAgent(BaseAgent):
         subtask_id = task_data.get('subtask_id', task_id)
         query = task_data.get('content', '')
         
-        logger.info(f"Processing research task {subtask_id}: {query[:50]}...")
+        logger.info("Processing research task %s: %.50s...", subtask_id, query)
         
-        # 정보 캐시에 이미 있는지 확인
-        cache_key = f"query_{query.lower().replace(' ', '_')[:50]}"
-        if cache_key in self.information_cache:
-            logger.info(f"Using cached information for query: {query[:30]}...")
+        cache_key, processed_query, prompt_template, early_response = \
+            self._prepare_research_request(task_data, task_id, subtask_id)
+        if early_response is not None:
+            return early_response
+        
+        # on_delta 콜백이 있으면 응답 조각을 생성되는 대로 전달 (스트리밍은 내장 요약만 지원하므로 도구보다 먼저 선택)
+        on_delta = task_data.get('on_delta')
+        if on_delta is not None:
+            logger.info("Using built-in streaming summarization for query: '%.30s...'", processed_query)
+            summarize_fn = functools.partial(self._built_in_summarize, on_delta=on_delta)
+        # summarization_tool 도구가 있으면 사용, 없으면 내장 요약 기능 사용
+        elif "summarization_tool" in self.loaded_tools:
+            logger.info("Using summarization_tool to process: %.30s...", processed_query)
+            summarize_fn = self.loaded_tools["summarization_tool"].summarize_text
+        else:
+            logger.info("Using built-in summarization for query: '%.30s...'", processed_query)
+            summarize_fn = self._built_in_summarize
+        
+        try:
+            if on_delta is None:
+                result = self._coalesced(cache_key, functools.partial(summarize_fn, processed_query, prompt_template))
+            else:
+                # 스트리밍 호출은 조각을 받을 콜백이 호출마다 다르므로 합치지 않음
+                result = summarize_fn(processed_query, prompt_template)
+        except Exception as e:
+            logger.error("Error using summarization_tool: %s", e)
             return {
+                "status": "error",
+                "task_id": task_id,
+                "subtask_id": subtask_id,
+                "error": f"Tool execution error: {str(e)}"
+            }
+        return self._research_result_response(task_id, subtask_id, cache_key, result)
+    
+    def _prepare_research_request(self, task_data: Dict[str, Any], task_id: str, subtask_id: str
+                                  ) -> Tuple[str, Optional[str], Optional[str], Optional[Dict[str, Any]]]:
+        """
+        연구 요청 공통 전처리 (캐시 조회, 입력 검증, 프롬프트 템플릿 생성)
+        
+        Returns:
+            (캐시 키, 정제된 쿼리, 프롬프트 템플릿, 바로 반환할 응답)
+            캐시 적중(실패 결과 포함)이나 빈/너무 긴 쿼리인 경우에만 마지막 값이 채워지고 나머지는 None
+        """
+        query = task_data.get('content', '')
+        
+        # 정보 캐시에 이미 있는지 확인
+        cache_key = _cache_key(query)
+        cached = self.information_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached information for query: %.30s...", query)
+            return cache_key, None, None, {
                 "status": "success",
                 "task_id": task_id,
                 "subtask_id": subtask_id,
-                "result": self.information_cache[cache_key]
+                "result": cached
+            }
+        
+        # 최근에 요약이 실패한 쿼리면 API를 다시 호출하지 않고 같은 오류 반환
+        failed = self._negative_cache.get(cache_key)
+        if failed is not None:
+            logger.info("Using cached summarization error for query: %.30s...", query)
+            return cache_key, None, None, {
+                "status": "error",
+                "task_id": task_id,
+                "subtask_id": subtask_id,
+                "error": failed
+            }
+        
+        # 입력 검증 및 전처리
+        processed_query = query.strip()
+        if not processed_query:
+            return cache_key, None, None, {
+                "status": "error",
+                "task_id": task_id,
+                "subtask_id": subtask_id,
+                "error": "Empty query"
             }
+        if len(processed_query) > _MAX_QUERY_CHARS:
+            # 잘라서 보내도 대부분이 버려질 크기는 API를 호출하지 않고 바로 거절
+            return cache_key, None, None, {
+                "status": "error",
+                "task_id": task_id,
+                "subtask_id": subtask_id,
+                "error": f"Query too long ({len(processed_query)} chars); truncate or chunk."
+            }
+        
+        # 프롬프트 템플릿 설정 (유틸 통한 일관 병합)
+        return cache_key, processed_query, self._research_prompt_template(task_data), None
+    
+    def _coalesced(self, cache_key: str, summarize: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        같은 캐시 키의 요약이 이미 진행 중이면 새로 요청하지 않고 그 결과를 기다려 공유
+        
+        Args:
+            cache_key: 쿼리 캐시 키
+            summarize: 실제 요약을 수행할 함수
             
-        # summarization_tool 도구가 있으면 사용
-        if "summarization_tool" in self.loaded_tools:
-            try:
-                # 입력 검증 및 전처리
-                processed_query = query.strip()
-                if not processed_query:
-                    return {
-                        "status": "error",
-                        "task_id": task_id,
-                        "subtask_id": subtask_id,
-                        "error": "Empty query"
-                    }
-                    
-                # summarization_tool의 summarize_text 함수 호출
-                logger.info(f"Using summarization_tool to process: {processed_query[:30]}...")
-                
-                # 프롬프트 템플릿 설정 (유틸 통한 일관 병합)
-                persona_dict = None
-                try:
-                    persona_dict = task_data.get('persona') or (self.current_context.get('persona') if self.current_context else None)
-                except Exception:
-                    persona_dict = None
-                default_base_prompt = (
-                    "당신은 정보 검색과 연구를 돕는 AI 연구원입니다. "
-                    "다음 주제나 질문에 대해 상세한 정보와 사실을 조사하여 제공해주세요:\n\n"
-                    "{text_to_summarize}\n\n"
-                    "중요한 사실, 데이터, 주요 관점을 포함하여 종합적인 답변을 작성해주세요. "
-                    "불확실한 정보는 명확히 표시하고, 가능하면 정보의 출처나 근거를 언급해주세요."
-                )
-                base_prompt = get_prompt_text('research', default_base_prompt)
-                prompt_template = build_personalized_prompt(base_prompt, persona_dict)
-                
-                summarize_text = self.loaded_tools["summarization_tool"].summarize_text
-                result = summarize_text(processed_query, prompt_template)
-                
-                if result.get("status") == "success":
-                    # 결과 캐싱
-                    self.information_cache[cache_key] = result
-                    
-                    return {
-                        "status": "success",
-                        "task_id": task_id,
-                        "subtask_id": subtask_id,
-                        "result": result
-                    }
-                else:
-                    logger.error(f"Summarization tool error: {result.get('message')}")
-                    return {
-                        "status": "error",
-                        "task_id": task_id,
-                        "subtask_id": subtask_id,
-                        "error": f"Summarization error: {result.get('message')}"
-                    }
-                    
-            except Exception as e:
-                logger.error(f"Error using summarization_tool: {str(e)}")
-                return {
-                    "status": "error",
-                    "task_id": task_id,
-                    "subtask_id": subtask_id,
-                    "error": f"Tool execution error: {str(e)}"
-                }
+        Returns:
+            요약 결과 (첫 요청이 예외로 끝났으면 같은 예외 발생)
+        """
+        return self._inflight.do(cache_key, summarize)
+    
+    async def _coalesced_async(self, cache_key: str, summarize: Callable[[], Any]) -> Dict[str, Any]:
+        """_coalesced의 비동기 버전 (summarize는 코루틴을 반환하는 함수)"""
+        future = self._inflight_async.get(cache_key)
+        if future is not None:
+            # 기다리던 호출이 취소돼도 공유 중인 요청은 계속 진행되도록 shield
+            return await asyncio.shield(future)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_async[cache_key] = future
+        try:
+            result = await summarize()
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 호출이 없어도 "예외를 꺼내지 않음" 경고가 남지 않도록 표시
+            future.exception()
+            raise
         else:
-            # 도구가 없는 경우 내장 요약 기능 사용
-            logger.info("Using built-in summarization capability instead of summarization_tool")
-            
-            # 입력 검증 및 전처리
-            processed_query = query.strip()
-            if not processed_query:
-                return {
-                    "status": "error",
-                    "task_id": task_id,
-                    "subtask_id": subtask_id,
-                    "error": "Empty query"
-                }
-            # 프롬프트 템플릿 설정 (유틸 통한 일관 병합)
-            persona_dict = None
-            try:
-                persona_dict = task_data.get('persona') or (self.current_context.get('persona') if self.current_context else None)
-            except Exception:
-                persona_dict = None
-            default_base_prompt = (
-                "당신은 정보 검색과 연구를 돕는 AI 연구원입니다. "
-                "다음 주제나 질문에 대해 상세한 정보와 사실을 조사하여 제공해주세요:\n\n"
-                "{text_to_summarize}\n\n"
-                "중요한 사실, 데이터, 주요 관점을 포함하여 종합적인 답변을 작성해주세요. "
-                "불확실한 정보는 명확히 표시하고, 가능하면 정보의 출처나 근거를 언급해주세요."
-            )
-            base_prompt = get_prompt_text('research', default_base_prompt)
-            prompt_template = build_personalized_prompt(base_prompt, persona_dict)
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight_async[cache_key]
+            if not future.done():
+                future.cancel()
+    
+    def _research_result_response(self, task_id: str, subtask_id: str, cache_key: str,
+                                  result: Dict[str, Any]) -> Dict[str, Any]:
+        """요약 결과를 작업 응답으로 변환 (성공은 정보 캐시, 실패는 짧은 TTL의 실패 캐시에 저장)"""
+        if result.get("status") == "success":
+            # 결과 캐싱
+            self.information_cache[cache_key] = result
+            return {
+                "status": "success",
+                "task_id": task_id,
+                "subtask_id": subtask_id,
+                "result": result
+            }
+        # 외부 도구는 message, 내장 요약은 error 키로 오류를 전달
+        error_message = result.get('message') or result.get('error')
+        logger.error("Summarization error: %s", error_message)
+        error = f"Summarization error: {error_message}"
+        self._negative_cache[cache_key] = error
+        return {
+            "status": "error",
+            "task_id": task_id,
+            "subtask_id": subtask_id,
+            "error": error
+        }
+    
+    def _research_prompt_template(self, task_data: Dict[str, Any]) -> str:
+        """작업/컨텍스트의 페르소나를 반영한 연구 프롬프트 템플릿 생성"""
+        persona_dict = task_data.get('persona') or (self.current_context.get('persona') if self.current_context else None)
+        base_prompt = _research_base_prompt()
+        if not persona_dict:
+            return base_prompt
+        persona_key = json.dumps(persona_dict, sort_keys=True, ensure_ascii=False, default=str)
+        return _build_prompt_cached(base_prompt, persona_key)
+    
+    def process_tasks(self, tasks: List[Dict[str, Any]], context: Optional[Dict[str, Any]] = None,
+                      max_concurrent_requests: int = 5) -> List[Dict[str, Any]]:
+        """
+        여러 작업을 동시에 처리하는 동기 래퍼 (process_tasks_async 참고)
+        
+        Args:
+            tasks: 처리할 작업 데이터 목록
+            context: 추가 컨텍스트 정보
+            max_concurrent_requests: 동시에 진행할 최대 요약 요청 수
             
-            # 내장 요약 기능 호출
-            logger.info(f"Using built-in summarization for query: '{processed_query[:30]}...'")
-            result = self._built_in_summarize(processed_query, prompt_template)
-            logger.info(f"Built-in summarization result status: {result.get('status', 'unknown')}")
+        Returns:
+            입력 순서와 같은 순서의 처리 결과 목록
+        """
+        return run_coroutine_sync(self.process_tasks_async(tasks, context, max_concurrent_requests))
+    
+    async def process_tasks_async(self, tasks: List[Dict[str, Any]], context: Optional[Dict[str, Any]] = None,
+                                  max_concurrent_requests: int = 5) -> List[Dict[str, Any]]:
+        """
+        여러 작업을 asyncio로 동시에 처리
+        
+        연구 작업의 요약 호출은 AsyncOpenAI로 동시에 보내고(Semaphore로 동시 요청 수 제한),
+        나머지 작업 유형은 process_task와 동일하게 처리합니다.
+        AsyncOpenAI 클라이언트는 배치마다 하나를 만들어 연결 풀을 공유한 뒤 닫습니다.
+        
+        Args:
+            tasks: 처리할 작업 데이터 목록
+            context: 추가 컨텍스트 정보
+            max_concurrent_requests: 동시에 진행할 최대 요약 요청 수
             
-            if result.get("status") == "success":
-                # 결과 캐싱
-                self.information_cache[cache_key] = result
-                
-                return {
-                    "status": "success",
-                    "task_id": task_id,
-                    "subtask_id": subtask_id,
-                    "result": result
-                }
-            else:
-                logger.error(f"Built-in summarization error: {result.get('error')}")
-                return {
-                    "status": "error",
-                    "task_id": task_id,
-                    "subtask_id": subtask_id,
-                    "error": f"Summarization error: {result.get('error')}"
-                }
+        Returns:
+            입력 순서와 같은 순서의 처리 결과 목록
+        """
+        self.current_context = context or {}
+        semaphore = asyncio.Semaphore(max_concurrent_requests)
+        client = self._create_async_client()
+        try:
+            return list(await asyncio.gather(
+                *(self._process_task_async(task_data, client, semaphore) for task_data in tasks)
+            ))
+        finally:
+            if client is not None:
+                await client.close()
+    
+    async def _process_task_async(self, task_data: Dict[str, Any], client: Any,
+                                  semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """작업 유형에 따라 비동기 연구 처리 또는 기존 동기 처리로 분기"""
+        if task_data.get('type', 'general_query') == "research":
+            return await self._process_research_task_async(task_data, client, semaphore)
+        return self.process_task(task_data, self.current_context)
+    
+    async def _process_research_task_async(self, task_data: Dict[str, Any], client: Any,
+                                           semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """
+        연구 작업 비동기 처리 (_process_research_task와 동일한 결과 형식)
+        
+        Args:
+            task_data: 연구 작업 데이터
+            client: 배치에서 공유하는 AsyncOpenAI 클라이언트 (없으면 None)
+            semaphore: 동시 요약 요청 수 제한
             
+        Returns:
+            연구 결과
+        """
+        task_id = task_data.get('task_id', 'unknown')
+        subtask_id = task_data.get('subtask_id', task_id)
+        
+        cache_key, processed_query, prompt_template, early_response = \
+            self._prepare_research_request(task_data, task_id, subtask_id)
+        if early_response is not None:
+            return early_response
+        
+        summarize_text = getattr(self.loaded_tools.get("summarization_tool"), "summarize_text", None)
+        
+        async def _summarize() -> Dict[str, Any]:
+            async with semaphore:
+                if summarize_text is None or summarize_text == self._built_in_summarize:
+                    return await self._built_in_summarize_async(processed_query, prompt_template, client)
+                # 외부 요약 도구는 동기 함수이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    None, functools.partial(summarize_text, processed_query, prompt_template)
+                )
+        
+        try:
+            result = await self._coalesced_async(cache_key, _summarize)
+        except Exception as e:
+            logger.error("Error using summarization_tool: %s", e)
+            return {
+                "status": "error",
+                "task_id": task_id,
+                "subtask_id": subtask_id,
+                "error": f"Tool execution error: {str(e)}"
+            }
+        
+        return self._research_result_response(task_id, subtask_id, cache_key, result)
+    
     def _process_fact_check_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         사실 확인 작업 처리
@@ -313,7 +771,7 @@ class ResearchAgent(BaseAgent):
         subtask_id = task_data.get('subtask_id', task_id)
         statement = task_data.get('content', '')
         
-        logger.info(f"Processing fact check task {subtask_id}: {statement[:50]}...")
+        logger.info("Processing fact check task %s: %.50s...", subtask_id, statement)
         
         # TODO: 사실 확인 로직 구현
         # 현재는 기본 구현만 제공
@@ -338,7 +796,25 @@ class ResearchAgent(BaseAgent):
         sender_id = message.get('sender_id')
         content = message.get('content', {})
         
-        logger.info(f"Received task request from {sender_id}")
+        logger.info("Received task request from %s", sender_id)
+        
+        message_id = message.get('message_id', 'unknown')
+        
+        # 여러 작업이 목록으로 온 경우 한 번에 동시 처리
+        if isinstance(content, list):
+            tasks = [
+                item if isinstance(item, dict) and ('task_id' in item or 'content' in item)
+                else {"task_id": f"{message_id}_{i}", "content": item, "type": "research"}
+                for i, item in enumerate(content)
+            ]
+            results = self.process_tasks(tasks)
+            succeeded = sum(1 for r in results if r.get("status") == "success")
+            return {
+                "status": "success" if succeeded == len(results) else "error",
+                "task_id": message_id,
+                "message": f"{succeeded}/{len(results)} tasks succeeded",
+                "results": results
+            }
         
         # content가 직접 task_data인 경우
         if isinstance(content, dict) and ('task_id' in content or 'content' in content):
@@ -346,7 +822,7 @@ class ResearchAgent(BaseAgent):
         else:
             # content에서 task_data 추출 필요
             task_data = {
-                "task_id": message.get('message_id', 'unknown'),
+                "task_id": message_id,
                 "content": content,
                 "type": "research"  # 기본 타입
             }
@@ -369,7 +845,7 @@ class ResearchAgent(BaseAgent):
         sender_id = message.get('sender_id')
         content = message.get('content', '')
         
-        logger.info(f"Received query from {sender_id}: {content[:30]}...")
+        logger.info("Received query from %s: %.30s...", sender_id, content)
         
         # 조회 작업으로 변환하여 처리
         task_data = {
@@ -391,226 +867,180 @@ class ResearchAgent(BaseAgent):
         Returns:
             캐시된 정보 또는 None
         """
-        cache_key = f"query_{query.lower().replace(' ', '_')[:50]}"
+        cache_key = _cache_key(query)
         return self.information_cache.get(cache_key)
     
-    def _built_in_summarize(self, text_to_summarize: str, prompt_template: str = None) -> Dict[str, Any]:
+    def _built_in_summarize(self, text_to_summarize: str, prompt_template: str = None,
+                            on_delta: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
         내장 OpenAI 기반 요약 기능
         
         Args:
             text_to_summarize: 요약할 텍스트
             prompt_template: 프롬프트 템플릿 (없으면 기본값 사용)
+            on_delta: 지정하면 스트리밍으로 요청하고 응답 조각이 도착할 때마다 호출
             
         Returns:
             요약 결과와 상태를 포함한 디셔너리
         """
-        if not HAS_OPENAI:
-            self.logger.error("OpenAI library not available for built-in summarization")
+        if not _ensure_openai():
+            logger.error("OpenAI library not available for built-in summarization")
             return {"status": "error", "error": "OpenAI library not available for summarization"}
         
         if not text_to_summarize or not text_to_summarize.strip():
-            self.logger.warning("Empty text provided for summarization")
+            logger.warning("Empty text provided for summarization")
             return {"status": "error", "error": "Empty text provided"}
             
         # API 키 확인
         api_key = os.environ.get("OPENAI_API_KEY")
         if not api_key:
-            self.logger.error("OPENAI_API_KEY not found in environment variables")
+            logger.error("OPENAI_API_KEY not found in environment variables")
             return {"status": "error", "error": "API key not configured"}
         
-        # 기본 프롬프트 템플릿
-        default_template = (
-            "당신은 정보 검색과 연구를 도우는 AI 연구원입니다. "
-            "다음 주제나 질문에 대해 상세한 정보와 사실을 조사하여 제공해주세요:\n\n"
-            "{text_to_summarize}\n\n"
-            "중요한 사실, 데이터, 주요 관점을 포함하여 종합적인 답변을 작성해주세요. "
-            "불확실한 정보는 명확히 표시하고, 가능하면 정보의 출처나 근거를 언급해주세요."
+        # 프롬프트 준비 (템플릿이 없으면 기본 연구 프롬프트 사용)
+        full_prompt = (prompt_template or _DEFAULT_RESEARCH_PROMPT).format(
+            text_to_summarize=_truncate_to_budget(text_to_summarize)
         )
         
-        # 사용할 프롬프트 템플릿 결정
-        template_to_use = prompt_template or default_template
+        if self._openai_client is None:
+            # 재시도는 ErrorHandler로 직접 하므로 SDK 자체 재시도는 끈다
+            self._openai_client = OpenAI(api_key=api_key, max_retries=0, timeout=30.0)
         
-        # 프롬프트 준비
-        full_prompt = template_to_use.format(text_to_summarize=text_to_summarize)
+        try:
+            # 스트리밍은 연결 수립까지만 재시도 (조각을 넘긴 뒤에는 중복 전달을 막기 위해 재시도하지 않음)
+            response = ErrorHandler.retry_call(
+                _create_summary_completion, args=(self._openai_client, full_prompt, on_delta is not None),
+                **_SUMMARY_RETRY
+            )
+            if on_delta is not None:
+                return _parse_summary_response(_collect_stream(response, on_delta))
+        except Exception as e:
+            logger.error("OpenAI API error: %s", e)
+            return {"status": "error", "error": f"Failed to summarize text: {str(e)}"}
+        return _parse_summary_response(response.choices[0].message.content)
+    
+    def _create_async_client(self) -> Optional[Any]:
+        """AsyncOpenAI 클라이언트 생성 (라이브러리나 API 키가 없으면 None)"""
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key or not _ensure_async_openai():
+            return None
+        return AsyncOpenAI(api_key=api_key, max_retries=0, timeout=30.0)
+    
+    def _built_in_summarize_batch(self, queries: List[str], prompt_template: str = None,
+                                  max_concurrent_requests: int = 5) -> List[Dict[str, Any]]:
+        """
+        여러 텍스트를 내장 요약 기능으로 동시에 요약 (하나의 AsyncOpenAI 연결 풀 공유)
         
-        # 재시도 명 사이의 대기 시간
-        wait_times = [1, 2, 4]  # 지수적으로 증가
-        max_retries = 3
+        Args:
+            queries: 요약할 텍스트 목록
+            prompt_template: 프롬프트 템플릿 (없으면 기본값 사용)
+            max_concurrent_requests: 동시에 진행할 최대 요청 수
+            
+        Returns:
+            입력 순서와 같은 순서의 요약 결과 목록
+        """
+        return run_coroutine_sync(self._built_in_summarize_batch_async(queries, prompt_template, max_concurrent_requests))
+    
+    async def _built_in_summarize_batch_async(self, queries: List[str], prompt_template: str = None,
+                                              max_concurrent_requests: int = 5) -> List[Dict[str, Any]]:
+        """_built_in_summarize_batch의 비동기 버전"""
+        client = self._create_async_client()
+        if client is None:
+            logger.error("OpenAI library or OPENAI_API_KEY not available for built-in summarization")
+            return [{"status": "error", "error": "OpenAI library or API key not available for summarization"}
+                    for _ in queries]
+        semaphore = asyncio.Semaphore(max_concurrent_requests)
         
-        for attempt in range(max_retries):
-            try:
-                client = OpenAI(api_key=api_key)
-                response = client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[
-                        {"role": "system", "content": "사용자가 제공한 텍스트를 요약하는 도우미입니다."}, 
-                        {"role": "user", "content": full_prompt}
-                    ],
-                    max_tokens=1000,
-                    temperature=0.3,
-                )
-                
-                return {"status": "success", "summary": response.choices[0].message.content.strip()}
-                
-            except Exception as e:
-                self.logger.error(f"OpenAI API error (attempt {attempt+1}/{max_retries}): {str(e)}")
-                if attempt < max_retries - 1:  # 마지막 시도가 아니면 대기
-                    time.sleep(wait_times[min(attempt, len(wait_times)-1)])
+        async def _summarize(query: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._built_in_summarize_async(query, prompt_template, client)
+        
+        try:
+            return list(await asyncio.gather(*(_summarize(query) for query in queries)))
+        finally:
+            await client.close()
+    
+    async def _built_in_summarize_async(self, text_to_summarize: str, prompt_template: str = None,
+                                        client: Any = None) -> Dict[str, Any]:
+        """
+        내장 OpenAI 기반 요약 기능의 비동기 버전
+        
+        Args:
+            text_to_summarize: 요약할 텍스트
+            prompt_template: 프롬프트 템플릿 (없으면 기본값 사용)
+            client: 재사용할 AsyncOpenAI 클라이언트 (없으면 이 호출에서만 만들어 사용)
+            
+        Returns:
+            요약 결과와 상태를 포함한 디셔너리
+        """
+        if not text_to_summarize or not text_to_summarize.strip():
+            logger.warning("Empty text provided for summarization")
+            return {"status": "error", "error": "Empty text provided"}
+        
+        owns_client = client is None
+        if owns_client:
+            client = self._create_async_client()
+            if client is None:
+                logger.error("OpenAI library or OPENAI_API_KEY not available for built-in summarization")
+                return {"status": "error", "error": "OpenAI library or API key not available for summarization"}
+        
+        full_prompt = (prompt_template or _DEFAULT_RESEARCH_PROMPT).format(
+            text_to_summarize=_truncate_to_budget(text_to_summarize)
+        )
         
-        return {"status": "error", "error": "Failed to summarize text after multiple attempts"}
-
-def _process_fact_check_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    사실 확인 작업 처리
-
-    Args:
-        task_data: 사실 확인 작업 데이터
-
-    Returns:
-        사실 확인 결과
-    """
-    task_id = task_data.get('task_id', 'unknown')
-    subtask_id = task_data.get('subtask_id', task_id)
-    statement = task_data.get('content', '')
-
-    logger.info(f"Processing fact check task {subtask_id}: {statement[:50]}...")
-
-    # TODO: 사실 확인 로직 구현
-    # 현재는 기본 구현만 제공
-
-    return {
-        "status": "not_implemented",
-        "task_id": task_id,
-        "subtask_id": subtask_id,
-        "message": "Fact checking functionality not fully implemented yet"
-    }
-
-def _handle_task_request(self, message: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    작업 요청 메시지 처리
-
-    Args:
-        message: 받은 메시지
-
-    Returns:
-        처리 결과
-    """
-    sender_id = message.get('sender_id')
-    content = message.get('content', {})
-
-    logger.info(f"Received task request from {sender_id}")
-
-    # content가 직접 task_data인 경우
-    if isinstance(content, dict) and ('task_id' in content or 'content' in content):
-        task_data = content
-    else:
-        # content에서 task_data 추출 필요
-        task_data = {
-            "task_id": message.get('message_id', 'unknown'),
-            "content": content,
-            "type": "research"  # 기본 타입
-        }
-
-    # 작업 처리
-    result = self.process_task(task_data)
-
-    return result
-
-def _handle_query(self, message: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    정보 조회 메시지 처리
-
-    Args:
-        message: 받은 메시지
-
-    Returns:
-        처리 결과
-    """
-    sender_id = message.get('sender_id')
-    content = message.get('content', '')
-
-    logger.info(f"Received query from {sender_id}: {content[:30]}...")
-
-    # 조회 작업으로 변환하여 처리
-    task_data = {
-        "task_id": message.get('message_id', 'unknown'),
-        "content": content,
-        "type": "research",
-        "query_source": "direct_query"
-    }
-
-    return self.process_task(task_data)
-
-def get_cached_information(self, query: str) -> Optional[Dict[str, Any]]:
-    """
-    캐시된 정보 조회
-
-    Args:
-        query: 검색어
-
-    Returns:
-        캐시된 정보 또는 None
-    """
-    cache_key = f"query_{query.lower().replace(' ', '_')[:50]}"
-    return self.information_cache.get(cache_key)
-
-def _built_in_summarize(self, text: str, max_retries: int = 3) -> Dict[str, Any]:
-    """
-    외부 요약 도구에 대한 내장형 폴백 기능
-
-    Args:
-        text: 요약하고자 하는 텍스트
-        max_retries: 오류 발생시 재시도 횟수
-
-    Returns:
-        요약 결과
-    """
-    if not HAS_OPENAI:
-        self.logger.error("OpenAI library not available for built-in summarization")
-        return {"status": "error", "error": "OpenAI library not available for summarization"}
-
-    if not text or not text.strip():
-        self.logger.warning("Empty text provided for summarization")
-        return {"status": "error", "error": "Empty text provided"}
-
-    # API 키 확인
-    api_key = os.environ.get("OPENAI_API_KEY")
-    if not api_key:
-        self.logger.error("OPENAI_API_KEY not found in environment variables")
-        return {"status": "error", "error": "API key not configured"}
-
-    prompt = f"""
-    다음 텍스트를 간결히 요약해주세요:
-
-    ---
-    {text}
-    ---
-
-    요약:
-    """
-
-    # 재시도 명 사이의 대기 시간
-    wait_times = [1, 2, 4]  # 지수적으로 증가
-
-    for attempt in range(max_retries):
         try:
-            client = OpenAI(api_key=api_key)
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "사용자가 제공한 텍스트를 요약하는 도우미입니다."}, 
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1000,
-                temperature=0.3,
+            response = await ErrorHandler.aretry_with_backoff(
+                lambda: _acreate_summary_completion(client, full_prompt), **_SUMMARY_RETRY
             )
-
-            return {"status": "success", "summary": response.choices[0].message.content.strip()}
-
         except Exception as e:
-            self.logger.error(f"OpenAI API error (attempt {attempt+1}/{max_retries}): {str(e)}")
-            if attempt < max_retries - 1:  # 마지막 시도가 아니면 대기
-                time.sleep(wait_times[min(attempt, len(wait_times)-1)])
-
-    return {"status": "error", "error": "Failed to summarize text after multiple attempts"}
+            logger.error("OpenAI API error: %s", e)
+            return {"status": "error", "error": f"Failed to summarize text: {str(e)}"}
+        finally:
+            if owns_client:
+                await client.close()
+        return _parse_summary_response(response.choices[0].message.content)
+    
+    async def stream_research(self, query: str, task_data: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """
+        연구 결과를 생성되는 대로 조각 단위로 전달 (내장 요약 기능 사용)
+        
+        캐시에 있으면 저장된 요약을 한 번에 전달하고, 끝까지 받은 결과는 정보 캐시에 저장한다.
+        
+        Args:
+            query: 연구할 질문
+            task_data: 페르소나 등 추가 작업 데이터 (선택)
+            
+        Yields:
+            응답 텍스트 조각
+            
+        Raises:
+            ValueError: 빈 쿼리이거나 OpenAI 라이브러리/API 키가 없는 경우
+        """
+        task_data = dict(task_data or {}, content=query)
+        task_id = task_data.get('task_id', 'unknown')
+        cache_key, processed_query, prompt_template, early_response = \
+            self._prepare_research_request(task_data, task_id, task_data.get('subtask_id', task_id))
+        if early_response is not None:
+            if early_response["status"] != "success":
+                raise ValueError(early_response["error"])
+            yield early_response["result"].get("summary", "")
+            return
+        
+        client = self._create_async_client()
+        if client is None:
+            raise ValueError("OpenAI library or API key not available for summarization")
+        
+        full_prompt = prompt_template.format(text_to_summarize=_truncate_to_budget(processed_query))
+        buf = []
+        try:
+            stream = await ErrorHandler.aretry_with_backoff(
+                lambda: _acreate_summary_completion(client, full_prompt, stream=True), **_SUMMARY_RETRY
+            )
+            async for chunk in stream:
+                delta = _chunk_text(chunk)
+                if delta:
+                    buf.append(delta)
+                    yield delta
+        finally:
+            await client.close()
+        self.information_cache[cache_key] = _parse_summary_response("".join(buf))
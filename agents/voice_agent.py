@@ -7,10 +7,13 @@ voice_agent.py - A2A 시스템의 음성 처리 에이전트
 
 import sys
 import os
+import asyncio
+import functools
+import json
 import logging
 import importlib
-import time
-from typing import Dict, Any, List, Optional
+from types import ModuleType
+from typing import Dict, Any, List, Optional, Tuple
 
 # 상위 디렉토리 import를 위한 경로 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -22,11 +25,106 @@ from agents.agent_base import BaseAgent
 from agents.agent_protocol import AgentMessage, MessageType
 from agents.error_handler import ErrorHandler, NetworkError, APIError, APIRateLimitError, ValidationError
 from utils.prompt_personalizer import build_persona_context, build_personalized_prompt
+from utils.rate_limiter import TokenBucket
 from configs.prompt_loader import get_prompt_text
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 콜백 등록에 쓰는 메시지 유형 문자열 (임포트 시 한 번만 조회)
+_MSG_TASK = MessageType.TASK_REQUEST.value
+_MSG_QUERY = MessageType.QUERY.value
+
+@functools.lru_cache(maxsize=128)
+def _persona_context_cached(persona_key: str) -> str:
+    """
+    페르소나 컨텍스트 문자열 (같은 페르소나는 한 번만 생성)
+    
+    Args:
+        persona_key: 페르소나를 정렬된 JSON으로 직렬화한 문자열
+    """
+    try:
+        return build_persona_context(json.loads(persona_key))
+    except Exception:
+        # build_personalized_prompt와 같이 컨텍스트 생성 실패 시 지침 없이 진행
+        return ""
+
+
+def _persona_context(persona: Optional[Dict[str, Any]]) -> str:
+    """페르소나 dict의 컨텍스트 문자열 (없으면 빈 문자열)"""
+    if not persona:
+        return ""
+    return _persona_context_cached(json.dumps(persona, sort_keys=True, ensure_ascii=False, default=str))
+
+
+def _as_rate_limit_error(error: Exception) -> Optional[APIRateLimitError]:
+    """
+    도구가 올려 보낸 속도 제한 오류를 APIRateLimitError로 변환 (속도 제한이 아니면 None)
+    
+    voice_tool은 OpenAI RateLimitError만 그대로 전달하므로, Retry-After 헤더 값을 retry_after로 옮긴다.
+    """
+    if isinstance(error, APIRateLimitError):
+        return error
+    # OpenAI 예외라면 openai는 이미 임포트되어 있음 (여기서 새로 임포트하지 않음)
+    openai = sys.modules.get("openai")
+    if openai is None or not isinstance(error, getattr(openai, "RateLimitError", ())):
+        return None
+    retry_after = None
+    try:
+        retry_after = float(error.response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        pass
+    return APIRateLimitError(str(error), api_name="openai", retry_after=retry_after)
+
+
+def _positive_env(name: str, default: float) -> float:
+    """양수 환경 변수 값 (없거나 숫자가 아니거나 0 이하이면 default)"""
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        value = 0.0
+    if value <= 0:
+        logger.warning("%s=%r 값이 올바르지 않아 기본값 %s를 사용합니다.", name, raw, default)
+        return default
+    return value
+
+
+def _merge_tts_text(base: str, preamble: str, persona_ctx: str) -> str:
+    """TTS 텍스트 앞에 프리앰블을 붙이고 페르소나 지침 병합 (둘 다 없으면 그대로)"""
+    merged = base
+    if preamble:
+        merged = f"{preamble}\n{merged}" if merged else preamble
+    if persona_ctx:
+        merged = build_personalized_prompt(merged, persona_ctx)
+    return merged
+
+
+# 도구 모듈 경로 -> (모듈, {"functions", "schemas"}) 메모.
+# 에이전트를 여러 번 만들어도 임포트와 TOOL_MAP/TOOL_SCHEMAS 조회는 한 번만 한다
+_TOOL_CACHE: Dict[str, Tuple[ModuleType, Dict[str, Any]]] = {}
+
+
+def _tool_entry(module_path: str) -> Dict[str, Any]:
+    """
+    도구 모듈의 함수/스키마 정보 (모듈이 다시 로드되면 새로 읽음)
+    
+    Raises:
+        ImportError: 모듈을 임포트할 수 없는 경우
+    """
+    cached = _TOOL_CACHE.get(module_path)
+    if cached is not None and sys.modules.get(module_path) is cached[0]:
+        return cached[1]
+    module = importlib.import_module(module_path)
+    entry = {
+        "functions": getattr(module, "TOOL_MAP", {}),
+        "schemas": getattr(module, "TOOL_SCHEMAS", [])
+    }
+    _TOOL_CACHE[module_path] = (module, entry)
+    return entry
+
 class VoiceAgent(BaseAgent):
     """
     음성 처리 에이전트 클래스
@@ -51,6 +149,8 @@ class VoiceAgent(BaseAgent):
         
         # 도구 로드
         self.loaded_tools = {}
+        # "<도구>.<함수>" -> 함수 (호출 때마다 중첩 dict를 따라가지 않도록 평탄화)
+        self._fn_index = {}
         
         # 기본 도구 목록
         if tools is None:
@@ -59,9 +159,13 @@ class VoiceAgent(BaseAgent):
         
         self.load_tools(tools)
         
+        # 음성 도구 호출 속도 제한 (초당 요청 수와 순간 허용량은 환경 변수로 조정)
+        self._tts_bucket = self._voice_bucket("VOICE_TTS")
+        self._stt_bucket = self._voice_bucket("VOICE_STT")
+        
         # 메시지 핸들러 등록
-        self.register_callback(MessageType.TASK_REQUEST.value, self._handle_task_request)
-        self.register_callback(MessageType.QUERY.value, self._handle_query)
+        self.register_callback(_MSG_TASK, self._handle_task_request)
+        self.register_callback(_MSG_QUERY, self._handle_query)
     
     def load_tools(self, tool_names: List[str]) -> None:
         """
@@ -72,23 +176,195 @@ class VoiceAgent(BaseAgent):
         """
         for tool_name in tool_names:
             try:
-                # 동적으로 도구 모듈 import
-                module_path = f"tools.{tool_name}.core"
-                module = __import__(module_path, fromlist=["TOOL_MAP", "TOOL_SCHEMAS"])
+                # 도구 모듈 import (이미 읽은 모듈은 메모에서 가져옴)
+                entry = _tool_entry(f"tools.{tool_name}.core")
                 
-                # 도구 함수와 스키마 가져오기
-                tool_map = getattr(module, "TOOL_MAP", {})
-                tool_schemas = getattr(module, "TOOL_SCHEMAS", [])
+                # 도구 정보 저장 (에이전트마다 별도 dict)
+                self.loaded_tools[tool_name] = dict(entry)
+                for fn_name, fn in entry["functions"].items():
+                    self._fn_index[f"{tool_name}.{fn_name}"] = fn
                 
-                # 도구 정보 저장
-                self.loaded_tools[tool_name] = {
-                    "functions": tool_map,
-                    "schemas": tool_schemas
-                }
-                
-                logger.info(f"도구 '{tool_name}' 로드 완료: {len(tool_map)}개 함수")
+                logger.info(f"도구 '{tool_name}' 로드 완료: {len(entry['functions'])}개 함수")
             except (ImportError, AttributeError) as e:
-                logger.error(f"도구 '{tool_name}' 로드 실패: {str(e)}")
+                logger.error("도구 '%s' 로드 실패: %s", tool_name, e)
+    
+    @staticmethod
+    def _voice_bucket(prefix: str) -> TokenBucket:
+        """
+        <prefix>_QPS(기본 2), <prefix>_BURST(기본 5) 환경 변수로 토큰 버킷 생성
+        
+        숫자가 아니거나 0 이하인 값은 경고 후 기본값을 사용한다.
+        """
+        qps = _positive_env(f"{prefix}_QPS", 2.0)
+        burst = _positive_env(f"{prefix}_BURST", 5.0)
+        return TokenBucket(burst, burst / qps)
+    
+    @staticmethod
+    def _call_limited(bucket: TokenBucket, fn, *args, **kwargs):
+        """
+        버킷에서 차례를 기다린 뒤 도구 함수 호출
+        
+        속도 제한 오류가 나면 버킷 속도를 줄이고(OpenAI RateLimitError는 APIRateLimitError로 바꿔 전달,
+        재시도 대기는 retry_with_backoff가 담당),
+        성공하면 줄였던 속도를 조금씩 되돌린다.
+        """
+        bucket.acquire()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            rate_limited = _as_rate_limit_error(e)
+            if rate_limited is None:
+                raise
+            bucket.throttle()
+            if rate_limited is e:
+                raise
+            raise rate_limited from e
+        bucket.recover()
+        return result
+    
+    @staticmethod
+    async def _call_limited_async(bucket: TokenBucket, fn, *args, **kwargs):
+        """
+        _call_limited의 비동기 버전
+        
+        버킷 대기는 이벤트 루프에서 하고, 동기 도구 함수는 이벤트 루프를 막지 않도록 스레드에서 실행한다.
+        """
+        await bucket.acquire_async()
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+        except Exception as e:
+            rate_limited = _as_rate_limit_error(e)
+            if rate_limited is None:
+                raise
+            bucket.throttle()
+            if rate_limited is e:
+                raise
+            raise rate_limited from e
+        bucket.recover()
+        return result
+    
+    def _do_tts(self, task_data: Dict[str, Any], persona: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        텍스트를 음성으로 변환하는 작업 처리 (TTS 프리앰블과 페르소나 지침 병합 후 재시도 포함 호출)
+        
+        Args:
+            task_data: 작업 데이터 (text/detailed_text/speed)
+            persona: 페르소나 정보 (없으면 None 또는 빈 dict)
+            
+        Returns:
+            오디오 데이터와 원문을 담은 결과
+        """
+        text = task_data.get("text", "")
+        detailed_text = task_data.get("detailed_text", "")
+        speed = task_data.get("speed", 1.0)
+        
+        # 텍스트 검증
+        if not text and not detailed_text:
+            raise ValidationError("변환할 텍스트가 제공되지 않았습니다.", field="text")
+        
+        # 프롬프트 외부화: TTS 프리앰블(YAML) + 페르소나 지침 병합
+        # (prompt_loader가 파일 mtime으로 캐시하므로 파일이 바뀌지 않았다면 stat 한 번으로 끝남)
+        try:
+            tts_preamble = get_prompt_text("voice_tts", "")
+        except Exception:
+            tts_preamble = ""
+        
+        persona_ctx = _persona_context(persona)
+        if detailed_text:
+            detailed_text = _merge_tts_text(detailed_text, tts_preamble, persona_ctx)
+        else:
+            text = _merge_tts_text(text, tts_preamble, persona_ctx)
+        if persona:
+            logger.info(
+                f"TTS에 페르소나 지침 적용: {persona.get('직책', '')} / {persona.get('전문 분야', '')}"
+            )
+        
+        # TTS 기능 확인
+        speak_text_fn = self._fn_index.get("voice_tool.speak_text")
+        if speak_text_fn is None:
+            raise APIError("TTS 기능을 사용할 수 없습니다.", api_name="voice_tool")
+        
+        try:
+            # 지수 백오프를 사용한 재시도 로직 적용
+            def tts_with_retry():
+                result = self._call_limited(
+                    self._tts_bucket, speak_text_fn, text=text, detailed_text=detailed_text, speed=speed
+                )
+                if not result:
+                    raise APIError("음성 생성에 실패했습니다.", api_name="speak_text")
+                return result
+            
+            audio_bytes = ErrorHandler.retry_with_backoff(
+                tts_with_retry,
+                max_retries=3,
+                exceptions=(NetworkError, APIError)
+            )
+        except (NetworkError, APIError) as e:
+            logger.warning("TTS 변환 중 오류 발생: %s", e)
+            raise
+        
+        return {
+            "status": "success",
+            "audio_data": audio_bytes,
+            "original_text": text,
+            "detailed_text": detailed_text
+        }
+    
+    def _do_stt(self, task_data: Dict[str, Any], persona: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        음성을 텍스트로 변환하는 작업 처리 (재시도 포함 호출)
+        
+        Args:
+            task_data: 작업 데이터 (audio_data)
+            persona: 페르소나 정보 (있으면 결과에 동봉)
+            
+        Returns:
+            STT 도구 결과
+        """
+        audio_data = task_data.get("audio_data")
+        
+        # 오디오 데이터 검증
+        if not audio_data:
+            raise ValidationError("변환할 오디오 데이터가 제공되지 않았습니다.", field="audio_data")
+        
+        # STT 기능 확인
+        stt_fn = self._fn_index.get("voice_tool.speech_to_text_from_mic_data")
+        if stt_fn is None:
+            raise APIError("STT 기능을 사용할 수 없습니다.", api_name="voice_tool")
+        
+        try:
+            # 지수 백오프를 사용한 재시도 로직 적용
+            def stt_with_retry():
+                result = self._call_limited(self._stt_bucket, stt_fn, audio_data)
+                if not result:
+                    raise APIError("음성 인식에 실패했습니다.", api_name="speech_to_text")
+                return result
+            
+            result = ErrorHandler.retry_with_backoff(
+                stt_with_retry,
+                max_retries=3,
+                exceptions=(NetworkError, APIError)
+            )
+        except (NetworkError, APIError) as e:
+            logger.warning("STT 변환 중 오류 발생: %s", e)
+            raise
+        
+        # STT는 페르소나 영향을 직접 받지 않지만, 필요 시 후처리에서 사용할 수 있도록 원본 페르소나 정보를 동봉
+        if persona:
+            result["persona"] = persona
+        return result
+    
+    # 작업 유형(별칭 포함) -> 처리 메서드 (요청마다 별칭 dict를 만들고 if/elif로 비교하지 않도록 한 번만 구성)
+    _TASK_DISPATCH = {
+        "text_to_speech": _do_tts,
+        "tts": _do_tts,
+        "speech_to_text": _do_stt,
+        "stt": _do_stt,
+    }
+    
+    # 도구/기능 목록을 묻는 쿼리 키워드 (소문자)
+    _CAPABILITY_KEYWORDS = ("tools", "capabilities")
     
     def _handle_task_request(self, message: AgentMessage) -> Dict[str, Any]:
         """
@@ -103,133 +379,22 @@ class VoiceAgent(BaseAgent):
         try:
             task_data = message.content.get("task_data", {})
             task_type = task_data.get("type", "")
-
-            # 작업 유형 별칭 처리 (호환성 향상)
-            aliases = {
-                "tts": "text_to_speech",
-                "stt": "speech_to_text",
-            }
-            task_type = aliases.get(str(task_type).lower(), task_type)
-
-            # 페르소나 컨텍스트 준비 (있을 때만 사용)
-            persona = task_data.get("persona") or {}
-            persona_ctx = ""
-            try:
-                if persona:
-                    persona_ctx = build_persona_context(persona)
-            except Exception:
-                persona_ctx = ""
             
             # 작업 유형 검증
             if not task_type:
                 raise ValidationError("작업 유형이 지정되지 않았습니다.", field="type")
-                
-            logger.info(f"음성 작업 처리 시작: {task_type}")
             
-            # 텍스트를 음성으로 변환 (TTS)
-            if task_type == "text_to_speech":
-                text = task_data.get("text", "")
-                detailed_text = task_data.get("detailed_text", "")
-                speed = task_data.get("speed", 1.0)
-                
-                # 텍스트 검증
-                if not text and not detailed_text:
-                    raise ValidationError("변환할 텍스트가 제공되지 않았습니다.", field="text")
-                
-                # 프롬프트 외부화: TTS 프리앰블(YAML) + 페르소나 지침 병합
-                try:
-                    tts_preamble = get_prompt_text("voice_tts", "")
-                except Exception:
-                    tts_preamble = ""
-
-                def _merge_text(base: str) -> str:
-                    merged = base
-                    if tts_preamble:
-                        merged = f"{tts_preamble}\n{merged}" if merged else tts_preamble
-                    if persona:
-                        merged = build_personalized_prompt(merged, persona)
-                    return merged
-
-                if detailed_text:
-                    detailed_text = _merge_text(detailed_text)
-                else:
-                    text = _merge_text(text)
-                if persona:
-                    logger.info(
-                        f"TTS에 페르소나 지침 적용: {persona.get('직책', '')} / {persona.get('전문 분야', '')}"
-                    )
-                
-                # TTS 기능 확인
-                if "voice_tool" not in self.loaded_tools or "speak_text" not in self.loaded_tools["voice_tool"]["functions"]:
-                    raise APIError("TTS 기능을 사용할 수 없습니다.", api_name="voice_tool")
-                
-                try:
-                    # 지수 백오프를 사용한 재시도 로직 적용
-                    def tts_with_retry():
-                        speak_text_fn = self.loaded_tools["voice_tool"]["functions"]["speak_text"]
-                        result = speak_text_fn(text=text, detailed_text=detailed_text, speed=speed)
-                        if not result:
-                            raise APIError("음성 생성에 실패했습니다.", api_name="speak_text")
-                        return result
-                    
-                    audio_bytes = ErrorHandler.retry_with_backoff(
-                        tts_with_retry,
-                        max_retries=3,
-                        exceptions=(NetworkError, APIError)
-                    )
-                    
-                    response_data = {
-                        "status": "success",
-                        "audio_data": audio_bytes,
-                        "original_text": text,
-                        "detailed_text": detailed_text
-                    }
-                    
-                except (NetworkError, APIError) as e:
-                    logger.warning(f"TTS 변환 중 오류 발생: {str(e)}")
-                    raise
-                    
-            # 음성을 텍스트로 변환 (STT)
-            elif task_type == "speech_to_text":
-                audio_data = task_data.get("audio_data")
-                
-                # 오디오 데이터 검증
-                if not audio_data:
-                    raise ValidationError("변환할 오디오 데이터가 제공되지 않았습니다.", field="audio_data")
-                
-                # STT 기능 확인
-                stt_function_name = "speech_to_text_from_mic_data"
-                if ("voice_tool" not in self.loaded_tools or 
-                    stt_function_name not in self.loaded_tools["voice_tool"]["functions"]):
-                    raise APIError("STT 기능을 사용할 수 없습니다.", api_name="voice_tool")
-                
-                try:
-                    # 지수 백오프를 사용한 재시도 로직 적용
-                    def stt_with_retry():
-                        stt_fn = self.loaded_tools["voice_tool"]["functions"][stt_function_name]
-                        result = stt_fn(audio_data)
-                        if not result:
-                            raise APIError("음성 인식에 실패했습니다.", api_name="speech_to_text")
-                        return result
-                    
-                    result = ErrorHandler.retry_with_backoff(
-                        stt_with_retry,
-                        max_retries=3,
-                        exceptions=(NetworkError, APIError)
-                    )
-                    
-                    # STT는 페르소나 영향을 직접 받지 않지만, 필요 시 후처리에서 사용할 수 있도록 원본 페르소나 정보를 동봉
-                    response_data = result
-                    if persona:
-                        response_data["persona"] = persona
-                    
-                except (NetworkError, APIError) as e:
-                    logger.warning(f"STT 변환 중 오류 발생: {str(e)}")
-                    raise
-                    
-            else:
+            # 작업 유형(별칭 포함) -> 처리 메서드. 정식 이름은 소문자 변환 없이 바로 찾음
+            handler = self._TASK_DISPATCH.get(task_type) or self._TASK_DISPATCH.get(str(task_type).lower())
+            if handler is None:
                 raise ValidationError(f"지원하지 않는 작업 유형입니다: {task_type}", field="type")
-                
+            
+            logger.info(f"음성 작업 처리 시작: {task_type}")
+            
+            # 페르소나 정보 (있을 때만 사용, 없으면 None 그대로 전달)
+            persona = task_data.get("persona")
+            response_data = handler(self, task_data, persona)
+            
             # 응답 반환
             return {
                 "status": "success",
@@ -239,7 +404,7 @@ class VoiceAgent(BaseAgent):
             
         except ValidationError as e:
             # 검증 오류 처리
-            logger.warning(f"검증 오류: {str(e)}")
+            logger.warning("검증 오류: %s", e)
             context = {
                 "agent_id": self.agent_id,
                 "message_id": message.id,
@@ -249,7 +414,7 @@ class VoiceAgent(BaseAgent):
             
         except NetworkError as e:
             # 네트워크 오류 처리
-            logger.warning(f"네트워크 오류: {str(e)}")
+            logger.warning("네트워크 오류: %s", e)
             context = {
                 "agent_id": self.agent_id,
                 "message_id": message.id
@@ -258,7 +423,7 @@ class VoiceAgent(BaseAgent):
             
         except APIError as e:
             # API 오류 처리
-            logger.warning(f"API 오류: {str(e)}")
+            logger.warning("API 오류: %s", e)
             context = {
                 "agent_id": self.agent_id,
                 "message_id": message.id,
@@ -268,7 +433,7 @@ class VoiceAgent(BaseAgent):
             
         except Exception as e:
             # 기타 예외 처리
-            logger.error(f"예상치 못한 오류 발생: {str(e)}", exc_info=True)
+            logger.error("예상치 못한 오류 발생: %s", e, exc_info=True)
             context = {
                 "agent_id": self.agent_id,
                 "message_id": message.id
@@ -292,8 +457,9 @@ class VoiceAgent(BaseAgent):
             if not query:
                 raise ValidationError("쿼리가 제공되지 않았습니다.", field="query")
             
-            # 쿼리 유형에 따라 처리
-            if "tools" in query.lower() or "capabilities" in query.lower():
+            # 쿼리 유형에 따라 처리 (소문자 변환은 한 번만)
+            lowered = query.lower()
+            if any(keyword in lowered for keyword in self._CAPABILITY_KEYWORDS):
                 # 지원하는 도구 및 기능 목록 반환
                 available_tools = {}
                 for tool_name, tool_data in self.loaded_tools.items():
@@ -327,7 +493,7 @@ class VoiceAgent(BaseAgent):
             
         except ValidationError as e:
             # 검증 오류 처리
-            logger.warning(f"쿼리 검증 오류: {str(e)}")
+            logger.warning("쿼리 검증 오류: %s", e)
             context = {
                 "agent_id": self.agent_id,
                 "message_id": message.id,
@@ -337,7 +503,7 @@ class VoiceAgent(BaseAgent):
             
         except Exception as e:
             # 기타 예외 처리
-            logger.error(f"쿼리 처리 중 예상치 못한 오류 발생: {str(e)}", exc_info=True)
+            logger.error("쿼리 처리 중 예상치 못한 오류 발생: %s", e, exc_info=True)
             context = {
                 "agent_id": self.agent_id,
                 "message_id": message.id,
@@ -357,10 +523,10 @@ class VoiceAgent(BaseAgent):
         Returns:
             음성 데이터 (bytes)
         """
-        if "voice_tool" not in self.loaded_tools or "speak_text" not in self.loaded_tools["voice_tool"]["functions"]:
+        speak_text_fn = self._fn_index.get("voice_tool.speak_text")
+        if speak_text_fn is None:
             raise APIError("TTS 기능을 사용할 수 없습니다.", api_name="voice_tool")
         
-        speak_text_fn = self.loaded_tools["voice_tool"]["functions"]["speak_text"]
         result = speak_text_fn(text=text, detailed_text=detailed_text, speed=speed)
         
         if not result:
@@ -378,16 +544,72 @@ class VoiceAgent(BaseAgent):
         Returns:
             변환 결과 (텍스트 및 추가 정보)
         """
-        stt_function_name = "speech_to_text_from_mic_data"
-        
-        if ("voice_tool" not in self.loaded_tools or 
-            stt_function_name not in self.loaded_tools["voice_tool"]["functions"]):
+        stt_fn = self._fn_index.get("voice_tool.speech_to_text_from_mic_data")
+        if stt_fn is None:
             raise APIError("STT 기능을 사용할 수 없습니다.", api_name="voice_tool")
             
-        stt_fn = self.loaded_tools["voice_tool"]["functions"][stt_function_name]
         result = stt_fn(audio_data)
         
         if not result:
             raise APIError("음성 인식에 실패했습니다.", api_name="speech_to_text")
             
         return result
+    
+    async def _tts_async(self, text: str, detailed_text: str = "", speed: float = 1.0) -> bytes:
+        """
+        텍스트를 음성으로 변환 (비동기, 속도 제한과 재시도 포함)
+        
+        재시도 대기는 asyncio.sleep으로 하므로 다른 작업(예: 다른 에이전트 호출)과
+        asyncio.gather로 함께 실행할 수 있다.
+        
+        Args:
+            text: 변환할 텍스트
+            detailed_text: 상세 텍스트 (있을 경우)
+            speed: 재생 속도
+            
+        Returns:
+            음성 데이터 (bytes)
+        """
+        speak_text_fn = self._fn_index.get("voice_tool.speak_text")
+        if speak_text_fn is None:
+            raise APIError("TTS 기능을 사용할 수 없습니다.", api_name="voice_tool")
+        
+        async def tts_once():
+            result = await self._call_limited_async(
+                self._tts_bucket, speak_text_fn, text=text, detailed_text=detailed_text, speed=speed
+            )
+            if not result:
+                raise APIError("음성 생성에 실패했습니다.", api_name="speak_text")
+            return result
+        
+        return await ErrorHandler.aretry_with_backoff(
+            tts_once,
+            max_retries=3,
+            exceptions=(NetworkError, APIError)
+        )
+    
+    async def _stt_async(self, audio_data: bytes) -> Dict[str, Any]:
+        """
+        음성을 텍스트로 변환 (비동기, 속도 제한과 재시도 포함)
+        
+        Args:
+            audio_data: 변환할 음성 데이터
+            
+        Returns:
+            변환 결과 (텍스트 및 추가 정보)
+        """
+        stt_fn = self._fn_index.get("voice_tool.speech_to_text_from_mic_data")
+        if stt_fn is None:
+            raise APIError("STT 기능을 사용할 수 없습니다.", api_name="voice_tool")
+        
+        async def stt_once():
+            result = await self._call_limited_async(self._stt_bucket, stt_fn, audio_data)
+            if not result:
+                raise APIError("음성 인식에 실패했습니다.", api_name="speech_to_text")
+            return result
+        
+        return await ErrorHandler.aretry_with_backoff(
+            stt_once,
+            max_retries=3,
+            exceptions=(NetworkError, APIError)
+        )
@@ -13,19 +13,13 @@ My AI Agent - 멀티 에이전트 AI 시스템
 
 import sys
 import os
-import base64
+import importlib
+import logging
 import streamlit as st
-import speech_recognition as sr
-import threading
 import time
-import datetime
-import shutil
 from ui.chat import render_chat_ui
 from ui.sidebar import render_sidebar
-from ui.analysis import render_analysis_ui
-from ui.document import render_document_ui
-from ui.email import render_email_ui
-from ui.common import init_session_state, play_audio_autoplay_hidden, save_uploaded_file
+from ui.common import init_session_state, get_conversation_history, play_audio_autoplay_hidden, save_uploaded_file
 from ui.voice import start_continuous_voice_recognition, stop_continuous_voice_recognition
 
 # 프로젝트 모듈 임포트를 위한 경로 설정
@@ -40,9 +34,8 @@ for subdir in ["tools", "ui_components", "agents"]:
         sys.path.insert(0, subdir_path)
 
 # 설정 및 로깅 초기화
-from config import config
+from config import config, IS_DEVELOPMENT
 from logging_config import setup_logging, get_logger
-from configs.prompt_loader import get_prompt_text
 
 # --- 세션 상태 초기화 ---
 init_session_state()
@@ -60,31 +53,32 @@ except ValueError as e:
     st.error(f"환경 변수 설정 오류: {e}")
     st.stop()
 
+# 프롬프트 YAML은 프로세스당 한 번 미리 파싱 (첫 요청이 파싱 비용을 내지 않도록, 재실행 때는 건너뜀)
+from configs.prompt_loader import prewarm as prewarm_prompts
+
+
+@st.cache_resource(show_spinner=False)
+def _prewarm_prompts() -> None:
+    prewarm_prompts()
+
+
+_prewarm_prompts()
+
 import assistant_core
-from ui_components.display_helpers import (
-    show_message, show_spinner_ui, show_ai_response, 
-    show_download_button, show_voice_controls, apply_custom_css,
-    play_audio_with_feedback, show_voice_status
-)
-from tools.voice_tool.core import speech_to_text_from_mic_data
-from tools.planning_tool.core import execute_create_new_planning_document
-from tools.planning_tool.core import execute_collaboration_planning
-from tools.planning_tool.core import execute_expand_notion_document
-from tools.planning_tool.configs import personas, DOCUMENT_TEMPLATES
-from tools.email_tool import get_daily_email_summary, get_email_details
-from agents.email_agent import EmailAgent, MailAnalysisAgent
-from agents.agent_protocol import AgentMessage, MessageType
-from ui_components.prompt_ui import render_prompt_automation_ui, render_prompt_history
-# 데이터 분석 도구 import
-try:
-    from tools.data_analysis import DataAnalysisTool, ChartGenerator, InsightExtractor
-    DATA_ANALYSIS_AVAILABLE = True
-except ImportError as e:
-    print(f"데이터 분석 도구 import 실패: {e}")
-    DATA_ANALYSIS_AVAILABLE = False
-import uuid
-from tools.notion_utils import upload_to_notion
-from personas.repository import PersonaRepository
+from ui_components.display_helpers import show_spinner_ui, apply_custom_css
+
+# 기능 탭 UI는 해당 탭을 열었을 때 처음 임포트한다.
+# (기획/이메일/데이터 분석 도구와 pandas 등 무거운 의존성을 다른 탭에서 불러오지 않도록)
+_LAZY_ATTRS = {}
+
+
+def _lazy(module_name: str, attr: str):
+    """module_name의 attr을 첫 사용 시 임포트해 반환 (이후에는 기억해 둔 값 사용)"""
+    key = (module_name, attr)
+    if key not in _LAZY_ATTRS:
+        _LAZY_ATTRS[key] = getattr(importlib.import_module(module_name), attr)
+    return _LAZY_ATTRS[key]
+
 
 # --- Streamlit 페이지 설정 ---
 st.set_page_config(
@@ -125,13 +119,8 @@ def process_user_text_input(text_input: str):
         # 2단계: 대화 이력 준비
         st.session_state["current_process"]["desc"] = "대화 이력 준비 중..."
         st.session_state["current_process"]["progress"] = 0.3
-        conversation_history = []
-        for msg in st.session_state.messages:
-            if msg["role"] in ["user", "assistant"]:
-                if "voice_text" in msg and "detailed_text" in msg:
-                    conversation_history.append({"role": msg["role"], "content": msg["detailed_text"]})
-                elif "content" in msg:
-                    conversation_history.append({"role": msg["role"], "content": msg["content"]})
+        # 지난 턴 이후 추가된 메시지만 변환 (전체 대화를 매 턴 다시 훑지 않음)
+        conversation_history = get_conversation_history()
         # --- 챗봇 파일 업로드 context 전달 ---
         file_context = None
         if "chatbot_uploaded_file" in st.session_state and st.session_state["chatbot_uploaded_file"]:
@@ -152,15 +141,15 @@ def process_user_text_input(text_input: str):
         st.session_state["current_process"]["desc"] = "LLM 응답 처리 중..."
         st.session_state["current_process"]["progress"] = 0.8
         
-        # 디버깅을 위해 응답 로그 출력
+        # 디버깅을 위해 응답 로그 출력 (DEBUG 레벨일 때만 사본을 만듦)
         # 바이너리 데이터 로깅 방지 - 응답 내용을 안전하게 출력
-        safe_response = {}
-        for key, value in response.items():
-            if key == "audio_content" and isinstance(value, bytes):
-                safe_response[key] = f"[Binary audio data of length: {len(value)} bytes]"
-            else:
-                safe_response[key] = value
-        print(f"\n[DEBUG] LLM Response: {safe_response}\n")
+        if logger.isEnabledFor(logging.DEBUG):
+            safe_response = {
+                key: (f"[Binary audio data of length: {len(value)} bytes]"
+                      if key == "audio_content" and isinstance(value, bytes) else value)
+                for key, value in response.items()
+            }
+            logger.debug("LLM Response: %s", safe_response)
         
         if response.get("status") == "success":
             # 응답 타입 확인
@@ -171,12 +160,13 @@ def process_user_text_input(text_input: str):
                 audio_content = response.get("audio_content", None)
                 
                 # 디버깅 정보 출력 - 바이너리 데이터 로깅 방지 개선
-                print(f"\n[DEBUG] Voice Text: {voice_text[:50] if voice_text else 'None'}...\n")
-                print(f"\n[DEBUG] Detailed Text: {detailed_text[:50] if detailed_text else 'None'}...\n")
-                if isinstance(audio_content, bytes):
-                    print(f"\n[DEBUG] Audio Content: Binary data of length {len(audio_content)} bytes\n")
-                else:
-                    print(f"\n[DEBUG] Audio Content Type: {type(audio_content)}\n")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Voice Text: %s...", voice_text[:50] if voice_text else None)
+                    logger.debug("Detailed Text: %s...", detailed_text[:50] if detailed_text else None)
+                    if isinstance(audio_content, bytes):
+                        logger.debug("Audio Content: Binary data of length %d bytes", len(audio_content))
+                    else:
+                        logger.debug("Audio Content Type: %s", type(audio_content))
                 
                 # 대화 기록에 저장 (UI 표시는 채팅 컨테이너에서 처리)
                 if voice_text:
@@ -194,12 +184,12 @@ def process_user_text_input(text_input: str):
                         st.warning("💬 텍스트 응답만 가능합니다. (오디오 생성 실패)")
                 else:
                     st.error("어시스턴트 응답 생성 오류")
-                    print(f"\n[DEBUG] ERROR: Empty voice_text in audio_response\n")
+                    logger.debug("ERROR: Empty voice_text in audio_response")
             
             # text_fallback 응답 타입 처리
             elif response.get("response_type") == "text_fallback" and response.get("text_content"):
                 text_content = response.get("text_content")
-                print(f"\n[DEBUG] Text Fallback Content: {text_content[:50]}...\n")
+                logger.debug("Text Fallback Content: %s...", text_content[:50])
                 
                 # 대화 기록에 저장 (UI 표시는 채팅 컨테이너에서 처리)
                 st.session_state.messages.append({
@@ -211,7 +201,7 @@ def process_user_text_input(text_input: str):
             else:
                 # 일반 텍스트 응답
                 message = response.get("message", "") or response.get("response", "") or response.get("text_content", "응답이 없습니다.")
-                print(f"\n[DEBUG] Text Response Message: {message}\n")
+                logger.debug("Text Response Message: %s", message)
                 
                 # 대화 기록에 저장 (UI 표시는 채팅 컨테이너에서 처리)
                 st.session_state.messages.append({"role": "assistant", "content": message})
@@ -219,7 +209,7 @@ def process_user_text_input(text_input: str):
             # 오류 응답 처리
             error_msg = response.get("message", "") or response.get("response", "처리 중 알 수 없는 오류가 발생했습니다.")
             st.error(f"오류: {error_msg}")
-            print(f"\n[DEBUG] ERROR Response: {error_msg}\n")
+            logger.debug("ERROR Response: %s", error_msg)
     # --- 진행상황 대시보드 연동: LLM 작업 종료 ---
     st.session_state["current_process"] = None
 
@@ -267,7 +257,7 @@ if st.session_state.get("active_feature") == "chatbot_new":
 
 if st.session_state.get("active_feature") == "document":
     try:
-        render_document_ui()
+        _lazy("ui.document", "render_document_ui")()
     except Exception as e:
         import traceback
         st.error("문서 UI 렌더링 중 오류가 발생했습니다.")
@@ -284,7 +274,7 @@ if st.session_state.get("active_feature") == "document":
 # --- 데이터 분석 탭 구현 (모듈화 UI만 사용) ---
 if st.session_state.get("active_feature") == "analysis":
     try:
-        render_analysis_ui()
+        _lazy("ui.analysis", "render_analysis_ui")()
     except Exception as e:
         st.error("데이터 분석 UI 렌더링 중 오류가 발생했습니다.")
         st.exception(e)
@@ -292,34 +282,21 @@ if st.session_state.get("active_feature") == "analysis":
 # --- 이메일 탭 개선: 모듈화 렌더러 사용 ---
 if st.session_state.get("active_feature") == "email":
     try:
-        render_email_ui()
+        _lazy("ui.email", "render_email_ui")()
     except Exception as e:
         st.error("이메일 UI 렌더링 중 오류가 발생했습니다.")
         st.exception(e)
 
 # --- 프롬프트 자동화 UI ---
 if st.session_state.get("active_feature") == "prompt":
-    render_prompt_automation_ui()
-    render_prompt_history()
+    _lazy("ui_components.prompt_ui", "render_prompt_automation_ui")()
+    _lazy("ui_components.prompt_ui", "render_prompt_history")()
 
 # --- 메인 UI 레이아웃 (홈/디폴트: 모듈화된 레거시 챗봇 UI) ---
 if st.session_state.get("active_feature") in [None, "home"]:
     # 메인 챗 UI만 렌더링 (사이드바는 상단에서 이미 한 번 렌더)
     render_chat_ui({})
 
-# --- 오디오 자동 재생 함수 ---
-def play_audio_in_browser(audio_bytes: bytes):
-    """
-    주어진 오디오 바이트를 브라우저에서 자동 재생합니다.
-    """
-    if not audio_bytes:
-        return
-    try:
-        # (audio_html 및 st.markdown(audio_html, ...) 코드 완전 삭제)
-        pass
-    except Exception as e:
-        st.error(f"음성 재생 중 오류 발생: {e}")
-
 # --- 음성 인식 토글 상태 확인 및 처리 ---
 if st.session_state.voice_recognition_active:
     # 토글이 켜져 있으면 음성 인식 스레드 시작
@@ -365,7 +342,7 @@ def main():
     """, unsafe_allow_html=True)
     
     # 애플리케이션 시작 시 추가 설정이나 검증 작업을 여기에 추가할 수 있습니다
-    if config.is_development():
+    if IS_DEVELOPMENT:
         logger.debug("개발 모드에서 실행 중")
 
 if __name__ == "__main__":
@@ -2,10 +2,11 @@
 
 import os
 import json
+import functools
 import importlib.util
 import sys
-from typing import Optional
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
 import logging
 
 # tools 모듈 경로를 sys.path에 추가
@@ -15,35 +16,74 @@ if tools_abs_path not in sys.path:
     sys.path.insert(0, tools_abs_path)
 
 import openai
+from config import load_env, IS_PRODUCTION
 from utils.prompt_personalizer import build_personalized_prompt
 
-# 환경 변수 로드
-load_dotenv()
+logger = logging.getLogger("assistant_core")
+if IS_PRODUCTION:
+    # 운영 환경에서는 도구별 디버그 로그를 isEnabledFor 단계에서 걸러냄
+    logger.setLevel(logging.INFO)
+
+# 도구 호출 인자/결과 JSON 처리: orjson이 있으면 사용 (없으면 표준 json)
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """JSON 문자열(또는 bytes)을 파싱"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _tool_content(value) -> str:
+    """도구 결과를 LLM에 돌려줄 문자열로 변환 (dict/list는 JSON, 바이너리는 길이만 담은 표시로 대체)"""
+    if isinstance(value, bytes):
+        return f"[binary:{len(value)}B]"
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        try:
+            if orjson is not None:
+                return orjson.dumps(value, default=str).decode("utf-8")
+            return json.dumps(value, ensure_ascii=False, default=str)
+        except (TypeError, ValueError):
+            pass
+    return str(value)
+
+
+# 환경 변수 로드 (config에서 이미 읽었다면 다시 파싱하지 않음)
+load_env()
 openai.api_key = os.environ.get("OPENAI_API_KEY")
 
+# 키가 없으면 도구 탐색/임포트 전에 바로 실패
+if not openai.api_key:
+    raise RuntimeError("OpenAI API Key가 설정되지 않았습니다. '.env' 파일을 확인하세요.")
+
+
+@functools.lru_cache(maxsize=1)
+def _client():
+    """대화 루프에서 함께 쓰는 OpenAI 클라이언트 (HTTP 연결을 턴 사이에 재사용)"""
+    return openai.OpenAI(api_key=openai.api_key)
+
 # --- 도구(Tools) 동적 로딩 ---
 TOOLS_ROOT_DIR = "tools"
 
 loaded_tools_schemas = [] # LLM에게 전달할 모든 도구의 스키마 목록
 loaded_tool_functions = {} # LLM이 호출할 함수 이름과 실제 파이썬 함수 매핑
 
-# 표준 도구 인터페이스 로드 시도
+# 표준 도구 인터페이스 로드 시도 (패키지 경로로 임포트하므로 sys.path를 다시 건드리지 않음)
 try:
-    tool_interface_path = os.path.join(current_script_dir, TOOLS_ROOT_DIR, "tool_interface.py")
-    if os.path.exists(tool_interface_path):
-        sys.path.insert(0, os.path.join(current_script_dir, TOOLS_ROOT_DIR))
-        try:
-            from tool_interface import validate_tool_module
-            print("[Tool Interface] 도구 검증 인터페이스를 로드했습니다.")
-            VALIDATOR_AVAILABLE = True
-        except ImportError:
-            print("[Tool Interface] 도구 검증 인터페이스를 로드하는 데 실패했습니다. 기본 검증을 사용합니다.")
-            VALIDATOR_AVAILABLE = False
-    else:
-        print("[Tool Interface] tool_interface.py를 찾을 수 없습니다. 기본 검증을 사용합니다.")
-        VALIDATOR_AVAILABLE = False
+    from tools.tool_interface import validate_tool_module
+    logger.debug("[Tool Interface] 도구 검증 인터페이스를 로드했습니다.")
+    VALIDATOR_AVAILABLE = True
+except ImportError:
+    logger.warning("[Tool Interface] 도구 검증 인터페이스를 로드하는 데 실패했습니다. 기본 검증을 사용합니다.")
+    VALIDATOR_AVAILABLE = False
 except Exception as e:
-    print(f"[Tool Interface] 도구 인터페이스 로드 중 오류 발생: {e}")
+    logger.error("[Tool Interface] 도구 인터페이스 로드 중 오류 발생: %s", e)
     VALIDATOR_AVAILABLE = False
 
 # 기본 검증 함수 정의
@@ -54,32 +94,45 @@ if not VALIDATOR_AVAILABLE:
         has_tool_map = hasattr(module, 'TOOL_MAP') and isinstance(module.TOOL_MAP, dict)
         return has_schemas and has_tool_map
 
-# 어시스턴트가 사용할 도구 모듈 리스트
-# tools 폴더를 스캔하여 동적으로 로드합니다.
-tool_modules_to_load = []
-
-tools_root_abs_path = os.path.join(current_script_dir, TOOLS_ROOT_DIR)
-if os.path.exists(tools_root_abs_path):
-    for tool_dir_name in os.listdir(tools_root_abs_path):
-        tool_dir_path = os.path.join(tools_root_abs_path, tool_dir_name)
-        # __pycache__ 같은 폴더는 무시하고, 실제 디렉토리인지 확인
-        if os.path.isdir(tool_dir_path) and not tool_dir_name.startswith('__'):
-            # tool_template은 실제 도구가 아니므로 로드하지 않음
-            if tool_dir_name == "tool_template":
+
+def _cached_import(module_name: str, _modules=sys.modules):
+    """이미 임포트된 모듈은 sys.modules에서 바로 꺼내고, 없을 때만 import_module 호출"""
+    module = _modules.get(module_name)
+    if module is not None:
+        return module
+    return importlib.import_module(module_name)
+
+
+# 도구로 로드하지 않는 디렉토리 (tool_template은 새 도구를 만들 때 쓰는 예시)
+_EXCLUDE_TOOL_DIRS = frozenset({"__pycache__", "tool_template"})
+
+
+def _is_loadable_tool_dir(name: str) -> bool:
+    """이름만으로 도구 디렉토리 후보인지 판단 (__로 시작하거나 제외 목록이면 False)"""
+    return not name.startswith("__") and name not in _EXCLUDE_TOOL_DIRS
+
+
+def _discover_tool_modules(directory: str) -> List[Tuple[str, str]]:
+    """
+    도구 디렉토리를 scandir 한 번으로 훑어 로드할 (도구 이름, core.py 경로) 목록을 반환합니다.
+    
+    이름으로 거를 수 있는 항목(__pycache__, 제외 목록)은 파일 시스템 조회 없이 건너뛰고,
+    디렉토리 여부는 dirent에 캐시된 정보로 판단하므로 도구마다 core.py 확인 stat 한 번만 한다.
+    """
+    discovered = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            tool_name = entry.name
+            if not _is_loadable_tool_dir(tool_name) or not entry.is_dir():
                 continue
-                
-            core_file_path = os.path.join(tool_dir_path, 'core.py')
-            if os.path.exists(core_file_path):
-                module_path_str = f"{tool_dir_name}.core"
-                tool_modules_to_load.append(module_path_str)
-                print(f"[Tool Discovery] 도구 모듈 발견: {module_path_str}")
-
-# --- 도구 동적 로딩 (import) ---
-# 발견된 모듈들을 실제로 임포트하고, 스키마와 함수를 로드합니다.
-if not tool_modules_to_load:
-    print("WARNING: No tool modules found to load.")
-
-def load_tools_from_directory(directory: str) -> tuple:
+            core_module_path = os.path.join(entry.path, "core.py")
+            if os.path.isfile(core_module_path):
+                discovered.append((tool_name, core_module_path))
+    return discovered
+
+
+def load_tools_from_directory(directory: str, force_reload: bool = False,
+                              discovered: Optional[List[Tuple[str, str]]] = None) -> tuple:
     """
     지정된 디렉토리에서 모든 도구 스키마와 함수를 동적으로 로드합니다.
     
@@ -88,101 +141,136 @@ def load_tools_from_directory(directory: str) -> tuple:
     
     Args:
         directory (str): 도구 디렉토리의 절대 경로
+        force_reload (bool): True면 이미 임포트된 도구 모듈도 다시 로드
+        discovered (list, optional): _discover_tool_modules로 미리 찾은 (도구 이름, core.py 경로) 목록.
+                                     없으면 directory를 훑어 찾음
         
     Returns:
         tuple: (모든 도구 스키마 목록, 함수 이름과 구현의 매핑 딕셔너리)
     """
     all_schemas = []
     all_tool_maps = {}
-    exclude_dirs = set(['__pycache__', 'tool_template'])  # 제외할 디렉토리 목록
-
-    for tool_name in os.listdir(directory):
-        tool_path = os.path.join(directory, tool_name)
-        if os.path.isdir(tool_path) and tool_name not in exclude_dirs:
-            core_module_path = os.path.join(tool_path, "core.py")
-            if os.path.exists(core_module_path):
-                module_name = f"tools.{tool_name}.core"
-                try:
-                    # 이전에 로드된 모듈이 있다면 리로드
-                    if module_name in sys.modules:
-                        module = importlib.reload(sys.modules[module_name])
-                    else:
-                        module = importlib.import_module(module_name)
-                    
-                    print(f"[Tool Discovery] 도구 모듈 로드 중: {module_name}")
-                    
-                    # 모듈 검증
-                    is_valid = validate_tool_module(module)
-                    if not is_valid:
-                        print(f"[Tool Validation] 경고: {module_name} 모듈이 도구 인터페이스를 준수하지 않습니다. 이 모듈은 로드되지 않습니다.")
-                        continue
+    if discovered is None:
+        discovered = _discover_tool_modules(directory)
 
-                    schemas = getattr(module, 'TOOL_SCHEMAS', None)
-                    tool_map = getattr(module, 'TOOL_MAP', None)
+    for tool_name, _core_path in discovered:
+        module_name = f"tools.{tool_name}.core"
+        try:
+            # 이미 임포트된 모듈은 그대로 사용 (force_reload일 때만 리로드)
+            if force_reload and module_name in sys.modules:
+                module = importlib.reload(sys.modules[module_name])
+            else:
+                module = _cached_import(module_name)
+            
+            logger.debug("[Tool Discovery] 도구 모듈 로드 중: %s", module_name)
+            
+            # 모듈 검증
+            is_valid = validate_tool_module(module)
+            if not is_valid:
+                logger.warning("[Tool Validation] 경고: %s 모듈이 도구 인터페이스를 준수하지 않습니다. 이 모듈은 로드되지 않습니다.", module_name)
+                continue
 
-                    # 스키마 로드
-                    if schemas and isinstance(schemas, list):
-                        # 정보 로깅을 위해 도구 이름 추출
-                        tool_names = [schema.get('function', {}).get('name', 'unknown') 
-                                      for schema in schemas if 'function' in schema]
-                        tool_names_str = ", ".join(tool_names)
-                        
-                        all_schemas.extend(schemas)
-                        print(f"  - {tool_name}.core에서 {len(schemas)}개 도구 스키마 로드: {tool_names_str}")
-                    else:
-                        print(f"[Tool Load] 경고: {tool_name}.core에서 유효한 'TOOL_SCHEMAS' 리스트를 찾을 수 없습니다.")
-                        continue
+            schemas = getattr(module, 'TOOL_SCHEMAS', None)
+            tool_map = getattr(module, 'TOOL_MAP', None)
 
-                    # 함수 매핑 로드
-                    if tool_map and isinstance(tool_map, dict):
-                        # 함수 이름과 모듈 정보를 함께 기록하여 디버깅에 도움이 되도록 함
-                        for func_name, func in tool_map.items():
-                            if func_name in all_tool_maps:
-                                print(f"[Tool Load] 경고: '{func_name}' 함수가 이미 로드되어 있습니다. {tool_name}.core의 구현으로 덮어씌웁니다.")
-                            all_tool_maps[func_name] = func
-                            
-                        print(f"  - {tool_name}.core에서 {len(tool_map)}개 함수 로드: {', '.join(tool_map.keys())}")
-                    else:
-                        print(f"[Tool Load] 경고: {tool_name}.core에서 유효한 'TOOL_MAP' 딕셔너리를 찾을 수 없습니다.")
-                        continue
+            # 스키마 로드
+            if schemas and isinstance(schemas, list):
+                # 정보 로깅을 위해 도구 이름 추출 (형식이 잘못된 스키마는 여기서 걸러짐)
+                tool_names = [schema.get('function', {}).get('name', 'unknown') 
+                              for schema in schemas if 'function' in schema]
+                
+                all_schemas.extend(schemas)
+                logger.debug("  - %s.core에서 %d개 도구 스키마 로드: %s", tool_name, len(schemas), ", ".join(tool_names))
+            else:
+                logger.warning("[Tool Load] 경고: %s.core에서 유효한 'TOOL_SCHEMAS' 리스트를 찾을 수 없습니다.", tool_name)
+                continue
 
-                    # 스키마와 함수 매핑의 일관성 검증
-                    schema_function_names = set()
-                    for schema in schemas:
-                        if 'function' in schema:
-                            function_name = schema['function'].get('name')
-                            if function_name:
-                                schema_function_names.add(function_name)
-                    
-                    tool_map_function_names = set(tool_map.keys())
-                    
-                    # 스키마에는 있지만 구현이 없는 함수 확인
-                    missing_implementations = schema_function_names - tool_map_function_names
-                    if missing_implementations:
-                        print(f"[Tool Validation] 경고: {tool_name}.core에서 다음 함수들의 구현이 없습니다: {', '.join(missing_implementations)}")
+            # 함수 매핑 로드
+            if tool_map and isinstance(tool_map, dict):
+                # 함수 이름과 모듈 정보를 함께 기록하여 디버깅에 도움이 되도록 함
+                for func_name, func in tool_map.items():
+                    if func_name in all_tool_maps:
+                        logger.warning("[Tool Load] 경고: '%s' 함수가 이미 로드되어 있습니다. %s.core의 구현으로 덮어씌웁니다.", func_name, tool_name)
+                    all_tool_maps[func_name] = func
                     
-                    # 구현은 있지만 스키마가 없는 함수 확인
-                    extra_implementations = tool_map_function_names - schema_function_names
-                    if extra_implementations:
-                        print(f"[Tool Validation] 정보: {tool_name}.core에서 다음 함수들은 스키마가 없습니다: {', '.join(extra_implementations)}")
-
-                except ImportError as e:
-                    print(f"[Tool Load] 오류: 모듈 {module_name}를 가져올 수 없습니다. 오류: {e}")
-                except Exception as e:
-                    print(f"[Tool Load] 오류: {module_name} 모듈 로드 중 예상치 못한 오류 발생: {e}")
-    
-    print(f"[Tool Summary] 총 {len(all_schemas)}개 도구 스키마와 {len(all_tool_maps)}개 함수 매핑을 로드했습니다.")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("  - %s.core에서 %d개 함수 로드: %s", tool_name, len(tool_map), ", ".join(tool_map.keys()))
+            else:
+                logger.warning("[Tool Load] 경고: %s.core에서 유효한 'TOOL_MAP' 딕셔너리를 찾을 수 없습니다.", tool_name)
+                continue
+
+            # 스키마와 함수 매핑의 일관성 검증 (이름 집합이 같으면 차집합 계산은 건너뜀)
+            schema_function_names = {
+                schema['function'].get('name') for schema in schemas if 'function' in schema
+            }
+            schema_function_names.discard(None)
+            schema_function_names.discard('')
+            if schema_function_names != tool_map.keys():
+                tool_map_function_names = set(tool_map.keys())
+                
+                # 스키마에는 있지만 구현이 없는 함수 확인
+                missing_implementations = schema_function_names - tool_map_function_names
+                if missing_implementations:
+                    logger.warning("[Tool Validation] 경고: %s.core에서 다음 함수들의 구현이 없습니다: %s", tool_name, ", ".join(missing_implementations))
+                
+                # 구현은 있지만 스키마가 없는 함수 확인
+                extra_implementations = tool_map_function_names - schema_function_names
+                if extra_implementations:
+                    logger.info("[Tool Validation] 정보: %s.core에서 다음 함수들은 스키마가 없습니다: %s", tool_name, ", ".join(extra_implementations))
+
+        except ImportError as e:
+            logger.error("[Tool Load] 오류: 모듈 %s를 가져올 수 없습니다. 오류: %s", module_name, e)
+        except Exception as e:
+            logger.error("[Tool Load] 오류: %s 모듈 로드 중 예상치 못한 오류 발생: %s", module_name, e)
+
+    if not all_tool_maps:
+        logger.warning("No tool modules found to load.")
+    logger.info("[Tool Summary] 총 %d개 도구 스키마와 %d개 함수 매핑을 로드했습니다.", len(all_schemas), len(all_tool_maps))
     return all_schemas, all_tool_maps
 
 loaded_tools_schemas, loaded_tool_functions = load_tools_from_directory(tools_abs_path)
 
-# --- LLM을 통한 명령 처리 및 함수 호출 로직 (아래는 변경 없음) ---
-def process_command_with_llm_and_tools(command_text: str, conversation_history: list, context: Optional[dict] = None) -> dict:
-    if not command_text:
-        return {"status": "error", "response": "명령을 받지 못했습니다."}
+# 업로드 파일 프리뷰 방식별 확장자
+_TEXT_PREVIEW_EXTS = frozenset({".txt", ".md", ".csv", ".json"})
+_TABLE_PREVIEW_EXTS = frozenset({".xlsx", ".xls", ".pdf"})
+_EXCEL_EXTS = frozenset({".xlsx", ".xls"})
+# 표 프리뷰에 포함할 최대 열 수. CSV 헤더에서 i번째 열은 쉼표 i개 뒤에 오므로
+# 2000번째 이후 열은 2000자로 자르는 프리뷰에 절대 나타나지 않음
+_PREVIEW_MAX_COLS = 2000
+
+# 업로드 파일 프리뷰용 데이터 분석 도구 (pandas 등 무거운 의존성이 있어 첫 업로드 때 생성)
+_DATA_TOOL = None
+
+
+def _data_analysis_tool():
+    """DataAnalysisTool 인스턴스 (첫 호출 때 임포트/생성하고 이후 재사용)"""
+    global _DATA_TOOL
+    if _DATA_TOOL is None:
+        from tools.data_analysis import DataAnalysisTool  # type: ignore
+        _DATA_TOOL = DataAnalysisTool()
+    return _DATA_TOOL
+
+
+# 한 응답에서 요청된 도구 호출을 동시에 실행할 최대 스레드 수
+_MAX_TOOL_WORKERS = 8
 
-    # --- 시스템 프롬프트 정의 (프롬프트 튜닝/Agent 라우팅 강화) ---
-    system_prompt = '''
+
+def _run_tool_calls(calls: List[Tuple[Any, dict]]) -> list:
+    """
+    (함수, 인자) 목록을 실행해 같은 순서로 결과를 반환합니다.
+    
+    호출이 2개 이상이면 스레드 풀에서 동시에 실행합니다 (이메일/노션/파일 등 I/O 대기가 겹치도록).
+    어느 호출에서든 예외가 나면 그 예외를 그대로 다시 발생시킵니다.
+    """
+    if len(calls) <= 1:
+        return [function_to_call(**function_args) for function_to_call, function_args in calls]
+    with ThreadPoolExecutor(max_workers=min(len(calls), _MAX_TOOL_WORKERS)) as executor:
+        futures = [executor.submit(function_to_call, **function_args) for function_to_call, function_args in calls]
+        return [future.result() for future in futures]
+
+
+# --- 시스템 프롬프트 정의 (프롬프트 튜닝/Agent 라우팅 강화) ---
+_SYSTEM_PROMPT = '''
 너는 AI 비서이자 멀티에이전트 코디네이터야.  
 사용자의 요청을 분석하여, 각 에이전트(Agent)와 도구(Tool)의 전문성을 최대한 활용해 최적의 결과를 만들어내.  
 아래의 규칙과 절차를 반드시 준수해.
@@ -237,10 +325,29 @@ def process_command_with_llm_and_tools(command_text: str, conversation_history:
 (필요시, 각 에이전트/도구의 상세 역할, 예시, 포맷, 협업 시나리오 등을 추가로 명시할 수 있음)
 '''
 
+
+@functools.lru_cache(maxsize=64)
+def _personalized_system_prompt(persona_key: str) -> str:
+    """
+    페르소나 지침을 병합한 시스템 프롬프트 (같은 페르소나는 한 번만 생성)
+    
+    Args:
+        persona_key: 페르소나를 정렬된 JSON으로 직렬화한 문자열
+    """
+    return build_personalized_prompt(_SYSTEM_PROMPT, json.loads(persona_key))
+
+
+# --- LLM을 통한 명령 처리 및 함수 호출 로직 (아래는 변경 없음) ---
+def process_command_with_llm_and_tools(command_text: str, conversation_history: list, context: Optional[dict] = None) -> dict:
+    if not command_text:
+        return {"status": "error", "response": "명령을 받지 못했습니다."}
+
     # 컨텍스트의 페르소나를 시스템 프롬프트에 주입 (있을 때만)
+    system_prompt = _SYSTEM_PROMPT
     try:
         if context and isinstance(context, dict) and context.get("persona"):
-            system_prompt = build_personalized_prompt(system_prompt, context.get("persona"))
+            persona_key = json.dumps(context.get("persona"), sort_keys=True, ensure_ascii=False, default=str)
+            system_prompt = _personalized_system_prompt(persona_key)
     except Exception:
         # 페르소나 병합 실패 시 원본 프롬프트 유지
         pass
@@ -248,7 +355,7 @@ def process_command_with_llm_and_tools(command_text: str, conversation_history:
     # 대화 기록에 시스템 프롬프트 추가
     messages = [{"role": "system", "content": system_prompt}]
     # 이전 대화 기록(시스템 프롬프트 제외) 추가
-    messages.extend([msg for msg in conversation_history if msg['role'] != 'system'])
+    messages.extend(msg for msg in conversation_history if msg['role'] != 'system')
     # 업로드 파일 컨텍스트 주입(가능한 경우 간단 요약)
     if context and isinstance(context, dict) and context.get("uploaded_file"):
         try:
@@ -258,22 +365,23 @@ def process_command_with_llm_and_tools(command_text: str, conversation_history:
             file_info = f"사용자가 파일을 업로드했습니다. 이름: {file_name}, 경로: {file_path}"
             preview = ""
             if file_path and os.path.exists(file_path):
-                lower = file_path.lower()
+                ext = os.path.splitext(file_path)[1].lower()
                 # 텍스트/CSV/JSON 간단 프리뷰
-                if any(lower.endswith(ext) for ext in [".txt", ".md", ".csv", ".json"]):
+                if ext in _TEXT_PREVIEW_EXTS:
                     try:
-                        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                            preview_text = f.read(2000)
+                        # 2000자는 UTF-8로 최대 8000바이트이므로 바이트로 한 번만 읽고 디코드
+                        with open(file_path, "rb") as f:
+                            raw = f.read(8192)
+                        preview_text = raw.decode("utf-8", errors="ignore").replace("\r\n", "\n")[:2000]
                         preview = f"\n파일 내용 프리뷰(최대 2000자):\n{preview_text}"
                     except Exception:
                         preview = "\n(텍스트 프리뷰를 읽지 못했습니다)"
                 # 엑셀/PDF: 데이터 분석 도구를 우선 시도 (표 추출)
-                elif any(lower.endswith(ext) for ext in [".xlsx", ".xls", ".pdf"]):
+                elif ext in _TABLE_PREVIEW_EXTS:
                     used_analysis_tool = False
                     try:
                         # tools.data_analysis가 있으면 표를 추출하여 CSV 프리뷰 제공
-                        from tools.data_analysis import DataAnalysisTool, InsightExtractor  # type: ignore
-                        dat = DataAnalysisTool()
+                        dat = _data_analysis_tool()
                         result = dat.process_uploaded_file(file_path)
                         used_analysis_tool = True
                         df = None
@@ -282,34 +390,34 @@ def process_command_with_llm_and_tools(command_text: str, conversation_history:
                             df = tables[0].get("data")
                         elif result.get("data") is not None:
                             df = result.get("data")
-                        if df is not None is not False:
+                        if df is not None:
                             try:
-                                csv_preview = df.head(10).to_csv(index=False)
+                                # 열이 아주 많은 시트도 프리뷰(2000자)에 보일 수 있는 열까지만 CSV로 만듦
+                                head_df = df.head(10)
+                                if getattr(head_df, "ndim", 1) == 2:
+                                    head_df = head_df.iloc[:, :_PREVIEW_MAX_COLS]
+                                csv_preview = head_df.to_csv(index=False)
                             except Exception:
                                 # DataFrame이 아닐 수도 있어 문자열 처리
                                 csv_preview = str(df)[:2000]
                             if len(csv_preview) > 2000:
                                 csv_preview = csv_preview[:2000] + "\n... (truncated)"
                             preview = f"\n데이터 분석 도구 프리뷰(상위 10행, CSV 형식):\n{csv_preview}"
-                            logging.info("[assistant_core] DataAnalysisTool preview generated (len=%d)", len(csv_preview))
+                            logger.info("[assistant_core] DataAnalysisTool preview generated (len=%d)", len(csv_preview))
                         elif result.get("text"):
                             text_preview = result.get("text", "")[:2000]
                             preview = f"\n문서 텍스트 요약(최대 2000자):\n{text_preview}"
-                            logging.info("[assistant_core] DataAnalysisTool text preview generated (len=%d)", len(text_preview))
+                            logger.info("[assistant_core] DataAnalysisTool text preview generated (len=%d)", len(text_preview))
                         else:
                             preview = "\n(표/텍스트를 추출하지 못했습니다)"
-                            logging.warning("[assistant_core] DataAnalysisTool produced no tables/text for %s", file_path)
+                            logger.warning("[assistant_core] DataAnalysisTool produced no tables/text for %s", file_path)
                     except Exception:
                         # 실패 시 엑셀 기본 프리뷰로 폴백
-                        if lower.endswith((".xlsx", ".xls")):
+                        if ext in _EXCEL_EXTS:
                             try:
                                 import pandas as pd
                                 # 엔진 지정 시도 (xlsx=openpyxl, xls=xlrd)
-                                engine = None
-                                if lower.endswith(".xlsx"):
-                                    engine = "openpyxl"
-                                elif lower.endswith(".xls"):
-                                    engine = "xlrd"
+                                engine = "openpyxl" if ext == ".xlsx" else "xlrd"
                                 try:
                                     df = pd.read_excel(file_path, sheet_name=0, engine=engine)
                                 except Exception:
@@ -320,10 +428,10 @@ def process_command_with_llm_and_tools(command_text: str, conversation_history:
                                 if len(csv_preview) > 2000:
                                     csv_preview = csv_preview[:2000] + "\n... (truncated)"
                                 preview = f"\n엑셀 프리뷰(첫 시트 상위 10행, CSV 형식):\n{csv_preview}"
-                                logging.info("[assistant_core] Fallback Excel preview generated (len=%d)", len(csv_preview))
+                                logger.info("[assistant_core] Fallback Excel preview generated (len=%d)", len(csv_preview))
                             except Exception:
                                 preview = "\n(엑셀/문서 프리뷰를 읽지 못했습니다. 필요 패키지 설치 여부를 확인하세요: pandas, openpyxl, (xls의 경우 xlrd))"
-                                logging.exception("[assistant_core] Excel fallback preview failed for %s", file_path)
+                                logger.exception("[assistant_core] Excel fallback preview failed for %s", file_path)
             guidance = "\n지침: 업로드 파일 컨텍스트가 제공되었으므로, 이를 사용하여 분석/요약을 수행하세요. '파일 업로드 불가'라는 표현은 사용하지 마세요. 필요 시 도구를 호출해 표/데이터를 처리하세요. 제공된 프리뷰/표가 있다면 그것을 기반으로 바로 답변을 시작하세요."
             messages.append({"role": "system", "content": file_info + preview + guidance})
         except Exception:
@@ -335,7 +443,7 @@ def process_command_with_llm_and_tools(command_text: str, conversation_history:
     # --- LLM과의 대화 및 도구 사용 루프 ---
     while True:
         try:
-            response = openai.chat.completions.create(
+            response = _client().chat.completions.create(
                 model="gpt-4o",
                 messages=messages,
                 tools=loaded_tools_schemas,
@@ -346,48 +454,46 @@ def process_command_with_llm_and_tools(command_text: str, conversation_history:
 
             # 1. LLM이 도구 사용을 결정한 경우
             if tool_calls:
-                messages.append(response_message) # LLM의 도구 호출 결정도 대화 기록에 추가
-
+                # speak_text는 최종 응답이므로, 그 앞에 요청된 일반 도구까지만 실행
+                speak_call = None
+                regular_calls = []
                 for tool_call in tool_calls:
+                    if tool_call.function.name == "speak_text":
+                        speak_call = tool_call
+                        break
+                    regular_calls.append(tool_call)
+
+                # speak_text가 있으면 이번 턴에서 바로 반환하므로 대화 기록을 더 쌓지 않음
+                keep_history = speak_call is None
+                if keep_history:
+                    messages.append(response_message) # LLM의 도구 호출 결정도 대화 기록에 추가
+
+                # 다른 일반 도구들 처리 (여러 개면 동시에 실행하고 결과는 요청 순서대로 기록)
+                prepared = []
+                for tool_call in regular_calls:
                     function_name = tool_call.function.name
-                    function_to_call = loaded_tool_functions.get(function_name)
-                    function_args = json.loads(tool_call.function.arguments)
-
-                    # ** A2A 핵심 로직: speak_text 도구 특별 처리 **
-                    if function_name == "speak_text":
-                        print(f"[A2A Final Response] LLM decided to speak. Speed: {function_args.get('speed', 1.0)}")
-                        # 음성 답변(간결)과 상세 답변 분리
-                        voice_text = function_args.get("text", "")
-                        detailed_text = function_args.get("detailed_text", "")
-                        
-                        # 상세 답변이 없는 경우 음성 답변을 상세 답변으로 사용
-                        if not detailed_text:
-                            detailed_text = voice_text
-                            
-                        # 음성 생성은 간결한 텍스트로만 수행
-                        voice_args = {k: v for k, v in function_args.items() if k != "detailed_text"}
-                        audio_bytes = function_to_call(**voice_args)
-                        
-                        return {
-                            "status": "success",
-                            "response_type": "audio_response", # 새로운 응답 타입
-                            "voice_text": voice_text,  # 음성으로 전달되는 간결한 텍스트
-                            "detailed_text": detailed_text,  # UI에 표시될 상세 텍스트
-                            "audio_content": audio_bytes
-                        }
+                    function_args = _json_loads(tool_call.function.arguments)
+                    logger.debug("[Tool Call] Function: %s, Args: %s", function_name, function_args)
+                    prepared.append((tool_call, function_name, function_args))
+                function_responses = _run_tool_calls(
+                    [(loaded_tool_functions.get(function_name), function_args)
+                     for _, function_name, function_args in prepared]
+                )
+
+                for (tool_call, function_name, _), function_response in zip(prepared, function_responses):
+                    # 바이너리 데이터 로깅 방지 (디버그 로그가 꺼져 있으면 문자열 변환도 생략)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        if isinstance(function_response, bytes):
+                            logger.debug("[Tool Response] %s returned binary data of length: %d bytes", function_name, len(function_response))
+                        else:
+                            response_str = str(function_response)
+                            logger.debug("[Tool Response] %s returned: %s%s", function_name, response_str[:100], "..." if len(response_str) > 100 else "")
 
-                    # 다른 일반 도구들 처리
-                    print(f"[Tool Call] Function: {function_name}, Args: {function_args}")
-                    function_response = function_to_call(**function_args)
-                    
-                    # 바이너리 데이터 로깅 방지
-                    if isinstance(function_response, bytes):
-                        print(f"[Tool Response] {function_name} returned binary data of length: {len(function_response)} bytes")
-                    else:
-                        print(f"[Tool Response] {function_name} returned: {str(function_response)[:100]}{'...' if str(function_response) and len(str(function_response)) > 100 else ''}")
+                    if not keep_history:
+                        continue
 
                     # 바이너리 데이터인 경우 안전한 방법으로 처리
-                    content_value = "[Binary data]" if isinstance(function_response, bytes) else str(function_response)
+                    content_value = _tool_content(function_response)
                     
                     messages.append(
                         {
@@ -397,13 +503,43 @@ def process_command_with_llm_and_tools(command_text: str, conversation_history:
                             "content": content_value, # 함수 결과는 문자열로 변환 (바이너리는 안전하게 처리)
                         }
                     )
+
+                # ** A2A 핵심 로직: speak_text 도구 특별 처리 **
+                if speak_call is not None:
+                    function_to_call = loaded_tool_functions.get("speak_text")
+                    function_args = _json_loads(speak_call.function.arguments)
+                    logger.info("[A2A Final Response] LLM decided to speak. Speed: %s", function_args.get("speed", 1.0))
+                    # 음성 답변(간결)과 상세 답변 분리
+                    voice_text = function_args.get("text", "")
+                    detailed_text = function_args.get("detailed_text", "")
+                    
+                    # 상세 답변이 없는 경우 음성 답변을 상세 답변으로 사용
+                    if not detailed_text:
+                        detailed_text = voice_text
+                        
+                    # 음성 생성은 간결한 텍스트로만 수행
+                    voice_args = {k: v for k, v in function_args.items() if k != "detailed_text"}
+                    try:
+                        audio_bytes = function_to_call(**voice_args)
+                    except openai.RateLimitError as e:
+                        # voice_tool은 속도 제한만 그대로 올려 보냄: 답변은 버리지 않고 오디오 없이 텍스트로 전달
+                        logger.warning("[A2A Final Response] TTS rate limited, returning text only: %s", e)
+                        audio_bytes = None
+                    
+                    return {
+                        "status": "success",
+                        "response_type": "audio_response", # 새로운 응답 타입
+                        "voice_text": voice_text,  # 음성으로 전달되는 간결한 텍스트
+                        "detailed_text": detailed_text,  # UI에 표시될 상세 텍스트
+                        "audio_content": audio_bytes
+                    }
                 # 도구 사용 결과를 바탕으로 LLM이 다시 생각하도록 루프 계속
                 continue
 
             # 2. LLM이 도구 사용 없이 직접 답변을 생성한 경우 (Fallback)
             # LLM이 speak_text를 사용하라는 지시를 어긴 경우에 해당
             final_response_text = response_message.content
-            print(f"[Fallback Response] LLM generated text directly: {final_response_text}")
+            logger.info("[Fallback Response] LLM generated text directly: %s", final_response_text)
             return {
                 "status": "success",
                 "response_type": "text_fallback",
@@ -412,16 +548,13 @@ def process_command_with_llm_and_tools(command_text: str, conversation_history:
             }
         
         except Exception as e:
-            print(f"LLM 처리 중 오류 발생: {e}")
+            logger.error("LLM 처리 중 오류 발생: %s", e)
             return {"status": "error", "response": str(e)}
 
 # --- 초기 설정 및 로드 (스크립트 로드 시 한 번만 실행) ---
 GLOBAL_TOOLS_SCHEMAS = loaded_tools_schemas
 GLOBAL_TOOL_FUNCTIONS = loaded_tool_functions
 
-if not openai.api_key:
-    raise RuntimeError("OpenAI API Key가 설정되지 않았습니다. '.env' 파일을 확인하세요.")
-
 if not GLOBAL_TOOLS_SCHEMAS or not GLOBAL_TOOL_FUNCTIONS:
-    print(f"ERROR: Final check failed. loaded_tools_schemas count: {len(loaded_tools_schemas)}, loaded_tool_functions count: {len(loaded_tool_functions)}")
+    logger.error("Final check failed. loaded_tools_schemas count: %d, loaded_tool_functions count: %d", len(loaded_tools_schemas), len(loaded_tool_functions))
     raise RuntimeError("도구 로드 실패. 'tools' 디렉토리 및 core.py 파일들을 확인하세요.")
\ No newline at end of file
@@ -11,12 +11,33 @@ import os
 from typing import Optional
 from dotenv import load_dotenv
 
-# .env 파일 로드
-load_dotenv()
+# .env 파일 로드 여부 (다른 모듈에서 load_env를 다시 불러도 한 번만 파싱)
+_DOTENV_LOADED = False
+
+
+def load_env() -> None:
+    """.env 파일 로드 (프로세스에서 처음 호출될 때만 파싱)"""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
+load_env()
+
+# 실행 환경 (임포트 시 한 번만 읽음)
+ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development").lower()
+IS_DEVELOPMENT: bool = ENVIRONMENT == "development"
+IS_PRODUCTION: bool = ENVIRONMENT == "production"
+DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///my_ai_agent.db")
+
 
 class Config:
     """프로젝트 설정 클래스"""
     
+    # 설정은 모두 클래스 속성이므로 인스턴스에는 __dict__가 필요 없음
+    __slots__ = ()
+    
     # API 키 설정
     OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
     NOTION_API_KEY: Optional[str] = os.getenv("NOTION_API_KEY")
@@ -67,17 +88,17 @@ class Config:
     @classmethod
     def get_database_url(cls) -> str:
         """데이터베이스 URL 생성 (향후 확장용)"""
-        return os.getenv("DATABASE_URL", "sqlite:///my_ai_agent.db")
+        return DATABASE_URL
     
     @classmethod
     def is_development(cls) -> bool:
         """개발 환경 여부 확인"""
-        return os.getenv("ENVIRONMENT", "development").lower() == "development"
+        return IS_DEVELOPMENT
     
     @classmethod
     def is_production(cls) -> bool:
         """프로덕션 환경 여부 확인"""
-        return os.getenv("ENVIRONMENT", "development").lower() == "production"
+        return IS_PRODUCTION
 
 # 전역 설정 인스턴스
 config = Config()
@@ -2,19 +2,24 @@
 """
 Lightweight prompt loader with simple in-process cache.
 Loads YAML prompts from configs/prompts/*.yaml
+Cached entries are keyed by file mtime, so edited prompts are re-read without a restart.
 """
 from __future__ import annotations
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 try:
     import yaml  # type: ignore
 except Exception:
     yaml = None  # optional dependency; callers should handle None content
 
+# libyaml C loader when PyYAML was built with it (same safe semantics, much faster parsing)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
 _BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
 _PROMPT_DIR = os.path.join(_BASE_DIR, "configs", "prompts")
-_CACHE: Dict[str, Dict[str, Any]] = {}
+# name -> (file mtime_ns, parsed data)
+_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
 
 
 def _prompt_path(name: str) -> str:
@@ -27,17 +32,38 @@ def load_prompt(name: str) -> Optional[Dict[str, Any]]:
     Args:
         name: prompt file basename without extension (e.g., 'coordinator').
     """
-    if name in _CACHE:
-        return _CACHE[name]
     path = _prompt_path(name)
-    if not os.path.exists(path) or yaml is None:
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        _CACHE.pop(name, None)
+        return None
+    cached = _CACHE.get(name)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    if yaml is None:
         return None
     with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
-    _CACHE[name] = data
+        data = yaml.load(f, Loader=_YAML_LOADER) or {}
+    _CACHE[name] = (mtime, data)
     return data
 
 
+def prewarm() -> None:
+    """Parse every prompt YAML once (single scandir of the prompts dir).
+
+    Called once per process from app startup so the first request does not pay
+    for YAML parsing.
+    """
+    try:
+        with os.scandir(_PROMPT_DIR) as entries:
+            names = [e.name[:-5] for e in entries if e.name.endswith(".yaml") and e.is_file()]
+    except OSError:
+        return
+    for name in names:
+        load_prompt(name)
+
+
 def get_prompt_text(name: str, default: str = "") -> str:
     """Convenience to extract content text from prompt YAML.
 
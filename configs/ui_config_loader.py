@@ -2,19 +2,24 @@
 """
 Lightweight UI config loader. Loads YAML from configs/ui/*.yaml
 Provides safe fallbacks when files are missing or PyYAML is unavailable.
+Cached entries are keyed by file mtime, so edited configs are re-read without a restart.
 """
 from __future__ import annotations
 import os
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 
 try:
     import yaml  # type: ignore
 except Exception:
     yaml = None
 
+# libyaml C loader when PyYAML was built with it (same safe semantics, much faster parsing)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
 _BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
 _UI_DIR = os.path.join(_BASE_DIR, "configs", "ui")
-_CACHE: Dict[str, Dict[str, Any]] = {}
+# name -> (file mtime_ns, parsed data)
+_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
 
 
 def _ui_path(name: str) -> str:
@@ -22,14 +27,20 @@ def _ui_path(name: str) -> str:
 
 
 def load_ui_config(name: str) -> Optional[Dict[str, Any]]:
-    if name in _CACHE:
-        return _CACHE[name]
     path = _ui_path(name)
-    if not os.path.exists(path) or yaml is None:
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        _CACHE.pop(name, None)
+        return None
+    cached = _CACHE.get(name)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    if yaml is None:
         return None
     with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
-    _CACHE[name] = data
+        data = yaml.load(f, Loader=_YAML_LOADER) or {}
+    _CACHE[name] = (mtime, data)
     return data
 
 
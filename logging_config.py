@@ -7,19 +7,50 @@
 프로젝트 전체에서 사용할 표준 로깅 설정을 제공합니다.
 """
 
+import atexit
 import logging
 import logging.config
+import logging.handlers
 import os
+import queue
+import threading
 from datetime import datetime
+from typing import Iterable, Optional
 
-def setup_logging(log_level: str = "INFO", log_dir: str = "logs"):
+# 큐 로깅에 연결된 (리스너, 큐 핸들러, 대상 로거 이름들)
+_queue_logging: Optional[tuple] = None
+# 마지막으로 적용한 setup_logging 설정 (log_level, log_dir, 큐 로거 이름들)
+_applied_settings: Optional[tuple] = None
+# 설정/큐 리스너 교체를 한 스레드씩만 하도록 보호 (enable이 disable을 부르므로 재진입 가능한 락)
+_config_lock = threading.RLock()
+
+def setup_logging(log_level: str = "INFO", log_dir: str = "logs",
+                  queued_loggers: Iterable[str] = ("ErrorHandler",)):
     """
     프로젝트 전체 로깅 설정
     
     Args:
         log_level: 로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_dir: 로그 파일 저장 디렉토리
+        queued_loggers: 큐를 거쳐 백그라운드 스레드에서 출력할 로거 이름들
+    
+    Streamlit은 재실행마다 이 함수를 호출하므로, 이미 같은 설정이 적용되어 있으면
+    핸들러와 큐 리스너 스레드를 다시 만들지 않고 바로 반환합니다.
     """
+    global _applied_settings
+    settings = (log_level, log_dir, tuple(queued_loggers or ()))
+    with _config_lock:
+        if _applied_settings == settings:
+            return
+        _configure(log_level, log_dir, settings[2])
+        _applied_settings = settings
+
+
+def _configure(log_level: str, log_dir: str, queued_loggers: tuple) -> None:
+    """setup_logging의 실제 설정 적용 (_config_lock을 잡은 상태에서 호출)"""
+    # 재설정 시 이전 큐 리스너가 옛 핸들러를 잡고 있지 않도록 먼저 정리
+    disable_queue_logging()
+    
     # 로그 디렉토리 생성
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
@@ -72,6 +103,8 @@ def setup_logging(log_level: str = "INFO", log_dir: str = "logs"):
     }
     
     logging.config.dictConfig(logging_config)
+    if queued_loggers:
+        enable_queue_logging(queued_loggers)
     
     # 로깅 시작 메시지
     logger = logging.getLogger('my_ai_agent')
@@ -89,3 +122,48 @@ def get_logger(name: str) -> logging.Logger:
         로거 인스턴스
     """
     return logging.getLogger(f'my_ai_agent.{name}')
+
+
+def enable_queue_logging(logger_names: Iterable[str]) -> None:
+    """
+    지정한 로거의 기록을 큐에 넣고, 백그라운드 리스너 스레드가 루트 핸들러로 전달하도록 설정합니다.
+    
+    오류가 몰릴 때 여러 스레드가 콘솔/파일 핸들러의 락을 두고 경합하지 않도록,
+    호출 스레드는 큐에 넣기만 하고 실제 출력은 리스너 스레드 하나가 담당합니다.
+    
+    Args:
+        logger_names: 큐로 보낼 로거 이름들 (해당 로거는 루트로 전파하지 않음)
+    """
+    global _queue_logging
+    with _config_lock:
+        disable_queue_logging()
+        names = tuple(logger_names)
+        record_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            record_queue, *logging.getLogger().handlers, respect_handler_level=True
+        )
+        queue_handler = logging.handlers.QueueHandler(record_queue)
+        for name in names:
+            target = logging.getLogger(name)
+            target.addHandler(queue_handler)
+            target.propagate = False
+        listener.start()
+        _queue_logging = (listener, queue_handler, names)
+
+
+def disable_queue_logging() -> None:
+    """enable_queue_logging 설정을 해제하고, 큐에 남은 기록을 모두 출력한 뒤 리스너를 멈춥니다."""
+    global _queue_logging
+    with _config_lock:
+        if _queue_logging is None:
+            return
+        listener, queue_handler, names = _queue_logging
+        _queue_logging = None
+        for name in names:
+            target = logging.getLogger(name)
+            target.removeHandler(queue_handler)
+            target.propagate = True
+        listener.stop()
+
+
+atexit.register(disable_queue_logging)
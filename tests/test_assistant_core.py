@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def core():
+    pytest.importorskip("dotenv")
+    pytest.importorskip("openai")
+    # 키는 이 모듈의 테스트 동안만 설정 (다른 테스트 모듈로 새지 않도록 되돌림)
+    with pytest.MonkeyPatch.context() as mp:
+        if not os.environ.get("OPENAI_API_KEY"):
+            mp.setenv("OPENAI_API_KEY", "test-key")
+        import assistant_core
+        yield assistant_core
+
+
+def test_tool_loader_skips_template_and_non_tool_dirs(core):
+    schemas, functions = core.load_tools_from_directory(core.tools_abs_path)
+    names = {schema["function"]["name"] for schema in schemas if "function" in schema}
+    assert "summarize_text" in names
+    assert "summarize_text" in functions
+    # tool_template는 예시 도구이므로 로드하지 않음
+    assert not any(getattr(fn, "__module__", "").startswith("tools.tool_template") for fn in functions.values())
+
+
+def test_tool_loader_reuses_imported_modules(core, monkeypatch):
+    reloads = []
+    monkeypatch.setattr(core.importlib, "reload", lambda module: reloads.append(module) or module)
+
+    core.load_tools_from_directory(core.tools_abs_path)
+    assert reloads == []
+
+    core.load_tools_from_directory(core.tools_abs_path, force_reload=True)
+    assert any(module.__name__ == "tools.summarization_tool.core" for module in reloads)
+
+
+def test_data_analysis_tool_is_created_once(core, monkeypatch):
+    import sys
+    import types
+
+    created = []
+
+    class FakeTool:
+        def __init__(self):
+            created.append(self)
+
+    fake_pkg = types.ModuleType("tools.data_analysis")
+    fake_pkg.DataAnalysisTool = FakeTool
+    monkeypatch.setitem(sys.modules, "tools.data_analysis", fake_pkg)
+    monkeypatch.setattr(core, "_DATA_TOOL", None)
+
+    assert core._data_analysis_tool() is core._data_analysis_tool()
+    assert len(created) == 1
+
+
+def _fake_completion(monkeypatch, core, calls):
+    import types
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        message = types.SimpleNamespace(tool_calls=None, content="done")
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+    chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=create))
+    monkeypatch.setattr(core, "_client", lambda: types.SimpleNamespace(chat=chat))
+
+
+def test_persona_system_prompt_is_built_once_per_persona(core, monkeypatch):
+    calls, built = [], []
+    _fake_completion(monkeypatch, core, calls)
+    real_build = core.build_personalized_prompt
+    monkeypatch.setattr(core, "build_personalized_prompt", lambda base, persona: built.append(persona) or real_build(base, persona))
+    core._personalized_system_prompt.cache_clear()
+
+    persona = {"role": "PM", "skills": ["기획"]}
+    for text in ("첫 질문", "두 번째 질문"):
+        result = core.process_command_with_llm_and_tools(text, [], context={"persona": dict(persona)})
+        assert result["text_content"] == "done"
+    assert len(built) == 1
+    system_prompt = calls[-1]["messages"][0]["content"]
+    assert system_prompt.startswith("[페르소나 지침]") and system_prompt.endswith(core._SYSTEM_PROMPT)
+
+    core.process_command_with_llm_and_tools("페르소나 없음", [])
+    assert calls[-1]["messages"][0]["content"] is core._SYSTEM_PROMPT
+    core._personalized_system_prompt.cache_clear()
+
+
+def test_discover_tool_modules_filters_in_one_pass(core, tmp_path):
+    for name in ("alpha", "tool_template", "__pycache__", "no_core"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "alpha" / "core.py").write_text("")
+    (tmp_path / "tool_template" / "core.py").write_text("")
+    (tmp_path / "stray.py").write_text("")
+
+    assert core._discover_tool_modules(str(tmp_path)) == [("alpha", str(tmp_path / "alpha" / "core.py"))]
+    # 미리 찾은 목록을 넘기면 그 목록만 로드
+    schemas, functions = core.load_tools_from_directory(
+        core.tools_abs_path, discovered=[("summarization_tool", "")]
+    )
+    assert list(functions) == ["summarize_text"]
+
+
+def test_uploaded_text_file_preview_is_injected(core, monkeypatch, tmp_path):
+    calls = []
+    _fake_completion(monkeypatch, core, calls)
+    upload = tmp_path / "NOTES.TXT"
+    upload.write_text("회의록 첫 줄\n" + "x" * 5000, encoding="utf-8")
+
+    core.process_command_with_llm_and_tools(
+        "요약해줘", [], context={"uploaded_file": {"path": str(upload), "name": upload.name}}
+    )
+    file_message = calls[-1]["messages"][-2]["content"]
+    assert "파일 내용 프리뷰(최대 2000자)" in file_message
+    assert "회의록 첫 줄" in file_message
+    assert "x" * 2001 not in file_message
+
+
+def test_tool_results_are_sent_back_as_json(core, monkeypatch):
+    import json
+    import types
+
+    calls = []
+    replies = [
+        types.SimpleNamespace(
+            tool_calls=[types.SimpleNamespace(
+                id="call-1",
+                function=types.SimpleNamespace(name="lookup", arguments='{"query": "매출"}'),
+            )],
+            content=None,
+        ),
+        types.SimpleNamespace(tool_calls=None, content="끝"),
+    ]
+
+    def create(**kwargs):
+        calls.append(list(kwargs["messages"]))
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=replies[len(calls) - 1])])
+
+    chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=create))
+    monkeypatch.setattr(core, "_client", lambda: types.SimpleNamespace(chat=chat))
+    monkeypatch.setitem(core.loaded_tool_functions, "lookup", lambda query: {"query": query, "rows": [1, 2]})
+
+    result = core.process_command_with_llm_and_tools("매출 알려줘", [])
+    assert result["text_content"] == "끝"
+    tool_message = calls[1][-1]
+    assert tool_message["role"] == "tool"
+    assert json.loads(tool_message["content"]) == {"query": "매출", "rows": [1, 2]}
+    assert core._tool_content(b"\x00\x01") == "[binary:2B]"
+    assert core._tool_content(("a", 1)) == "('a', 1)"
+
+
+def test_speak_text_returns_without_growing_history(core, monkeypatch):
+    import types
+
+    sent = []
+
+    def tool_call(call_id, name, arguments):
+        return types.SimpleNamespace(id=call_id, function=types.SimpleNamespace(name=name, arguments=arguments))
+
+    reply = types.SimpleNamespace(
+        tool_calls=[
+            tool_call("call-1", "lookup", '{"query": "일정"}'),
+            tool_call("call-2", "speak_text", '{"text": "짧게", "detailed_text": "자세히"}'),
+        ],
+        content=None,
+    )
+
+    def create(**kwargs):
+        sent.append(kwargs["messages"])
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=reply)])
+
+    chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=create))
+    monkeypatch.setattr(core, "_client", lambda: types.SimpleNamespace(chat=chat))
+    looked_up = []
+    monkeypatch.setitem(core.loaded_tool_functions, "lookup", lambda query: looked_up.append(query) or "ok")
+    monkeypatch.setitem(core.loaded_tool_functions, "speak_text", lambda text, speed=1.0: b"AUDIO")
+
+    result = core.process_command_with_llm_and_tools("일정 알려줘", [])
+    assert result["response_type"] == "audio_response"
+    assert result["audio_content"] == b"AUDIO" and result["detailed_text"] == "자세히"
+    # 일반 도구는 실행되지만, 바로 반환하므로 대화 기록에는 더 추가하지 않음
+    assert looked_up == ["일정"]
+    assert len(sent) == 1 and sent[0][-1] == {"role": "user", "content": "일정 알려줘"}
+
+
+def test_rate_limited_speak_text_falls_back_to_text(core, monkeypatch):
+    import types
+
+    class RateLimitError(Exception):
+        pass
+
+    reply = types.SimpleNamespace(
+        tool_calls=[types.SimpleNamespace(
+            id="call-1",
+            function=types.SimpleNamespace(name="speak_text", arguments='{"text": "짧게", "detailed_text": "자세히"}'),
+        )],
+        content=None,
+    )
+    chat = types.SimpleNamespace(completions=types.SimpleNamespace(
+        create=lambda **kwargs: types.SimpleNamespace(choices=[types.SimpleNamespace(message=reply)])
+    ))
+    monkeypatch.setattr(core, "_client", lambda: types.SimpleNamespace(chat=chat))
+    monkeypatch.setattr(core.openai, "RateLimitError", RateLimitError)
+
+    def rate_limited_speak(text, speed=1.0):
+        raise RateLimitError("429 rate limited")
+
+    monkeypatch.setitem(core.loaded_tool_functions, "speak_text", rate_limited_speak)
+
+    result = core.process_command_with_llm_and_tools("알려줘", [])
+    assert result["status"] == "success"
+    assert result["detailed_text"] == "자세히" and result["audio_content"] is None
+
+
+def test_multiple_tool_calls_run_concurrently_in_order(core):
+    import threading
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def tool(name):
+        barrier.wait()  # 세 호출이 동시에 실행 중이어야 통과
+        return name
+
+    results = core._run_tool_calls([(tool, {"name": n}) for n in ("a", "b", "c")])
+    assert results == ["a", "b", "c"]
+    assert core._run_tool_calls([(lambda: "only", {})]) == ["only"]
+
+
+def test_openai_client_is_reused(core, monkeypatch):
+    created = []
+    monkeypatch.setattr(core.openai, "OpenAI", lambda **kwargs: created.append(kwargs) or object())
+    core._client.cache_clear()
+    try:
+        assert core._client() is core._client()
+        assert len(created) == 1
+    finally:
+        core._client.cache_clear()
+
+
+def test_table_upload_preview_uses_analysis_tool(core, monkeypatch, tmp_path):
+    class FakeFrame:
+        def head(self, n):
+            return self
+
+        def to_csv(self, index=False):
+            return "a,b\n1,2\n"
+
+    class FakeTool:
+        def process_uploaded_file(self, path):
+            return {"tables": [{"data": FakeFrame()}]}
+
+    calls = []
+    _fake_completion(monkeypatch, core, calls)
+    monkeypatch.setattr(core, "_DATA_TOOL", FakeTool())
+    upload = tmp_path / "sales.xlsx"
+    upload.write_bytes(b"")
+
+    core.process_command_with_llm_and_tools(
+        "분석해줘", [], context={"uploaded_file": {"path": str(upload), "name": upload.name}}
+    )
+    file_message = calls[-1]["messages"][-2]["content"]
+    assert "데이터 분석 도구 프리뷰(상위 10행, CSV 형식):\na,b\n1,2\n" in file_message
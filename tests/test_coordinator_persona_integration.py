@@ -6,21 +6,23 @@ import pytest
 def test_coordinator_attaches_persona(monkeypatch):
     # Monkeypatch PersonaSelectorAgent used inside coordinator to return a deterministic persona
     import agents.coordinator_agent as coord_mod
+    from agents.persona_selector_agent import PersonaSelection
 
     class DummySelector:
         def __init__(self, strategy="rules_first"):  # signature compatibility
             pass
         def select(self, task_meta):
-            return {
-                "name": "테스트 페르소나",
-                "score": 0.99,
-                "persona": {
+            return PersonaSelection(
+                name="테스트 페르소나",
+                persona={
                     "직책": "애널리스트",
                     "전문 분야": "연구",
                     "업무 영역": "분석",
                     "사고방식": "체계적"
-                }
-            }
+                },
+                score=0.99,
+                rationale={},
+            )
 
     monkeypatch.setattr(coord_mod, "PersonaSelectorAgent", DummySelector, raising=True)
 
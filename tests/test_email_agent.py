@@ -89,6 +89,7 @@ def patch_prompt_loader_and_openai(monkeypatch):
 
 
 def test_email_reply_includes_tone_and_preamble(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
     agent = DummyEmailAgent()
     res = agent.build_reply_prompt(
         subject="S",
@@ -104,3 +105,58 @@ def test_email_reply_includes_tone_and_preamble(monkeypatch):
     # The dummy model echoes the prompt, so it must include the preamble and tone
     assert "[REPLY-PREAMBLE]" in text_blob
     assert "요청 톤" in text_blob and "공손" in text_blob
+
+
+def test_email_full_process_runs_pipeline(monkeypatch):
+    import sys
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    calls = []
+    cache_keys = set()
+
+    class DummyAsyncCompletions:
+        async def create(self, model, messages, max_tokens, temperature, extra_body=None):
+            prompt = messages[0]["content"]
+            calls.append(prompt)
+            cache_keys.add((extra_body or {}).get("prompt_cache_key"))
+            return types.SimpleNamespace(
+                choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=prompt))]
+            )
+
+    class DummyAsyncOpenAI:
+        def __init__(self, api_key=None):
+            self.chat = types.SimpleNamespace(completions=DummyAsyncCompletions())
+
+        async def close(self):
+            pass
+
+    sys.modules["openai"].AsyncOpenAI = DummyAsyncOpenAI
+
+    from agents.email_agent import EmailAgent
+    from agents.agent_protocol import AgentMessage, MessageType
+    agent = EmailAgent()
+    message = AgentMessage(
+        type=MessageType.TASK_REQUEST.value,
+        content={
+            "task_id": "t2",
+            "task_data": {
+                "type": "full_process",
+                "email": {
+                    "subject": "S",
+                    "body": "B",
+                    "from": "alice@example.com",
+                    "history": "H",
+                    "tone": "공손한",
+                },
+            },
+        },
+    )
+    res = agent._handle_task_request(message)
+    assert res.get("status") == "success"
+    result = res["result"]
+    assert set(result) == {"summary", "analysis", "context", "reply"}
+    # summary + analysis + context + reply
+    assert len(calls) == 4
+    # all calls of one pipeline share the persona-derived prompt cache key
+    assert len(cache_keys) == 1 and None not in cache_keys
+    assert "[REPLY-PREAMBLE]" in result["reply"]
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from agents import error_handler
+from agents.error_handler import ErrorHandler, APIError, NetworkError
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(error_handler.time, "sleep", sleeps.append)
+    monkeypatch.setattr(ErrorHandler, "_retry_not_before", {})
+    yield sleeps
+
+
+def test_retry_call_retries_on_failed_check(no_sleep):
+    results = iter([{}, {}, {"status": "success"}])
+
+    def fetch(email_id, mail_folder="inbox"):
+        return next(results)
+
+    res = ErrorHandler.retry_call(
+        fetch,
+        kwargs={"email_id": "1"},
+        exceptions=(NetworkError, APIError),
+        check=bool,
+        api_name="fetch",
+    )
+    assert res == {"status": "success"}
+    assert len(no_sleep) == 2
+
+
+def test_retry_call_raises_after_max_retries(no_sleep):
+    with pytest.raises(APIError) as exc_info:
+        ErrorHandler.retry_call(
+            lambda: None,
+            max_retries=2,
+            exceptions=(APIError,),
+            check=bool,
+            error_message="실패",
+            api_name="noop",
+        )
+    assert exc_info.value.details["api_name"] == "noop"
+    assert len(no_sleep) == 1
+
+
+def test_retry_with_backoff_awaits_coroutine_functions(monkeypatch, no_sleep):
+    import asyncio
+    from agents.error_handler import APIRateLimitError
+
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(error_handler.asyncio, "sleep", fake_sleep)
+    attempts = []
+
+    async def call():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise APIRateLimitError("rate limited", api_name="openai", retry_after=5)
+        return "ok"
+
+    assert asyncio.run(ErrorHandler.retry_with_backoff(call)) == "ok"
+    # retry_after보다 일찍 보내지 않도록 작은 지연만 더해짐
+    assert len(delays) == 2
+    assert all(5 <= d <= 5.25 for d in delays)
+    # the blocking sleep is never used on the async path
+    assert no_sleep == []
+
+
+def test_backoff_wait_applies_jitter_and_cap():
+    from agents.error_handler import APIRateLimitError
+
+    waits = [ErrorHandler._backoff_wait(NetworkError("x"), 2, 0.5, 30.0) for _ in range(50)]
+    assert all(1.0 <= w <= 3.0 for w in waits)
+    assert len(set(waits)) > 1
+    assert ErrorHandler._backoff_wait(NetworkError("x"), 100, 0.5, 30.0) == 30.0
+    # server-provided retry_after is never shortened, only clamped
+    assert 3 <= ErrorHandler._backoff_wait(
+        APIRateLimitError("slow down", api_name="openai", retry_after=3), 1, 0.5, 30.0) <= 3.25
+    rate_limited = APIRateLimitError("slow down", api_name="openai", retry_after=60)
+    assert ErrorHandler._backoff_wait(rate_limited, 1, 0.5, 30.0) == 30.0
+
+
+def test_retry_after_is_shared_per_api_and_keeps_backoff_step(monkeypatch, no_sleep):
+    from agents.error_handler import APIRateLimitError
+
+    now = [100.0]
+
+    def fake_sleep(seconds):
+        no_sleep.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(error_handler.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(error_handler.time, "sleep", fake_sleep)
+    monkeypatch.setattr(error_handler.random, "uniform", lambda a, b: 0.0)
+    errors = iter([APIRateLimitError("slow down", api_name="tts", retry_after=4), NetworkError("reset")])
+
+    def flaky():
+        error = next(errors, None)
+        if error is not None:
+            raise error
+        now[0] += 10
+        return "ok"
+
+    assert ErrorHandler.retry_call(flaky, initial_delay=1, max_retries=3) == "ok"
+    # retry_after(4초) 뒤의 일반 백오프는 retry_after가 아닌 원래 단계(1초)에서 이어짐
+    assert no_sleep == [4, 1]
+
+    # 같은 API를 호출하는 다른 호출자는 공유된 대기 시각까지 첫 시도를 미룸
+    no_sleep.clear()
+    ErrorHandler._note_rate_limit(APIRateLimitError("slow down", api_name="tts", retry_after=3))
+    now[0] += 1
+    assert ErrorHandler.retry_call(lambda: "ok", api_name="tts") == "ok"
+    assert no_sleep == [2]
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    import threading
+    from agents.error_handler import SingleFlight
+
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow(value):
+        calls.append(value)
+        started.set()
+        release.wait(timeout=5)
+        return {"value": value}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", slow, 1)))
+    leader.start()
+    started.wait(timeout=5)
+    follower = threading.Thread(target=lambda: results.append(flight.do("k", slow, 2)))
+    follower.start()
+    # give the follower time to block on the leader's in-flight future
+    follower.join(timeout=0.2)
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert calls == [1]
+    assert results == [{"value": 1}, {"value": 1}]
+    # the key is released once the call completes
+    assert flight.do("k", lambda: "fresh") == "fresh"
+
+
+def test_handle_error_skips_stack_trace_unless_debug(monkeypatch):
+    formatted = []
+    monkeypatch.setattr(error_handler.traceback, "format_exc", lambda: formatted.append(1) or "TRACE")
+    monkeypatch.setattr(error_handler.logger, "level", 0)
+    monkeypatch.setattr(error_handler.logger, "isEnabledFor", lambda level: False)
+    res = ErrorHandler.handle_error(NetworkError("down"))
+    assert "stack_trace" not in res["error_info"]
+    assert formatted == []
+
+    monkeypatch.setattr(error_handler.logger, "isEnabledFor", lambda level: True)
+    res = ErrorHandler.handle_error(NetworkError("down"))
+    assert res["error_info"]["stack_trace"] == "TRACE"
+
+
+def test_handle_error_renders_traceback_only_when_needed(caplog):
+    from agents.error_handler import AgentError, ErrorSeverity
+
+    caplog.set_level("ERROR", logger="ErrorHandler")
+    try:
+        raise AgentError("boom", severity=ErrorSeverity.HIGH)
+    except AgentError as e:
+        ErrorHandler.handle_error(e)
+    ErrorHandler.handle_error(AgentError("not raised", severity=ErrorSeverity.HIGH))
+    try:
+        raise AgentError("traced", severity=ErrorSeverity.HIGH, details={"stack_trace": "..."})
+    except AgentError as e:
+        ErrorHandler.handle_error(e)
+
+    raised, not_raised, traced = caplog.records
+    assert raised.exc_info and raised.exc_info[1].message == "boom"
+    assert not not_raised.exc_info
+    assert not traced.exc_info
+
+
+def test_queue_logging_delivers_error_handler_records():
+    import logging
+    import logging_config
+
+    records = []
+
+    class ListHandler(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    root = logging.getLogger()
+    handler = ListHandler(level=logging.WARNING)
+    root.addHandler(handler)
+    try:
+        logging_config.enable_queue_logging(["ErrorHandler"])
+        assert error_handler.logger.propagate is False
+        ErrorHandler.handle_error(NetworkError("queued"))
+    finally:
+        # stop()은 큐에 남은 기록을 모두 전달한 뒤 반환
+        logging_config.disable_queue_logging()
+        root.removeHandler(handler)
+
+    assert error_handler.logger.propagate is True
+    assert [r.getMessage() for r in records] == ["Medium Severity Error: queued"]
+
+
+def test_setup_logging_is_applied_once_per_settings(tmp_path, monkeypatch):
+    import logging
+    import threading
+    import logging_config
+
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    started = []
+    real_enable = logging_config.enable_queue_logging
+    monkeypatch.setattr(logging_config, "enable_queue_logging",
+                        lambda names: started.append(names) or real_enable(names))
+    monkeypatch.setattr(logging_config, "_applied_settings", None)
+    try:
+        # Streamlit 재실행처럼 여러 세션 스레드가 동시에 같은 설정을 요청해도 한 번만 적용
+        threads = [
+            threading.Thread(target=logging_config.setup_logging, kwargs={"log_dir": str(tmp_path)})
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logging_config.setup_logging(log_dir=str(tmp_path))
+        assert len(started) == 1
+        listener = logging_config._queue_logging[0]
+
+        logging_config.setup_logging(log_level="DEBUG", log_dir=str(tmp_path))
+        assert len(started) == 2
+        assert logging_config._queue_logging[0] is not listener
+    finally:
+        logging_config.disable_queue_logging()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+            handler.close()
+        for handler in saved_handlers:
+            root.addHandler(handler)
+        root.setLevel(saved_level)
+
+
+def test_agent_error_reports_current_severity():
+    from agents.error_handler import AgentError, ErrorSeverity
+
+    err = AgentError("x", severity=ErrorSeverity.HIGH)
+    assert err.to_dict()["severity"] == "HIGH"
+    err.severity = ErrorSeverity.LOW
+    assert err.severity is ErrorSeverity.LOW
+    assert err.to_dict()["severity"] == "LOW"
+    assert ErrorHandler.handle_error(err)["error_info"]["severity"] == "LOW"
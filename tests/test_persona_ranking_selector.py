@@ -41,8 +41,7 @@ def test_selector_with_hierarchy_and_rationale():
     res = agent.select(meta)
     # 선택이 되면 rationale 포함
     if res is not None:
-        assert "rationale" in res
-        rat = res["rationale"]
+        rat = res.rationale
         assert isinstance(rat, dict)
         # 최소한 필터 단계 요약이 있어야 함
         assert "filters" in rat
@@ -53,3 +52,47 @@ def test_collaborators_at_least_returns_list():
     names = agent.select_collaborators({"category": "개발자", "skills": ["LLM", "RAG"]}, k=2)
     assert isinstance(names, list)
     assert len(names) <= 2
+
+
+def test_rank_results_reused_for_same_meta(monkeypatch):
+    calls = []
+    original = R.rank_for_task
+
+    def counting_rank(*args, **kwargs):
+        calls.append(kwargs.get("top_k"))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(R, "rank_for_task", counting_rank)
+    agent = A()
+    meta = {"category": "pm", "skills": ["AARRR", "전환율"]}
+    first = agent.select_pair(meta)
+    second = agent.select_pair(dict(meta, skills=list(meta["skills"])))
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_single_candidate_skips_ranking(monkeypatch):
+    def failing_rank(*args, **kwargs):
+        raise AssertionError("rank_for_task should not be called")
+
+    monkeypatch.setattr(R, "rank_for_task", failing_rank)
+    agent = A()
+    monkeypatch.setattr(agent, "_hierarchical_candidates", lambda meta, all_data: (["solo"], {"filters": []}))
+    assert agent.select_pair({"category": "pm"}) == {"writer": "solo", "reviewer": None}
+    assert agent.select_collaborators({"category": "pm"}, k=3) == ["solo"]
+
+
+def test_malformed_task_meta_is_rejected():
+    agent = A()
+    assert agent.select({"category": ["pm"]}) is None
+    assert agent.select_pair("pm") == {"writer": None, "reviewer": None}
+    assert agent.select_collaborators({"role": 3}) == []
+
+
+def test_selection_fields_are_attributes():
+    from agents.persona_selector_agent import PersonaSelection
+
+    sel = PersonaSelection("kim", {"category": "pm"}, 1.5, {"filters": []})
+    assert sel.name == sel[0] == "kim"
+    assert sel.score == 1.5 and sel.rationale == {"filters": []}
+    assert sel._asdict() == {"name": "kim", "persona": {"category": "pm"}, "score": 1.5, "rationale": {"filters": []}}
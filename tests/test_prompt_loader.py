@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+pytest.importorskip("yaml")
+
+from configs import prompt_loader
+
+
+@pytest.fixture
+def prompt_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(prompt_loader, "_PROMPT_DIR", str(tmp_path))
+    monkeypatch.setattr(prompt_loader, "_CACHE", {})
+    return tmp_path
+
+
+def test_prompt_is_reloaded_when_file_changes(prompt_dir):
+    path = prompt_dir / "greeting.yaml"
+    path.write_text("content: 안녕\n", encoding="utf-8")
+    assert prompt_loader.get_prompt_text("greeting") == "안녕"
+
+    first = prompt_loader.load_prompt("greeting")
+    assert prompt_loader.load_prompt("greeting") is first
+
+    path.write_text("content: 반가워\n", encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert prompt_loader.get_prompt_text("greeting") == "반가워"
+
+    path.unlink()
+    assert prompt_loader.get_prompt_text("greeting", "기본") == "기본"
+
+
+def test_prewarm_parses_every_prompt_once(prompt_dir):
+    (prompt_dir / "a.yaml").write_text("content: A\n", encoding="utf-8")
+    (prompt_dir / "b.yaml").write_text("content: B\n", encoding="utf-8")
+    (prompt_dir / "notes.txt").write_text("skip", encoding="utf-8")
+
+    prompt_loader.prewarm()
+    assert set(prompt_loader._CACHE) == {"a", "b"}
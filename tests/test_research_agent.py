@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import asyncio
 import sys
 import types
 import pytest
@@ -80,3 +81,489 @@ def test_research_agent_uses_yaml_and_persona(monkeypatch):
     used_prompt = result.get("used_prompt", "")
     assert "RESEARCH-PREAMBLE" in used_prompt
     assert "페르소나 지침" in used_prompt
+
+
+def test_research_agent_processes_tasks_concurrently():
+    import threading
+    from agents.research_agent import ResearchAgent
+
+    agent = ResearchAgent()
+    # 두 요청이 동시에 진행될 때만 통과하는 barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _ConcurrentSummarizer:
+        def summarize_text(self, text, prompt_template):
+            barrier.wait()
+            return {"status": "success", "summary": f"SUM({text})"}
+
+    agent.loaded_tools["summarization_tool"] = _ConcurrentSummarizer()
+    tasks = [
+        {"type": "research", "task_id": "a", "content": "첫 번째 쿼리"},
+        {"type": "research", "task_id": "b", "content": "두 번째 쿼리"},
+        {"type": "research", "task_id": "c", "content": "   "},
+    ]
+
+    results = agent.process_tasks(tasks, max_concurrent_requests=2)
+    assert [r["task_id"] for r in results] == ["a", "b", "c"]
+    assert results[0]["result"]["summary"] == "SUM(첫 번째 쿼리)"
+    assert results[1]["result"]["summary"] == "SUM(두 번째 쿼리)"
+    assert results[2] == {"status": "error", "task_id": "c", "subtask_id": "c", "error": "Empty query"}
+
+
+def test_process_tasks_works_inside_a_running_event_loop():
+    from agents.research_agent import ResearchAgent
+
+    agent = ResearchAgent()
+
+    class _EchoSummarizer:
+        def summarize_text(self, text, prompt_template):
+            return {"status": "success", "summary": f"SUM({text})"}
+
+    agent.loaded_tools["summarization_tool"] = _EchoSummarizer()
+
+    async def handler():
+        # 비동기 코드 안에서 동기 래퍼를 불러도 asyncio.run() 중첩 오류가 나지 않아야 함
+        return agent.process_tasks([{"type": "research", "task_id": "a", "content": "루프 안 쿼리"}])
+
+    results = asyncio.run(handler())
+    assert results[0]["result"]["summary"] == "SUM(루프 안 쿼리)"
+
+
+def test_cache_key_uses_full_normalized_query():
+    from agents.research_agent import _cache_key
+
+    prefix = "가" * 60
+    assert _cache_key(prefix + " 첫째") != _cache_key(prefix + " 둘째")
+    assert _cache_key("  AI   음성 기술 ") == _cache_key("ai 음성 기술")
+
+
+def test_research_cache_is_bounded_lru():
+    from agents.research_agent import ResearchAgent
+
+    agent = ResearchAgent(cache_size=2)
+    calls = []
+
+    class _CountingSummarizer:
+        def summarize_text(self, text, prompt_template):
+            calls.append(text)
+            return {"status": "success", "summary": f"SUM({text})"}
+
+    agent.loaded_tools["summarization_tool"] = _CountingSummarizer()
+    for query in ["a", "b", "a", "c", "b"]:
+        agent.process_task({"type": "research", "task_id": query, "content": query})
+
+    # "b"는 "c" 저장 시 가장 오래 사용하지 않은 항목으로 밀려나 다시 요약된다
+    assert calls == ["a", "b", "c", "b"]
+    assert len(agent.information_cache) == 2
+    info = agent.information_cache.cache_info()
+    assert (info.hits, info.misses, info.maxsize) == (1, 4, 2)
+
+
+def test_built_in_summarize_reuses_client(monkeypatch):
+    import agents.research_agent as research_agent_module
+    from agents.research_agent import ResearchAgent
+
+    created = []
+
+    class _Completions:
+        def create(self, model, messages, max_tokens, temperature, response_format=None):
+            return types.SimpleNamespace(
+                choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=" 요약 "))]
+            )
+
+    class _Client:
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+            self.chat = types.SimpleNamespace(completions=_Completions())
+
+    monkeypatch.setattr(research_agent_module, "OpenAI", _Client)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    agent = ResearchAgent()
+    assert agent._built_in_summarize("첫 번째")["summary"] == "요약"
+    assert agent._built_in_summarize("두 번째")["summary"] == "요약"
+    assert len(created) == 1
+    assert created[0]["max_retries"] == 0
+
+
+def test_task_request_with_list_content_is_processed_as_batch():
+    from agents.research_agent import ResearchAgent
+
+    agent = ResearchAgent()
+
+    class _DummySummarizer:
+        def summarize_text(self, text, prompt_template):
+            return {"status": "success", "summary": f"SUM({text})"}
+
+    agent.loaded_tools["summarization_tool"] = _DummySummarizer()
+    res = agent._handle_task_request({
+        "sender_id": "coordinator",
+        "message_id": "m1",
+        "content": ["쿼리 A", {"type": "research", "task_id": "t2", "content": "쿼리 B"}],
+    })
+    assert res["status"] == "success"
+    assert [r["task_id"] for r in res["results"]] == ["m1_0", "t2"]
+    assert res["results"][1]["result"]["summary"] == "SUM(쿼리 B)"
+
+
+def test_personalized_prompt_built_once_per_persona(monkeypatch):
+    import agents.research_agent as research_agent_module
+    from agents.research_agent import ResearchAgent
+
+    built = []
+    original = research_agent_module.build_personalized_prompt
+
+    def counting_build(base_prompt, persona):
+        built.append(persona)
+        return original(base_prompt, persona)
+
+    monkeypatch.setattr(research_agent_module, "build_personalized_prompt", counting_build)
+    research_agent_module._build_prompt_cached.cache_clear()
+    agent = ResearchAgent()
+    persona = {"직책": "리서처", "전문 분야": "기술 조사"}
+    first = agent._research_prompt_template({"persona": persona})
+    second = agent._research_prompt_template({"persona": dict(reversed(list(persona.items())))})
+    assert first == second
+    assert "페르소나 지침" in first
+    assert built == [persona]
+    research_agent_module._build_prompt_cached.cache_clear()
+
+
+def test_tools_are_loaded_on_first_use(monkeypatch):
+    from agents.research_agent import ResearchAgent
+
+    calls = []
+    original = ResearchAgent._load_tools
+
+    def counting_load(self):
+        calls.append(self.agent_id)
+        original(self)
+
+    monkeypatch.setattr(ResearchAgent, "_load_tools", counting_load)
+    agent = ResearchAgent()
+    assert calls == []
+    assert "summarization_tool" in agent.loaded_tools
+    agent.loaded_tools
+    assert calls == [agent.agent_id]
+
+
+def test_summary_response_parses_json_and_falls_back_to_text():
+    from agents.research_agent import _parse_summary_response
+
+    parsed = _parse_summary_response('{"summary": " 핵심 ", "facts": ["A"], "sources": "문서"}')
+    assert parsed == {"status": "success", "summary": "핵심", "facts": ["A"], "sources": ["문서"]}
+    plain = _parse_summary_response(" 그냥 텍스트 ")
+    assert plain == {"status": "success", "summary": "그냥 텍스트", "facts": [], "sources": []}
+
+
+def test_built_in_summarize_retries_only_transient_errors(monkeypatch):
+    import agents.research_agent as research_agent_module
+    from agents import error_handler
+    from agents.research_agent import ResearchAgent
+
+    class RateLimitError(Exception):
+        def __init__(self, message, retry_after):
+            super().__init__(message)
+            self.response = types.SimpleNamespace(headers={"retry-after": retry_after})
+
+    class APIConnectionError(Exception):
+        pass
+
+    fake_openai = types.ModuleType("openai")
+    fake_openai.RateLimitError = RateLimitError
+    fake_openai.APIConnectionError = APIConnectionError
+    monkeypatch.setitem(sys.modules, "openai", fake_openai)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    sleeps = []
+    monkeypatch.setattr(error_handler.time, "sleep", sleeps.append)
+    monkeypatch.setattr(error_handler.ErrorHandler, "_retry_not_before", {})
+
+    outcomes = []
+
+    class _Completions:
+        def create(self, **kwargs):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return types.SimpleNamespace(
+                choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=outcome))]
+            )
+
+    agent = ResearchAgent()
+    agent._openai_client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=_Completions()))
+    monkeypatch.setattr(research_agent_module, "OpenAI", object)
+
+    outcomes[:] = [RateLimitError("slow down", "2"), APIConnectionError("reset"), '{"summary": "ok"}']
+    assert agent._built_in_summarize("텍스트")["summary"] == "ok"
+    # 첫 대기는 Retry-After(2초)보다 짧지 않게 따르고, 이후는 지수 백오프 + 지터
+    assert 2 <= sleeps[0] <= 2.25
+    assert len(sleeps) == 2
+
+    sleeps.clear()
+    outcomes[:] = [ValueError("bad request")]
+    res = agent._built_in_summarize("텍스트")
+    assert res["status"] == "error" and "bad request" in res["error"]
+    assert sleeps == []
+
+
+def _stream_chunk(text):
+    return types.SimpleNamespace(choices=[types.SimpleNamespace(delta=types.SimpleNamespace(content=text))])
+
+
+def test_built_in_summarize_streams_deltas_to_callback(monkeypatch):
+    import agents.research_agent as research_agent_module
+    from agents.research_agent import ResearchAgent
+
+    requests = []
+
+    class _Completions:
+        def create(self, **kwargs):
+            requests.append(kwargs)
+            return iter([_stream_chunk("부분 "), _stream_chunk(None), _stream_chunk("응답")])
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    agent = ResearchAgent()
+    agent._openai_client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=_Completions()))
+    monkeypatch.setattr(research_agent_module, "OpenAI", object)
+
+    # 기본 도구 로딩으로 summarization_tool이 있어도 스트리밍 요청은 내장 요약으로 처리
+    assert "summarization_tool" in agent.loaded_tools
+    tool_calls = []
+    monkeypatch.setattr(agent.loaded_tools["summarization_tool"], "summarize_text",
+                        lambda *args, **kwargs: tool_calls.append(args))
+
+    deltas = []
+    res = agent._process_research_task({"task_id": "t1", "content": "스트리밍 질문", "on_delta": deltas.append})
+    assert tool_calls == []
+    assert deltas == ["부분 ", "응답"]
+    assert res["status"] == "success" and res["result"]["summary"] == "부분 응답"
+    assert requests[0]["stream"] is True and "response_format" not in requests[0]
+
+
+def test_stream_research_yields_chunks_and_caches_result(monkeypatch):
+    from agents.research_agent import ResearchAgent, _cache_key
+
+    class _AsyncStream:
+        def __init__(self, texts):
+            self._texts = list(texts)
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            if not self._texts:
+                raise StopAsyncIteration
+            return _stream_chunk(self._texts.pop(0))
+
+    class _Completions:
+        async def create(self, **kwargs):
+            assert kwargs["stream"] is True
+            return _AsyncStream(["첫 ", "조각"])
+
+    class _Client:
+        chat = types.SimpleNamespace(completions=_Completions())
+        closed = False
+
+        async def close(self):
+            _Client.closed = True
+
+    agent = ResearchAgent()
+    monkeypatch.setattr(agent, "_create_async_client", lambda: _Client())
+
+    async def _consume(query):
+        return [delta async for delta in agent.stream_research(query)]
+
+    assert asyncio.run(_consume("스트림 질문")) == ["첫 ", "조각"]
+    assert _Client.closed
+    assert agent.information_cache[_cache_key("스트림 질문")]["summary"] == "첫 조각"
+    # 캐시 적중 시 저장된 요약을 한 번에 전달
+    assert asyncio.run(_consume("스트림  질문")) == ["첫 조각"]
+
+
+def test_summarization_errors_are_cached_briefly(monkeypatch):
+    from agents.research_agent import ResearchAgent
+    from utils import lru_cache
+
+    now = [1000.0]
+    monkeypatch.setattr(lru_cache.time, "monotonic", lambda: now[0])
+
+    calls = []
+
+    def failing_summarize(text, template=None):
+        calls.append(text)
+        return {"status": "error", "error": "upstream failure"}
+
+    agent = ResearchAgent()
+    agent._loaded_tools = {"summarization_tool": types.SimpleNamespace(summarize_text=failing_summarize)}
+
+    first = agent._process_research_task({"task_id": "t1", "content": "실패 질문"})
+    second = agent._process_research_task({"task_id": "t2", "content": "실패  질문"})
+    assert first["error"] == second["error"] == "Summarization error: upstream failure"
+    assert second["task_id"] == "t2"
+    assert len(calls) == 1
+
+    # TTL이 지나면 다시 요약을 시도
+    now[0] += 11
+    agent._process_research_task({"task_id": "t3", "content": "실패 질문"})
+    assert len(calls) == 2
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    from utils import lru_cache
+
+    now = [0.0]
+    monkeypatch.setattr(lru_cache.time, "monotonic", lambda: now[0])
+    cache = lru_cache.TTLCache(maxsize=2, ttl=5)
+    cache["a"] = 1
+    cache.set("b", 2, ttl=1)
+    now[0] = 2
+    assert "b" not in cache and cache.get("b") is None
+    assert cache["a"] == 1
+    now[0] = 6
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_token_bucket_waits_for_refill(monkeypatch):
+    from utils import rate_limiter
+
+    now = [0.0]
+    sleeps = []
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(rate_limiter.time, "sleep", sleeps.append)
+
+    bucket = rate_limiter.TokenBucket(capacity=2, period=2)
+    bucket.acquire()
+    bucket.acquire()
+    assert sleeps == []
+    bucket.acquire()
+    assert sleeps == [1.0]
+
+    # 서버가 알려준 남은 한도가 더 적으면 그 값을 따름
+    now[0] = 10
+    bucket.update(0)
+    assert bucket.available == 0
+
+
+def test_summary_request_syncs_rate_limit_headers(monkeypatch):
+    import agents.research_agent as research_agent_module
+    from utils.rate_limiter import TokenBucket
+
+    requests = TokenBucket(100, 60)
+    tokens = TokenBucket(100000, 60)
+    monkeypatch.setattr(research_agent_module, "_REQUEST_BUCKET", requests)
+    monkeypatch.setattr(research_agent_module, "_TOKEN_BUCKET", tokens)
+
+    parsed = object()
+
+    class _Raw:
+        headers = {"x-ratelimit-remaining-requests": "3", "x-ratelimit-remaining-tokens": "500"}
+
+        def parse(self):
+            return parsed
+
+    class _RawAPI:
+        def create(self, **kwargs):
+            return _Raw()
+
+    client = types.SimpleNamespace(
+        chat=types.SimpleNamespace(completions=types.SimpleNamespace(with_raw_response=_RawAPI()))
+    )
+    assert research_agent_module._create_summary_completion(client, "프롬프트") is parsed
+    assert requests.available <= 3.1
+    assert tokens.available <= 501
+
+
+def test_long_text_is_truncated_to_token_budget(monkeypatch):
+    import agents.research_agent as research_agent_module
+
+    monkeypatch.setattr(research_agent_module, "_token_encoder", lambda: None)
+    assert research_agent_module._count_tokens("abcd" * 10 + "가나다") == 13
+    assert research_agent_module._truncate_to_budget("짧은 글") == "짧은 글"
+
+    truncated = research_agent_module._truncate_to_budget("가" * 30, max_tokens=10)
+    assert truncated == "가" * 10 + "\n...[truncated]"
+
+
+def test_research_base_prompt_follows_prompt_changes(monkeypatch):
+    import agents.research_agent as research_agent_module
+    from agents.research_agent import ResearchAgent
+
+    prompts = {"research": "[BASE] 연구 프롬프트"}
+    monkeypatch.setattr(research_agent_module, "get_prompt_text", lambda key, default="": prompts.get(key, default))
+
+    agent = ResearchAgent()
+    persona = {"직책": "PM"}
+    assert agent._research_prompt_template({}) == "[BASE] 연구 프롬프트"
+    assert "[BASE] 연구 프롬프트" in agent._research_prompt_template({"persona": persona})
+
+    # 프롬프트 파일이 바뀌면 다음 호출부터 반영 (페르소나 템플릿 캐시는 프롬프트 텍스트로 구분)
+    prompts["research"] = "[EDITED] 연구 프롬프트"
+    assert agent._research_prompt_template({}) == "[EDITED] 연구 프롬프트"
+    assert "[EDITED] 연구 프롬프트" in agent._research_prompt_template({"persona": persona})
+
+
+def test_identical_concurrent_queries_share_one_summary():
+    import threading
+    from agents.research_agent import ResearchAgent
+
+    agent = ResearchAgent()
+    calls = []
+    release = threading.Event()
+
+    class _SlowSummarizer:
+        def summarize_text(self, text, prompt_template):
+            calls.append(text)
+            release.wait(5)
+            return {"status": "success", "summary": f"SUM({text})"}
+
+    agent.loaded_tools["summarization_tool"] = _SlowSummarizer()
+
+    # 비동기 배치: 같은 쿼리 두 개는 요약 한 번으로 처리
+    release.set()
+    tasks = [
+        {"type": "research", "task_id": "a", "content": "같은 쿼리"},
+        {"type": "research", "task_id": "b", "content": "같은  쿼리"},
+    ]
+    results = agent.process_tasks(tasks, max_concurrent_requests=2)
+    assert [r["task_id"] for r in results] == ["a", "b"]
+    assert all(r["result"]["summary"] == "SUM(같은 쿼리)" for r in results)
+    assert len(calls) == 1
+
+    # 동기 경로: 먼저 시작한 요청이 끝날 때까지 두 번째 스레드는 기다렸다가 결과를 공유
+    calls.clear()
+    release.clear()
+    agent.information_cache.clear()
+    results = {}
+
+    def _run(task_id):
+        results[task_id] = agent._process_research_task({"task_id": task_id, "content": "다른 쿼리"})
+
+    threads = [threading.Thread(target=_run, args=(task_id,)) for task_id in ("x", "y")]
+    threads[0].start()
+    while not calls:
+        threading.Event().wait(0.01)
+    threads[1].start()
+    threading.Event().wait(0.05)
+    release.set()
+    for t in threads:
+        t.join(5)
+    assert len(calls) == 1
+    assert results["x"]["result"] == results["y"]["result"]
+    assert results["y"]["task_id"] == "y"
+
+
+def test_oversized_query_is_rejected_without_summarizing(monkeypatch):
+    import agents.research_agent as research_agent_module
+    from agents.research_agent import ResearchAgent
+
+    monkeypatch.setattr(research_agent_module, "_MAX_QUERY_CHARS", 10)
+    agent = ResearchAgent()
+    calls = []
+    agent._loaded_tools = {
+        "summarization_tool": types.SimpleNamespace(summarize_text=lambda text, template=None: calls.append(text))
+    }
+
+    res = agent._process_research_task({"task_id": "t1", "content": "가" * 11})
+    assert res["status"] == "error"
+    assert res["error"] == "Query too long (11 chars); truncate or chunk."
+    assert calls == []
@@ -79,3 +79,205 @@ def test_voice_agent_stt_alias(monkeypatch):
     assert res.get("status") == "success"
     result = res["result"]
     assert result.get("text") == "TRANSCRIBED"
+
+
+def test_voice_tool_module_is_read_once(monkeypatch):
+    import agents.voice_agent as voice_agent_module
+    from agents.voice_agent import VoiceAgent
+
+    imports = []
+    real_import = voice_agent_module.importlib.import_module
+
+    def counting_import(name, *args, **kwargs):
+        imports.append(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(voice_agent_module.importlib, "import_module", counting_import)
+    monkeypatch.setattr(voice_agent_module, "_TOOL_CACHE", {})
+
+    first = VoiceAgent(tools=["voice_tool"])
+    second = VoiceAgent(tools=["voice_tool"])
+    assert imports == ["tools.voice_tool.core"]
+    assert "speak_text" in second.loaded_tools["voice_tool"]["functions"]
+    assert first.loaded_tools["voice_tool"] is not second.loaded_tools["voice_tool"]
+
+    # 모듈이 교체되면(다시 로드) 새 모듈에서 다시 읽음
+    _install_fake_voice_tool(monkeypatch)
+    VoiceAgent(tools=["voice_tool"])
+    assert imports == ["tools.voice_tool.core", "tools.voice_tool.core"]
+
+
+def test_voice_task_dispatch_handles_case_and_unknown_types():
+    from agents.voice_agent import VoiceAgent
+    from agents.agent_protocol import AgentMessage, MessageType
+
+    agent = VoiceAgent(tools=["voice_tool"])
+
+    def _request(task_type):
+        msg = AgentMessage(
+            type=MessageType.TASK_REQUEST.value,
+            content={"task_id": "t3", "task_data": {"type": task_type, "text": "hi"}},
+        )
+        return agent._handle_task_request(msg)
+
+    assert _request("TTS")["result"]["audio_data"].startswith(b"AUDIO(")
+    assert _request("text_to_speech")["status"] == "success"
+    assert _request("translate")["status"] != "success"
+
+
+def test_tts_preamble_follows_prompt_changes(monkeypatch):
+    import agents.voice_agent as voice_agent_module
+    from agents.voice_agent import VoiceAgent
+
+    preambles = {"voice_tts": "[TTS-PREAMBLE]"}
+    monkeypatch.setattr(voice_agent_module, "get_prompt_text", lambda key, default="": preambles.get(key, default))
+
+    agent = VoiceAgent(tools=["voice_tool"])
+    assert agent._do_tts({"text": "하나"}, {})["original_text"] == "[TTS-PREAMBLE]\n하나"
+    # 프롬프트 파일이 바뀌면 재시작 없이 다음 호출부터 반영
+    preambles["voice_tts"] = "[NEW-PREAMBLE]"
+    assert agent._do_tts({"text": "둘"}, {})["original_text"] == "[NEW-PREAMBLE]\n둘"
+
+
+def test_voice_tool_calls_are_rate_limited_adaptively(monkeypatch):
+    from agents.voice_agent import VoiceAgent
+    from agents.error_handler import APIRateLimitError
+    from utils import rate_limiter
+
+    monkeypatch.setattr(rate_limiter.time, "sleep", lambda seconds: None)
+    agent = VoiceAgent(tools=["voice_tool"])
+    bucket = agent._tts_bucket
+    base_rate = bucket.rate
+
+    def limited(**kwargs):
+        raise APIRateLimitError("too many requests", api_name="tts")
+
+    with pytest.raises(APIRateLimitError):
+        agent._call_limited(bucket, limited, text="x")
+    assert bucket.rate == base_rate / 2
+    assert bucket.available < 1
+
+    assert agent._call_limited(bucket, lambda **kwargs: b"ok", text="x") == b"ok"
+    assert base_rate / 2 < bucket.rate <= base_rate
+
+
+def test_tts_persona_context_is_built_once_per_persona(monkeypatch):
+    import agents.voice_agent as voice_agent_module
+    from agents.voice_agent import VoiceAgent
+
+    calls = []
+    real_build = voice_agent_module.build_persona_context
+
+    def counting_build(persona):
+        calls.append(persona)
+        return real_build(persona)
+
+    monkeypatch.setattr(voice_agent_module, "build_persona_context", counting_build)
+    voice_agent_module._persona_context_cached.cache_clear()
+
+    agent = VoiceAgent(tools=["voice_tool"])
+    persona = {"직책": "PM", "업무 영역": ["기획", "일정"]}
+    first = agent._do_tts({"text": "첫 번째"}, persona)
+    agent._do_tts({"text": "두 번째"}, dict(persona))
+    assert len(calls) == 1
+    assert first["original_text"].startswith("[페르소나 지침]\n")
+    assert "직책: PM" in first["original_text"]
+    voice_agent_module._persona_context_cached.cache_clear()
+
+
+def test_voice_tool_functions_are_indexed_flat():
+    from agents.voice_agent import VoiceAgent
+    from agents.error_handler import APIError
+
+    agent = VoiceAgent(tools=["voice_tool"])
+    assert set(agent._fn_index) == {"voice_tool.speak_text", "voice_tool.speech_to_text_from_mic_data"}
+    assert agent._text_to_speech("hi").startswith(b"AUDIO(hi)")
+
+    missing = VoiceAgent(tools=[])
+    with pytest.raises(APIError):
+        missing._speech_to_text(b"xxx")
+
+
+def test_tts_without_persona_passes_text_through(monkeypatch):
+    import agents.voice_agent as voice_agent_module
+    from agents.voice_agent import VoiceAgent
+
+    monkeypatch.setattr(voice_agent_module, "get_prompt_text", lambda key, default="": "")
+    agent = VoiceAgent(tools=["voice_tool"])
+    assert agent._do_tts({"text": "그대로"}, None)["original_text"] == "그대로"
+    assert "persona" not in agent._do_stt({"audio_data": b"xx"}, None)
+
+
+def test_async_tts_retries_without_blocking_the_loop(monkeypatch):
+    import asyncio
+    from agents import error_handler
+    from agents.voice_agent import VoiceAgent
+
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(error_handler.asyncio, "sleep", fake_sleep)
+    agent = VoiceAgent(tools=["voice_tool"])
+    attempts = []
+
+    def flaky_speak(text="", detailed_text="", speed=1.0):
+        attempts.append(text)
+        return b"" if len(attempts) == 1 else b"AUDIO"
+
+    agent._fn_index["voice_tool.speak_text"] = flaky_speak
+
+    async def run():
+        return await asyncio.gather(agent._tts_async("hi"), agent._stt_async(b"xx"))
+
+    audio, transcript = asyncio.run(run())
+    assert audio == b"AUDIO"
+    assert transcript["text"] == "TRANSCRIBED"
+    assert len(attempts) == 2 and len(sleeps) == 1
+
+
+def test_openai_rate_limit_from_voice_tool_throttles_bucket(monkeypatch):
+    from agents.voice_agent import VoiceAgent
+    from agents.error_handler import APIRateLimitError
+    from utils import rate_limiter
+
+    class RateLimitError(Exception):
+        def __init__(self, message):
+            super().__init__(message)
+            self.response = types.SimpleNamespace(headers={"retry-after": "3"})
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(RateLimitError=RateLimitError))
+    monkeypatch.setattr(rate_limiter.time, "sleep", lambda seconds: None)
+    agent = VoiceAgent(tools=["voice_tool"])
+    bucket = agent._stt_bucket
+    base_rate = bucket.rate
+
+    def rate_limited_stt(audio_data):
+        # 실제 voice_tool은 다른 오류는 삼키고 RateLimitError만 그대로 올려 보냄
+        raise RateLimitError("429 Too Many Requests")
+
+    with pytest.raises(APIRateLimitError) as excinfo:
+        agent._call_limited(bucket, rate_limited_stt, b"xx")
+    assert excinfo.value.retry_after == 3.0
+    assert isinstance(excinfo.value.__cause__, RateLimitError)
+    assert bucket.rate == base_rate / 2
+
+    def broken_stt(audio_data):
+        raise ValueError("bad audio")
+
+    # 속도 제한이 아닌 오류는 그대로 전달하고 버킷 속도는 건드리지 않음
+    with pytest.raises(ValueError):
+        agent._call_limited(bucket, broken_stt, b"xx")
+    assert bucket.rate == base_rate / 2
+
+
+def test_invalid_voice_rate_env_falls_back_to_defaults(monkeypatch):
+    from agents.voice_agent import VoiceAgent
+
+    monkeypatch.setenv("VOICE_TTS_QPS", "0")
+    monkeypatch.setenv("VOICE_STT_QPS", "-1")
+    monkeypatch.setenv("VOICE_STT_BURST", "many")
+    agent = VoiceAgent(tools=["voice_tool"])
+    default = VoiceAgent._voice_bucket("VOICE_DEFAULT_FOR_TEST")
+    assert agent._tts_bucket.rate == agent._stt_bucket.rate == default.rate
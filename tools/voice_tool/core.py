@@ -11,6 +11,7 @@ OpenAI의 TTS API와 Whisper API를 활용하여 구현되었습니다.
 
 import sys
 import os
+import functools
 import logging
 import traceback
 import openai
@@ -56,6 +57,12 @@ from .utils import validate_speed, prepare_audio_file_from_mic_data
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=1)
+def _client() -> OpenAI:
+    """TTS/STT 호출에 함께 쓰는 OpenAI 클라이언트 (HTTP 연결 풀을 호출 사이에 재사용)"""
+    return OpenAI()
+
 # --- LLM이 사용할 도구 명세 (TOOL_SCHEMAS) ---
 TOOL_SCHEMAS = [
     {
@@ -101,7 +108,8 @@ def speak_text(text: str, detailed_text: str = "", speed: float = DEFAULT_SPEED)
         Optional[bytes]: 생성된 오디오 데이터의 바이트, 오류 시 None.
     
     Raises:
-        Exception: OpenAI API 호출 중 발생한 예외는 내부적으로 처리되고 로그에 기록됨.
+        openai.RateLimitError: 속도 제한 응답은 호출 측이 호출 속도를 줄일 수 있도록 그대로 전달됨.
+                               그 밖의 예외는 내부적으로 처리되고 로그에 기록됨.
     """
     logger.info(LOG_TTS_START.format(text))
     
@@ -113,8 +121,8 @@ def speak_text(text: str, detailed_text: str = "", speed: float = DEFAULT_SPEED)
     validated_speed = validate_speed(speed)
     
     try:
-        # OpenAI 클라이언트 초기화 - 함수 내부에서 호출할 때마다 생성
-        client = OpenAI()
+        # OpenAI 클라이언트 (첫 호출 때 한 번만 생성)
+        client = _client()
         
         response = client.audio.speech.create(
             model=DEFAULT_TTS_MODEL,
@@ -127,6 +135,9 @@ def speak_text(text: str, detailed_text: str = "", speed: float = DEFAULT_SPEED)
         
         # 내부적으로는 성공 상태를 기록하지만, 외부로는 기존 호환성을 위해 바이트 반환
         return audio_bytes
+    except openai.RateLimitError as e:
+        logger.warning(LOG_TTS_ERROR.format(str(e)))
+        raise
     except Exception as e:
         error_msg = LOG_TTS_ERROR.format(str(e))
         logger.error(f"{error_msg}\n{traceback.format_exc()}")
@@ -189,7 +200,8 @@ def speech_to_text_from_mic_data(audio_data: sr.AudioData) -> Dict[str, Any]:
         Dict[str, Any]: 상태와 변환된 텍스트 또는 오류 메시지를 포함하는 딕셔너리.
     
     Raises:
-        Exception: OpenAI API 호출 중 발생한 예외는 내부적으로 처리되고 로그에 기록됨.
+        openai.RateLimitError: 속도 제한 응답은 호출 측이 호출 속도를 줄일 수 있도록 그대로 전달됨.
+                               그 밖의 예외는 내부적으로 처리되고 로그에 기록됨.
     """
     # 오디오 데이터 검증
     audio_file = prepare_audio_file_from_mic_data(audio_data)
@@ -197,8 +209,8 @@ def speech_to_text_from_mic_data(audio_data: sr.AudioData) -> Dict[str, Any]:
         return {"status": STATUS_ERROR, "message": LOG_STT_ERROR_INVALID}
 
     try:
-        # OpenAI 클라이언트 초기화 - 함수 내부에서 호출할 때마다 생성
-        client = OpenAI()
+        # OpenAI 클라이언트 (첫 호출 때 한 번만 생성)
+        client = _client()
         
         # Whisper API 호출
         transcription = client.audio.transcriptions.create(
@@ -214,6 +226,9 @@ def speech_to_text_from_mic_data(audio_data: sr.AudioData) -> Dict[str, Any]:
             "status": STATUS_SUCCESS,
             "text": result_text
         }
+    except openai.RateLimitError as e:
+        logger.warning(LOG_STT_ERROR.format(str(e)))
+        raise
     except Exception as e:
         error_msg = LOG_STT_ERROR.format(str(e))
         logger.error(f"{error_msg}\n{traceback.format_exc()}")
@@ -7,6 +7,9 @@ Streamlit UI 공용 헬퍼와 세션 상태 초기화 유틸
 from __future__ import annotations
 import os
 import base64
+import functools
+import hashlib
+import inspect
 import streamlit as st
 from typing import Any, Dict, List, Optional
 
@@ -60,11 +63,60 @@ def init_session_state() -> None:
         st.session_state.active_feature = None
 
 
+def get_conversation_history() -> List[Dict[str, Any]]:
+    """
+    세션 메시지에서 LLM에 넘길 user/assistant 대화 이력 반환.
+
+    지난 호출 이후 추가된 메시지만 변환해 세션에 둔 이력 목록에 덧붙인다.
+    메시지 목록이 새로 만들어졌거나 줄어든 경우(대화 초기화)에는 처음부터 다시 만든다.
+    음성 응답은 상세 텍스트(detailed_text)를 내용으로 사용한다.
+    """
+    messages = st.session_state.get("messages", [])
+    history = st.session_state.get("_conv_history")
+    consumed = st.session_state.get("_conv_history_len", 0)
+    if history is None or st.session_state.get("_conv_history_src") is not messages or consumed > len(messages):
+        history, consumed = [], 0
+    for msg in messages[consumed:]:
+        if msg["role"] in ["user", "assistant"]:
+            if "voice_text" in msg and "detailed_text" in msg:
+                history.append({"role": msg["role"], "content": msg["detailed_text"]})
+            elif "content" in msg:
+                history.append({"role": msg["role"], "content": msg["content"]})
+    st.session_state["_conv_history"] = history
+    st.session_state["_conv_history_src"] = messages
+    st.session_state["_conv_history_len"] = len(messages)
+    return history
+
+
+@functools.lru_cache(maxsize=1)
+def _audio_autoplay_supported() -> bool:
+    """st.audio가 autoplay 인자를 지원하는지 여부 (Streamlit 1.35 이상)."""
+    try:
+        return "autoplay" in inspect.signature(st.audio).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _audio_base64(digest: str, _audio_bytes: bytes) -> str:
+    """오디오 base64 문자열 (같은 오디오는 digest로 찾아 한 번만 인코딩)."""
+    return base64.b64encode(_audio_bytes).decode()
+
+
 def play_audio_autoplay_hidden(audio_bytes: bytes) -> None:
-    """브라우저에서 숨김 자동재생 오디오 출력."""
+    """
+    브라우저에서 오디오 자동재생.
+
+    st.audio가 autoplay를 지원하면 오디오를 Streamlit 미디어 파일로 전달한다
+    (이 경우 작은 플레이어가 표시됨). 구버전에서는 숨김 <audio> 태그에 data URI로 넣는다.
+    """
     if not audio_bytes:
         return
-    audio_base64 = base64.b64encode(audio_bytes).decode()
+    if _audio_autoplay_supported():
+        st.audio(audio_bytes, format="audio/mp3", autoplay=True)
+        return
+    digest = hashlib.blake2b(audio_bytes, digest_size=8).hexdigest()
+    audio_base64 = _audio_base64(digest, audio_bytes)
     audio_html = f"""
         <audio autoplay style="display:none">
             <source src="data:audio/mp3;base64,{audio_base64}" type="audio/mpeg">
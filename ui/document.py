@@ -24,6 +24,20 @@ def _lazy_imports():
     return personas, DOCUMENT_TEMPLATES, TEMPLATE_LABELS, execute_create_new_planning_document, execute_collaboration_planning, execute_expand_notion_document
 
 
+def _persona_selector():
+    """
+    PersonaSelectorAgent 인스턴스 (재실행마다 색인/순위 캐시를 새로 만들지 않도록 세션마다 하나를 재사용)
+    
+    에이전트의 대화 기록/메모리가 사용자 사이에 섞이지 않도록 세션끼리 공유하지 않는다.
+    """
+    selector = st.session_state.get("_persona_selector_agent")
+    if selector is None:
+        from agents.persona_selector_agent import PersonaSelectorAgent  # type: ignore
+        selector = PersonaSelectorAgent()
+        st.session_state["_persona_selector_agent"] = selector
+    return selector
+
+
 def render_document_ui() -> None:
     if st is None:
         return
@@ -45,8 +59,7 @@ def render_document_ui() -> None:
             return str(key)
     # 자동 기본값 선정을 위한 에이전트는 지연 임포트
     try:
-        from agents.persona_selector_agent import PersonaSelectorAgent  # type: ignore
-        _selector = PersonaSelectorAgent()
+        _selector = _persona_selector()
     except Exception:
         _selector = None  # 선택 실패 시에도 UI는 동작해야 함
 
@@ -24,7 +24,6 @@ def _lazy_imports():
         get_email_details,
         get_email_summary_on,
     )  # type: ignore
-    from agents.email_agent import EmailAgent  # type: ignore
     from agents.agent_protocol import MessageType, AgentMessage  # type: ignore
 
     return (
@@ -37,12 +36,25 @@ def _lazy_imports():
         get_daily_email_summary,
         get_email_details,
         get_email_summary_on,
-        EmailAgent,
         MessageType,
         AgentMessage,
     )
 
 
+def _email_agent():
+    """
+    EmailAgent 인스턴스 (세션마다 하나를 만들어 재실행 사이에 재사용)
+    
+    대화 기록/메모리와 지연 도구 로딩 상태를 인스턴스에 두므로 세션끼리 공유하지 않는다.
+    """
+    agent = st.session_state.get("_email_agent")
+    if agent is None:
+        from agents.email_agent import EmailAgent  # type: ignore
+        agent = EmailAgent()
+        st.session_state["_email_agent"] = agent
+    return agent
+
+
 def render_email_ui() -> None:
     if st is None:
         return
@@ -57,7 +69,6 @@ def render_email_ui() -> None:
         get_daily_email_summary,
         get_email_details,
         get_email_summary_on,
-        EmailAgent,
         MessageType,
         AgentMessage,
     ) = _lazy_imports()
@@ -81,7 +92,7 @@ def render_email_ui() -> None:
         real_emails = []
     st.session_state["current_process"] = None
 
-    mail_analysis_agent = EmailAgent()
+    mail_analysis_agent = _email_agent()
 
     def analyze_mail_with_agent(mail: Dict[str, Any]) -> Dict[str, str]:
         try:
@@ -242,7 +253,7 @@ def render_email_ui() -> None:
     tab_labels = [task["name"] for task in email_tasks]
     tabs = st.tabs(tab_labels)
 
-    email_agent = EmailAgent()
+    email_agent = _email_agent()
 
     for idx, tab in enumerate(tabs):
         with tab:
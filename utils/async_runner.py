@@ -0,0 +1,23 @@
+# utils/async_runner.py
+# -*- coding: utf-8 -*-
+"""
+동기 코드에서 코루틴을 실행하는 도우미.
+
+asyncio.run()은 이미 이벤트 루프가 돌고 있는 스레드에서 호출하면 RuntimeError를 내므로,
+그런 경우에는 별도 스레드의 새 루프에서 실행하고 결과를 기다린다.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+
+def run_coroutine_sync(coro):
+    """
+    동기 핸들러에서 코루틴을 실행합니다.
+    이미 이벤트 루프가 실행 중이면 별도 스레드의 새 루프에서 실행합니다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
@@ -0,0 +1,131 @@
+# utils/lru_cache.py
+# -*- coding: utf-8 -*-
+"""
+크기 제한이 있는 LRU 캐시.
+
+dict처럼 `key in cache`, `cache[key]`, `cache[key] = value`, `cache.get(key)`로 사용하며,
+maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 버린다.
+get() 조회 결과는 functools.lru_cache의 cache_info()와 같은 형태로 집계한다.
+TTLCache는 여기에 항목별 만료 시간을 더한 버전이다.
+"""
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from typing import Any, Hashable, Iterator, Optional
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class LRUCache:
+    """
+    스레드 안전한 LRU 캐시.
+
+    Args:
+        maxsize: 보관할 최대 항목 수 (1 이상)
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._data))
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._data[key]
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            del self._data[key]
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """항목 조회 (적중 시 최근 사용으로 갱신하고 적중/실패 횟수를 집계)"""
+        with self._lock:
+            if key in self._data:
+                self._hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self._misses += 1
+            return default
+
+    def clear(self) -> None:
+        """모든 항목과 적중/실패 통계 초기화"""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """(hits, misses, maxsize, currsize) 통계 반환"""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._data))
+
+
+class TTLCache(LRUCache):
+    """
+    항목마다 만료 시간이 있는 LRU 캐시 (만료된 항목은 없는 것으로 취급)
+
+    Args:
+        maxsize: 보관할 최대 항목 수 (1 이상)
+        ttl: 기본 보관 시간(초)
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0) -> None:
+        super().__init__(maxsize)
+        self.ttl = ttl
+
+    def _expired(self, key: Hashable) -> bool:
+        """만료된 항목이면 지우고 True (호출 측에서 잠금을 잡고 있어야 함)"""
+        if self._data[key][1] > time.monotonic():
+            return False
+        del self._data[key]
+        return True
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data and not self._expired(key)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            if self._expired(key):
+                raise KeyError(key)
+            self._data.move_to_end(key)
+            return self._data[key][0]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """항목 저장 (ttl을 지정하지 않으면 기본 보관 시간 사용)"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        LRUCache.__setitem__(self, key, (value, expires_at))
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """만료되지 않은 항목 조회 (적중 시 최근 사용으로 갱신하고 적중/실패 횟수를 집계)"""
+        with self._lock:
+            if key in self._data and not self._expired(key):
+                self._hits += 1
+                self._data.move_to_end(key)
+                return self._data[key][0]
+            self._misses += 1
+            return default
@@ -0,0 +1,95 @@
+# utils/rate_limiter.py
+# -*- coding: utf-8 -*-
+"""
+토큰 버킷 기반 클라이언트 측 속도 제한기.
+
+capacity만큼의 토큰이 period초에 걸쳐 일정하게 다시 채워지며,
+acquire(n)는 n개를 쓸 수 있을 때까지 기다린다 (비동기 코드에서는 acquire_async).
+서버가 알려준 남은 한도는 update()로 반영해 버킷이 실제보다 많이 남았다고 보지 않게 한다.
+속도 제한 응답을 받으면 throttle()로 보충 속도를 줄이고, 성공할 때마다 recover()로 조금씩
+원래 속도까지 되돌린다 (곱셈 감소/덧셈 증가).
+"""
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    스레드 안전한 토큰 버킷.
+
+    먼저 요청한 호출이 토큰을 예약하고 부족분만큼 기다리므로, 동시에 들어온 요청은
+    도착 순서대로 간격을 두고 통과한다.
+
+    Args:
+        capacity: 버킷 최대 토큰 수 (period 동안 허용할 양)
+        period: 버킷이 비었다가 가득 차기까지 걸리는 시간(초)
+    """
+
+    def __init__(self, capacity: float, period: float = 60.0) -> None:
+        if capacity <= 0 or period <= 0:
+            raise ValueError("capacity and period must be positive")
+        self.capacity = float(capacity)
+        self.rate = self.base_rate = self.capacity / period
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """경과 시간만큼 토큰 보충 (호출 측에서 잠금을 잡고 있어야 함)"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _reserve(self, amount: float) -> float:
+        """토큰을 예약하고 기다려야 할 시간(초) 반환"""
+        with self._lock:
+            self._refill()
+            # 버킷보다 큰 요청도 언젠가는 통과하도록 capacity로 제한
+            self._tokens -= min(amount, self.capacity)
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, amount: float = 1) -> None:
+        """토큰 amount개를 쓸 수 있을 때까지 대기"""
+        wait = self._reserve(amount)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, amount: float = 1) -> None:
+        """acquire의 비동기 버전 (이벤트 루프를 막지 않고 대기)"""
+        wait = self._reserve(amount)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def update(self, remaining: float) -> None:
+        """서버가 알려준 남은 한도 반영 (버킷이 서버보다 많이 남았다고 보는 경우에만 낮춤)"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, float(remaining))
+
+    def throttle(self, factor: float = 0.5, min_fraction: float = 0.05) -> None:
+        """
+        속도 제한을 받았을 때 호출: 남은 토큰을 비우고 보충 속도를 factor배로 줄임
+        
+        Args:
+            factor: 보충 속도에 곱할 비율
+            min_fraction: 원래 속도 대비 최소 속도 비율
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0)
+            self.rate = max(self.base_rate * min_fraction, self.rate * factor)
+
+    def recover(self, step_fraction: float = 0.1) -> None:
+        """요청이 성공했을 때 호출: 보충 속도를 원래 속도의 step_fraction만큼 되돌림"""
+        with self._lock:
+            if self.rate < self.base_rate:
+                self._refill()
+                self.rate = min(self.base_rate, self.rate + self.base_rate * step_fraction)
+
+    @property
+    def available(self) -> float:
+        """지금 바로 쓸 수 있는 토큰 수"""
+        with self._lock:
+            self._refill()
+            return max(0.0, self._tokens)